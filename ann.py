@@ -0,0 +1,150 @@
+"""
+Index approximate nearest neighbour (ANN) lokal untuk katalog webtoon yang besar.
+
+Vektor TF-IDF direduksi dengan TruncatedSVD, dinormalisasi L2, lalu dikelompokkan
+dengan spherical k-means menjadi `n_lists` inverted list (IVF). Query hanya menilai
+item pada `n_probe` list yang centroid-nya paling mirip, sehingga biaya per query
+tidak lagi linear terhadap ukuran katalog. `n_probe` adalah tombol recall/latency:
+semakin besar, semakin tinggi recall dan semakin lambat query.
+
+Di WebtoonRecommender index ini hanya fallback untuk k yang lebih lebar dari tabel
+tetangga: query dengan k <= neighbor_k dibaca dari tabel tetangga eksak yang selalu
+dibangun saat fit (lebih cepat dari ANN), sedangkan query berfilter, hybrid, MMR dan
+batch neighbors() selalu memakai jalur eksak.
+"""
+import numpy as np
+import scipy.sparse as sp
+from sklearn.decomposition import TruncatedSVD
+from sklearn.preprocessing import normalize
+
+from ranking import top_k
+
+
+def spherical_kmeans(vectors, n_clusters, n_iter=10, random_state=0):
+    """
+    Spherical k-means sederhana (NumPy) untuk vektor yang sudah ternormalisasi L2.
+
+    Parameters:
+    vectors (numpy.ndarray): Matriks N×d ternormalisasi L2
+    n_clusters (int): Jumlah cluster
+    n_iter (int): Jumlah iterasi
+    random_state (int): Seed untuk inisialisasi centroid
+
+    Returns:
+    numpy.ndarray: Centroid berukuran n_clusters×d, ternormalisasi L2
+    """
+    rng = np.random.default_rng(random_state)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+
+    for _ in range(n_iter):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        membership = sp.csr_matrix(
+            (np.ones(len(vectors), dtype=vectors.dtype), (assignments, np.arange(len(vectors)))),
+            shape=(n_clusters, len(vectors)))
+        sums = np.asarray(membership @ vectors)
+
+        # Cluster kosong diisi ulang dengan titik acak
+        empty = np.flatnonzero(np.asarray(membership.sum(axis=1)).ravel() == 0)
+        sums[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+        centroids = normalize(sums).astype(vectors.dtype)
+
+    return centroids
+
+
+class IVFIndex:
+    """
+    Index ANN berbasis TruncatedSVD + inverted file (IVF).
+
+    Parameters:
+    n_components (int): Dimensi hasil reduksi TruncatedSVD
+    n_lists (int, optional): Jumlah inverted list; default sqrt(N)
+    n_probe (int): Jumlah list yang diperiksa per query (tombol recall/latency)
+    rerank (bool): Jika True, kandidat dinilai ulang dengan cosine TF-IDF yang eksak
+    train_size (int): Jumlah baris sampel untuk melatih SVD dan k-means
+    random_state (int): Seed untuk SVD dan k-means
+    """
+
+    def __init__(self, n_components=64, n_lists=None, n_probe=8, rerank=True, train_size=100000,
+                 random_state=0):
+        self.n_components = n_components
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.rerank = rerank
+        self.train_size = train_size
+        self.random_state = random_state
+
+    def fit(self, tfidf_matrix, block_size=65536):
+        """
+        Latih SVD dan centroid, lalu susun seluruh item ke dalam inverted list.
+
+        Parameters:
+        tfidf_matrix (scipy.sparse.csr_matrix): Matriks TF-IDF ternormalisasi L2
+        block_size (int): Jumlah baris per blok saat memproyeksikan dan meng-assign item
+
+        Returns:
+        IVFIndex: Objek ini sendiri
+        """
+        n_items = tfidf_matrix.shape[0]
+        rng = np.random.default_rng(self.random_state)
+        train_rows = np.sort(rng.choice(n_items, min(self.train_size, n_items), replace=False))
+        train = tfidf_matrix[train_rows]
+
+        n_components = min(self.n_components, tfidf_matrix.shape[1] - 1, len(train_rows) - 1)
+        self.svd = TruncatedSVD(n_components=n_components, random_state=self.random_state).fit(train)
+        self.components = np.ascontiguousarray(self.svd.components_.T)
+        n_lists = self.n_lists or max(1, int(np.sqrt(n_items)))
+        self.centroids = spherical_kmeans(self._project(train), n_lists, random_state=self.random_state)
+
+        vectors = np.empty((n_items, n_components), dtype=np.float32)
+        assignments = np.empty(n_items, dtype=np.int64)
+        for start in range(0, n_items, block_size):
+            block = self._project(tfidf_matrix[start:start + block_size])
+            vectors[start:start + len(block)] = block
+            assignments[start:start + len(block)] = np.argmax(block @ self.centroids.T, axis=1)
+
+        # Item disusun berurutan per list agar satu list = satu potongan array kontigu
+        order = np.argsort(assignments, kind='stable')
+        self.item_ids = order
+        self.vectors = vectors[order]
+        self.list_offsets = np.searchsorted(assignments[order], np.arange(n_lists + 1))
+        self.tfidf_matrix = tfidf_matrix
+        return self
+
+    def _project(self, matrix):
+        # Sama dengan normalize(svd.transform(...)), tanpa overhead validasi sklearn per query
+        projected = np.asarray(matrix @ self.components, dtype=np.float32)
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        return projected / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def query(self, query_vector, k, n_probe=None, exclude=None):
+        """
+        Cari k item paling mirip dengan sebuah vektor TF-IDF.
+
+        Parameters:
+        query_vector (scipy.sparse matrix): Satu baris TF-IDF (1×V)
+        k (int): Jumlah item yang dikembalikan
+        n_probe (int, optional): Override n_probe untuk query ini
+        exclude (int, optional): Index item yang dikeluarkan, misalnya webtoon acuan itu sendiri
+
+        Returns:
+        tuple: (item_indices, scores) terurut dari skor tertinggi
+        """
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        projected = self._project(query_vector)[0]
+        lists, _ = top_k(self.centroids @ projected, n_probe)
+
+        starts, stops = self.list_offsets[lists], self.list_offsets[lists + 1]
+        positions = np.concatenate([np.arange(start, stop) for start, stop in zip(starts, stops)])
+        candidates = self.item_ids[positions]
+
+        if self.rerank:
+            query = query_vector.toarray() if sp.issparse(query_vector) else np.asarray(query_vector)
+            scores = self.tfidf_matrix[candidates] @ query.ravel()
+        else:
+            scores = self.vectors[positions] @ projected
+        if exclude is not None:
+            scores[candidates == exclude] = -np.inf
+
+        top, top_scores = top_k(scores, k)
+        keep = np.isfinite(top_scores)
+        return candidates[top[keep]], top_scores[keep]
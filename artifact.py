@@ -0,0 +1,136 @@
+"""
+Format artifact model rekomendasi yang disimpan ke disk.
+
+Satu artifact adalah sebuah direktori berisi:
+    header.json            Versi format, ukuran, presisi, checksum dataset sumber, fingerprint
+                           embedding, bobot field dan penanda katalog streaming
+    vocabulary.json        Daftar term TF-IDF terurut berdasarkan index kolom; dengan bobot
+                           field, setiap term diberi awalan nama field ('Genre:action')
+    catalog.csv            Kolom katalog webtoon (tanpa kolom teks turunan)
+    idf.npy                Bobot IDF per term
+    tfidf_data.npy         Matriks TF-IDF CSR: nilai (dtype mengikuti presisi)
+    tfidf_indices.npy      Matriks TF-IDF CSR: index kolom
+    tfidf_indptr.npy       Matriks TF-IDF CSR: pointer baris
+    neighbor_indices.npy   Tabel index tetangga top-k
+    neighbor_scores.npy    Tabel skor tetangga top-k (float atau int8 terkuantisasi)
+    embeddings.npy         Opsional: vektor embedding float32 per item (lihat embeddings.py)
+
+Array besar dibaca dengan np.load(mmap_mode='r') sehingga banyak proses worker
+di satu host berbagi page cache yang sama tanpa menyalin data.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ARTIFACT_FORMAT = 'webtoon-recommender'
+# Versi 2: presisi dan skor terkuantisasi, embeddings.npy opsional, bobot field dengan
+# kosakata 'Field:term', serta kunci streaming di header
+ARTIFACT_VERSION = 2
+
+ARRAY_NAMES = [
+    'idf',
+    'tfidf_data',
+    'tfidf_indices',
+    'tfidf_indptr',
+    'neighbor_indices',
+    'neighbor_scores',
+]
+
+# Array yang hanya disimpan jika ada; header.json mencatat array mana yang tersimpan
+OPTIONAL_ARRAY_NAMES = ['embeddings']
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """
+    Hitung checksum SHA-256 sebuah file secara bertahap.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_artifact(path, header, vocabulary, catalog, arrays):
+    """
+    Simpan state model ke direktori artifact.
+
+    Parameters:
+    path (str atau Path): Direktori tujuan (dibuat jika belum ada)
+    header (dict): Metadata tambahan yang disimpan di header.json
+    vocabulary (list): Term TF-IDF terurut berdasarkan index kolom
+    catalog (pandas.DataFrame): Kolom katalog webtoon
+    arrays (dict): Array NumPy dengan nama sesuai ARRAY_NAMES (dan OPTIONAL_ARRAY_NAMES)
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    # Menimpa artifact lama: header lama dihapus lebih dulu agar artifact setengah tertimpa tidak bisa
+    # dimuat, begitu juga array opsional yang tidak ikut disimpan kali ini
+    (path / 'header.json').unlink(missing_ok=True)
+
+    names = ARRAY_NAMES + [name for name in OPTIONAL_ARRAY_NAMES if arrays.get(name) is not None]
+    for name in OPTIONAL_ARRAY_NAMES:
+        if name not in names:
+            (path / f'{name}.npy').unlink(missing_ok=True)
+    for name in names:
+        np.save(path / f'{name}.npy', np.ascontiguousarray(arrays[name]))
+    with open(path / 'vocabulary.json', 'w', encoding='utf-8') as f:
+        json.dump(list(vocabulary), f, ensure_ascii=False)
+    catalog.to_csv(path / 'catalog.csv', index=False)
+
+    # Header ditulis terakhir, sehingga artifact yang gagal disimpan tidak bisa dimuat
+    header = dict(header, format=ARTIFACT_FORMAT, version=ARTIFACT_VERSION)
+    header['arrays'] = {name: {'shape': list(np.shape(arrays[name])), 'dtype': str(np.asarray(arrays[name]).dtype)}
+                        for name in names}
+    with open(path / 'header.json', 'w', encoding='utf-8') as f:
+        json.dump(header, f, indent=2)
+
+
+def read_header(path):
+    """
+    Baca dan validasi header artifact.
+
+    Raises:
+    ValueError: Jika format atau versi artifact tidak cocok dengan kode saat ini
+    """
+    with open(Path(path) / 'header.json', encoding='utf-8') as f:
+        header = json.load(f)
+    if header.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"'{path}' bukan artifact {ARTIFACT_FORMAT}.")
+    if header.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f"Artifact '{path}' memakai versi format {header.get('version')}, "
+                         f"sedangkan kode ini membutuhkan versi {ARTIFACT_VERSION}. "
+                         "Bangun ulang model dengan fit() lalu save().")
+    return header
+
+
+def load_artifact(path, mmap_mode='r', source_path=None):
+    """
+    Muat direktori artifact.
+
+    Parameters:
+    path (str atau Path): Direktori artifact
+    mmap_mode (str, optional): Mode memory-map untuk np.load; None untuk membaca ke memori
+    source_path (str atau Path, optional): Dataset sumber; jika diberikan, checksum-nya harus
+                                           sama dengan yang tercatat di header
+
+    Returns:
+    tuple: (header, vocabulary, catalog, arrays)
+
+    Raises:
+    ValueError: Jika artifact usang (versi format berbeda atau dataset sumber berubah)
+    """
+    path = Path(path)
+    header = read_header(path)
+    if source_path is not None and header.get('source_sha256') != file_sha256(source_path):
+        raise ValueError(f"Artifact '{path}' dibangun dari dataset yang berbeda dengan '{source_path}'.")
+
+    names = ARRAY_NAMES + [name for name in OPTIONAL_ARRAY_NAMES if name in header['arrays']]
+    arrays = {name: np.load(path / f'{name}.npy', mmap_mode=mmap_mode) for name in names}
+    with open(path / 'vocabulary.json', encoding='utf-8') as f:
+        vocabulary = json.load(f)
+    catalog = pd.read_csv(path / 'catalog.csv', keep_default_na=False, na_values=[''])
+    return header, vocabulary, catalog, arrays
@@ -0,0 +1,91 @@
+"""
+Agregat katalog per kelompok: groupby pandas (jalur lama recommendation.py) dibandingkan
+dengan CatalogStats (catalog_stats.py) pada katalog sintetis.
+
+Yang diukur:
+    build         groupby mean/count untuk Genre, Writer dan Update vs membangun CatalogStats
+    summary       summary() per kolom dari index yang sudah dibangun
+    writer_style  map genre per penulis (groupby join) vs writer_style() untuk banyak penulis
+    members       df[df['Writer'] == w] vs members('Writer', w) per penulis (us/panggilan)
+    add           menambah baris baru incremental vs membangun ulang CatalogStats
+
+Cara menjalankan:
+    python benchmarks/bench_catalog_stats.py --rows 100000 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from catalog_stats import CatalogStats  # noqa: E402
+from ingest import COUNT_COLUMNS, parse_counts  # noqa: E402
+from synthetic import synthetic_dataset  # noqa: E402
+
+GROUPBY_COLUMNS = ['Genre', 'Writer', 'Update']
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def groupby_summaries(df):
+    return {column: df.groupby(column).agg({'Likes_Numeric': 'mean', 'Subscribers_Numeric': 'mean',
+                                            'Rating': 'mean', 'id': 'count'})
+            for column in GROUPBY_COLUMNS}
+
+
+def run(n_rows, args):
+    df = synthetic_dataset(n_rows, seed=args.seed, n_writers=max(n_rows // 5, 1))
+    for column, numeric_column in COUNT_COLUMNS.items():
+        df[numeric_column], _ = parse_counts(df[column])
+
+    groupby_s, expected = timed(lambda: groupby_summaries(df))
+    build_s, stats = timed(lambda: CatalogStats(df))
+    summary_s, summaries = timed(lambda: {column: stats.summary(column) for column in GROUPBY_COLUMNS})
+    for column in GROUPBY_COLUMNS:
+        assert np.allclose(summaries[column].to_numpy(), expected[column].to_numpy(), equal_nan=True)
+
+    rng = np.random.default_rng(args.seed)
+    writers = rng.choice(stats.groups['Writer'].labels, size=args.lookups)
+    mapping_s, mapping = timed(lambda: df.groupby('Writer')['Genre'].agg(lambda x: ' '.join(x.dropna())))
+    style_s, _ = timed(lambda: [stats.writer_style(writer) for writer in writers])
+    assert all(stats.writer_style(writer) == mapping[writer] for writer in writers[:100])
+
+    lookups = writers[:max(args.lookups // 100, 1)]
+    mask_s, _ = timed(lambda: [np.flatnonzero(df['Writer'].to_numpy() == writer) for writer in lookups])
+    members_s, _ = timed(lambda: [stats.members('Writer', writer) for writer in writers])
+
+    new = synthetic_dataset(args.add, seed=args.seed + 1, n_writers=max(n_rows // 5, 1))
+    add_s, _ = timed(lambda: stats.add(new))
+    grown = pd.concat([df, new], ignore_index=True)
+    rebuild_s, _ = timed(lambda: CatalogStats(grown))
+
+    print(f"\nN={n_rows} ({len(stats.groups['Writer'])} penulis)")
+    print(f"{'tahap':<14} {'pandas':>12} {'CatalogStats':>14}")
+    print(f"{'build (s)':<14} {groupby_s:>12.4f} {build_s:>14.4f}")
+    print(f"{'summary (s)':<14} {'':>12} {summary_s:>14.4f}")
+    print(f"{'writer_style':<14} {mapping_s:>11.4f}s {style_s:>13.4f}s  ({args.lookups} penulis)")
+    print(f"{'members (us)':<14} {mask_s / len(lookups) * 1e6:>12.1f} {members_s / len(writers) * 1e6:>14.1f}")
+    print(f"{'add (s)':<14} {rebuild_s:>12.4f} {add_s:>14.4f}  ({args.add} baris, rebuild vs incremental)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000])
+    parser.add_argument('--lookups', type=int, default=10000, help='Jumlah penulis acak yang di-query')
+    parser.add_argument('--add', type=int, default=100, help='Jumlah baris yang ditambahkan')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        run(n_rows, args)
+
+
+if __name__ == '__main__':
+    main()
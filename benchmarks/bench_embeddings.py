@@ -0,0 +1,95 @@
+"""
+Backend embedding LSA (embeddings.py) dibandingkan dengan TF-IDF sparse pada katalog sintetis.
+
+Yang diukur:
+    lsa_fit         TruncatedSVD atas matriks TF-IDF yang sudah ada
+    encode_cold     encode seluruh katalog tanpa cache (batch --batch-size)
+    encode_warm     encode ulang dengan cache disk penuh (hanya hash + lookup)
+    encode_changed  encode ulang setelah --changed proporsi ringkasan diubah
+    neighbor_table  tabel tetangga top-k dari TF-IDF sparse vs embedding float32
+    query           satu baris similarity penuh + top-k (us/query)
+
+Cara menjalankan:
+    python benchmarks/bench_embeddings.py --rows 10000 100000 --components 128
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from embeddings import EmbeddingCache, LSAEmbedder, embed_texts  # noqa: E402
+from ingest import build_content_features, clean_missing_values  # noqa: E402
+from ranking import build_neighbor_table, dot_similarity, top_k  # noqa: E402
+from recommender import make_vectorizer  # noqa: E402
+from synthetic import synthetic_dataset  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def query_us(matrix, seeds, k):
+    start = time.perf_counter()
+    for idx in seeds:
+        top_k(dot_similarity(matrix[idx:idx + 1], matrix)[0], k, exclude=idx)
+    return (time.perf_counter() - start) / len(seeds) * 1e6
+
+
+def run(n_rows, args):
+    df = build_content_features(clean_missing_values(synthetic_dataset(n_rows, seed=args.seed)))
+    texts = df['Content_Features']
+    tfidf = make_vectorizer(dtype=np.float32)
+    tfidf_matrix = tfidf.fit_transform(texts)
+
+    embedder = LSAEmbedder(n_components=args.components)
+    fit_s, _ = timed(lambda: embedder.fit(texts, vectorizer=tfidf, matrix=tfidf_matrix))
+    with tempfile.TemporaryDirectory() as tmp:
+        cold_s, (vectors, _) = timed(lambda: embed_texts(embedder, texts, EmbeddingCache(tmp),
+                                                         batch_size=args.batch_size))
+        warm_s, (_, n_warm) = timed(lambda: embed_texts(embedder, texts, EmbeddingCache(tmp),
+                                                        batch_size=args.batch_size))
+        rng = np.random.default_rng(args.seed)
+        changed = texts.copy()
+        rows = rng.choice(n_rows, size=int(n_rows * args.changed), replace=False)
+        changed.iloc[rows] = changed.iloc[rows] + ' revisi'
+        changed_s, (_, n_changed) = timed(lambda: embed_texts(embedder, changed, EmbeddingCache(tmp),
+                                                              batch_size=args.batch_size))
+
+    sparse_s, _ = timed(lambda: build_neighbor_table(tfidf_matrix, k=args.k))
+    dense_s, _ = timed(lambda: build_neighbor_table(vectors, k=args.k))
+    seeds = rng.choice(n_rows, size=min(args.queries, n_rows), replace=False)
+
+    print(f"\nN={n_rows} (TF-IDF {tfidf_matrix.shape[1]} term, nnz {tfidf_matrix.nnz:,}; "
+          f"embedding {vectors.shape[1]} dimensi float32, {vectors.nbytes / 2**20:.1f} MB)")
+    print(f"{'lsa_fit':<16} {fit_s:>10.3f} s")
+    print(f"{'encode_cold':<16} {cold_s:>10.3f} s  ({n_rows / cold_s:,.0f} teks/s)")
+    print(f"{'encode_warm':<16} {warm_s:>10.3f} s  ({n_warm} di-encode)")
+    print(f"{'encode_changed':<16} {changed_s:>10.3f} s  ({n_changed} di-encode)")
+    print(f"{'neighbor_table':<16} {sparse_s:>10.3f} s sparse  {dense_s:>8.3f} s padat")
+    print(f"{'query':<16} {query_us(tfidf_matrix, seeds, args.k):>10.0f} us sparse  "
+          f"{query_us(vectors, seeds, args.k):>8.0f} us padat")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000])
+    parser.add_argument('--components', type=int, default=128)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--changed', type=float, default=0.01, help='Proporsi ringkasan yang diubah')
+    parser.add_argument('--k', type=int, default=50)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        run(n_rows, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Bandingkan ranking hybrid (priors.py) dengan ranking similarity murni: latency per query
+p50/p99 untuk neighbors() dan get_recommendations(), throughput batch seluruh katalog,
+serta rata-rata rating dan persentase rekomendasi dengan rating >= 9.0.
+
+k di bawah neighbor_k dilayani dari tabel tetangga; untuk hybrid, tabel tetangga yang
+diurutkan ulang dengan skor hybrid sekali per versi model (N×neighbor_k, sama dengan
+neighbor_indices/neighbor_scores) dan dipotong langsung selama k tidak melebihi kedalaman
+eksaknya. k di atas itu memakai baris similarity penuh, tempat bias prior ditambahkan
+in-place sebelum seleksi top-k.
+
+Hasil pada katalog bawaan (N=569, k=10): neighbors() hybrid setara similarity (selisih
+<0.3 us, cek versi tabel hybrid), get_recommendations() ~5% lebih lambat (kolom
+Similarity Score tambahan dari skor hybrid).
+
+Cara menjalankan:
+    python benchmarks/bench_hybrid.py
+    python benchmarks/bench_hybrid.py --data path/ke/katalog.csv --k 10 100
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from priors import RANKINGS  # noqa: E402
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender  # noqa: E402
+
+
+def latency_us(func, queries):
+    timings = np.empty(len(queries))
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        func(query)
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, [50, 99]) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH))
+    parser.add_argument('--k', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--neighbor-k', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah putaran query per judul')
+    args = parser.parse_args()
+
+    model = WebtoonRecommender(args.data, neighbor_k=args.neighbor_k).fit()
+    n_items = model.tfidf_matrix.shape[0]
+    seeds = np.tile(np.arange(n_items), args.repeat)
+    titles = model.df['Name'].to_numpy()[model.titles.first_positions()]
+    rating = model.df['Rating'].to_numpy(dtype=np.float64, na_value=np.nan)
+    print(f"N={n_items}, neighbor_k={args.neighbor_k}, bobot hybrid {dict(model.hybrid_weights)}")
+
+    print(f"\n{'k':>4} {'ranking':>10} {'neighbors p50/p99 (us)':>23} {'DataFrame p50/p99 (us)':>23} "
+          f"{'batch (q/s)':>12} {'rating':>7} {'>=9.0':>6}")
+    for k in args.k:
+        for ranking in RANKINGS:
+            # Pemanasan: prior dan bias dihitung sekali per versi model, bukan per query
+            model.neighbors([0], k=k, ranking=ranking)
+
+            single = latency_us(lambda idx: model.neighbors([idx], k=k, ranking=ranking), seeds)
+            frame = latency_us(lambda title: model.get_recommendations(title, k=k, ranking=ranking), titles)
+
+            start = time.perf_counter()
+            rec_indices, _ = model.neighbors(seeds, k=k, ranking=ranking)
+            throughput = len(seeds) / (time.perf_counter() - start)
+
+            rec_rating = rating[rec_indices]
+            print(f"{k:>4} {ranking:>10} {single[0]:>11.1f}/{single[1]:<11.1f} {frame[0]:>11.1f}/{frame[1]:<11.1f} "
+                  f"{throughput:>12.0f} {np.nanmean(rec_rating):>7.3f} {100 * np.mean(rec_rating >= 9.0):>5.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark parsing Likes/Subscribers: convert_to_numeric per sel vs parse_counts vektor.
+
+Dataset direplikasi menjadi CSV besar di direktori sementara, lalu dibandingkan:
+read_csv + apply(convert_to_numeric) dengan load_catalog (satu pass, dtype eksplisit).
+Hasil kedua jalur diperiksa identik.
+
+Cara menjalankan:
+    python benchmarks/bench_ingest.py --replicate 4000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ingest import load_catalog, parse_counts  # noqa: E402
+from legacy import convert_to_numeric  # noqa: E402
+from recommender import DEFAULT_DATA_PATH  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default=DEFAULT_DATA_PATH)
+    parser.add_argument('--replicate', type=int, default=4000, help='Jumlah salinan dataset')
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.data)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'catalog.csv'
+        pd.concat([source] * args.replicate, ignore_index=True).to_csv(path, index=False)
+        size_mb = path.stat().st_size / 1e6
+
+        start = time.perf_counter()
+        df = pd.read_csv(path)
+        read_s = time.perf_counter() - start
+        start = time.perf_counter()
+        likes = df['Likes'].apply(convert_to_numeric)
+        subscribers = df['Subscribers'].apply(convert_to_numeric)
+        apply_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parse_counts(df['Likes'])
+        parse_counts(df['Subscribers'])
+        parse_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        catalog, rejected_rows = load_catalog(path)
+        load_s = time.perf_counter() - start
+
+    assert np.array_equal(likes.astype(float), catalog['Likes_Numeric'], equal_nan=True)
+    assert np.array_equal(subscribers.astype(float), catalog['Subscribers_Numeric'], equal_nan=True)
+
+    print(f"CSV: {len(df)} baris, {size_mb:.0f} MB")
+    print(f"{'read_csv':<32} {read_s:>8.2f} s")
+    print(f"{'apply(convert_to_numeric) x2':<32} {apply_s:>8.2f} s  ({len(df) * 2 / apply_s:,.0f} sel/s)")
+    print(f"{'parse_counts x2':<32} {parse_s:>8.2f} s  ({len(df) * 2 / parse_s:,.0f} sel/s)")
+    print(f"{'read_csv + apply':<32} {read_s + apply_s:>8.2f} s")
+    print(f"{'load_catalog (read + parse)':<32} {load_s:>8.2f} s")
+    print(f"Baris ditolak: {rejected_rows}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Overhead instrumentasi (instrumentation.py) pada jalur query: latency per panggilan
+neighbors(), get_recommendation_records() (cache hit) dan get_recommendations() dengan
+instrumentasi nonaktif (default model, tanpa sink) dan dengan setiap sink.
+
+Setiap konfigurasi diulang beberapa putaran dan yang tercepat dilaporkan, sehingga
+selisih terhadap baris 'nonaktif' adalah biaya sink per query.
+
+Cara menjalankan:
+    python benchmarks/bench_instrumentation.py --calls 20000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from instrumentation import Instrumentation, JSONLinesSink, LogSink, PrometheusSink  # noqa: E402
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender  # noqa: E402
+
+
+def best_us(func, calls, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        func()
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH))
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    # Log dibuang agar yang terukur hanya biaya format dan emit, bukan I/O terminal
+    logger = logging.getLogger('bench_instrumentation')
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    model = WebtoonRecommender(args.data).fit()
+    title = model.df['Name'].iloc[0]
+    queries = {
+        'neighbors': lambda: model.neighbors([0], k=10),
+        'records (hit)': lambda: model.get_recommendation_records(title, k=10),
+        'get_recommendations': lambda: model.get_recommendations(title, k=10),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = JSONLinesSink(os.path.join(tmp, 'trace.jsonl'))
+        configs = [
+            ('nonaktif', model.instrumentation),
+            ('prometheus', Instrumentation([PrometheusSink()])),
+            ('log', Instrumentation([LogSink(logger)])),
+            ('jsonl', Instrumentation([trace])),
+        ]
+        print(f"{'instrumentasi':>14}" + ''.join(f'{name:>22}' for name in queries) + '  (us/panggilan)')
+        for name, instrumentation in configs:
+            model.instrumentation = instrumentation
+            # get_recommendations membangun DataFrame, jadi dipanggil 10x lebih jarang
+            timings = [best_us(func, args.calls if query != 'get_recommendations' else args.calls // 10,
+                               args.rounds) for query, func in queries.items()]
+            print(f'{name:>14}' + ''.join(f'{timing:>22.2f}' for timing in timings))
+        trace.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark re-ranking MMR (diversity.py) terhadap top-k biasa pada katalog sintetis.
+
+Untuk setiap ukuran pool dilaporkan latency p50/p99 per query dan rasionya terhadap
+top-k biasa dengan k sebesar pool (tahap pengambilan pool yang dipakai MMR), beserta
+rata-rata jumlah genre berbeda dan skor kesamaan dalam top-k. Tahap seleksi MMR juga
+diukur terpisah dan dibandingkan dengan MMR naif yang menghitung similarity maksimum
+ulang di loop Python per kandidat.
+
+Cara menjalankan:
+    python benchmarks/bench_mmr.py --size 20000 --pools 500 1000 --lambdas 0.7 0.5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from diversity import mmr_select  # noqa: E402
+from recommender import WebtoonRecommender  # noqa: E402
+from synthetic import synthetic_catalog  # noqa: E402
+
+
+def naive_mmr(relevance, pool_vectors, k, mmr_lambda):
+    # Pembanding O(k² · pool): similarity maksimum dihitung ulang per kandidat per langkah
+    similarity = (pool_vectors @ pool_vectors.T).toarray()
+    selected = []
+    for _ in range(k):
+        best, best_score = None, -np.inf
+        for candidate in range(len(relevance)):
+            if candidate in selected:
+                continue
+            redundancy = max((similarity[candidate, chosen] for chosen in selected), default=0.0)
+            score = mmr_lambda * relevance[candidate] - (1 - mmr_lambda) * redundancy
+            if score > best_score:
+                best, best_score = candidate, score
+        selected.append(best)
+    return selected
+
+
+def timed(func, seeds):
+    timings, results = np.empty(len(seeds)), []
+    for i, idx in enumerate(seeds):
+        start = time.perf_counter()
+        results.append(func(idx))
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, [50, 99]) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=20000)
+    parser.add_argument('--pools', type=int, nargs='+', default=[500, 1000])
+    parser.add_argument('--lambdas', type=float, nargs='+', default=[0.7, 0.5])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('--naive-queries', type=int, default=5)
+    args = parser.parse_args()
+
+    model = WebtoonRecommender(synthetic_catalog(args.size), neighbor_k=50).fit()
+    genres = pd.factorize(model.df['Genre'])[0]
+    seeds = np.random.default_rng(1).choice(args.size, size=args.queries, replace=False)
+    print(f"N={args.size}, k={args.k}, {args.queries} query")
+    print(f"{'pool':>6} {'metode':>16} {'p50 (ms)':>9} {'p99 (ms)':>9} {'rasio':>6} {'genre':>6} {'skor':>7}")
+
+    for pool in args.pools:
+        model.mmr_pool = pool
+        (base_p50, base_p99), pools = timed(lambda idx: model._rank(idx, pool), seeds)
+        print(f"{pool:>6} {'top-k (k=pool)':>16} {base_p50:>9.3f} {base_p99:>9.3f} {1.0:>5.1f}x")
+
+        runs = [(f'MMR {mmr_lambda}', {'mmr_lambda': mmr_lambda}) for mmr_lambda in args.lambdas]
+        runs.append((f'MMR {args.lambdas[-1]} +genre', {'mmr_lambda': args.lambdas[-1], 'min_genres': 5}))
+        for name, options in [('top-k', {})] + runs:
+            (p50, p99), results = timed(lambda idx: model.neighbors([idx], k=args.k, **options), seeds)
+            diversity = np.mean([len(np.unique(genres[indices[0]])) for indices, _ in results])
+            score = np.mean([scores[0].mean() for _, scores in results])
+            print(f"{'':>6} {name:>16} {p50:>9.3f} {p99:>9.3f} {p50 / base_p50:>5.1f}x {diversity:>6.2f} {score:>7.4f}")
+
+        # Tahap seleksi saja (tanpa pengambilan pool): incremental vs loop Python naif
+        vectors = [model.tfidf_matrix[indices] for indices, _ in pools]
+        (select_p50, select_p99), _ = timed(
+            lambda i: mmr_select(pools[i][1], vectors[i], args.k, args.lambdas[0]), range(len(pools)))
+        print(f"{'':>6} {'seleksi MMR':>16} {select_p50:>9.3f} {select_p99:>9.3f}")
+        (naive_p50, naive_p99), _ = timed(
+            lambda i: naive_mmr(pools[i][1], vectors[i], args.k, args.lambdas[0]), range(args.naive_queries))
+        print(f"{'':>6} {'seleksi naif':>16} {naive_p50:>9.3f} {naive_p99:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
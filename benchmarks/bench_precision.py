@@ -0,0 +1,54 @@
+"""
+Bandingkan mode presisi penyimpanan (precision.py): memori per struktur model dan
+apakah top-10 get_recommendations untuk setiap judul tetap sama dengan float64.
+
+Cara menjalankan:
+    python benchmarks/bench_precision.py
+    python benchmarks/bench_precision.py --data path/ke/katalog.csv --k 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from precision import PRECISIONS  # noqa: E402
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH))
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--neighbor-k', type=int, default=50)
+    args = parser.parse_args()
+
+    reference = None
+    for precision in PRECISIONS:
+        start = time.perf_counter()
+        model = WebtoonRecommender(args.data, neighbor_k=args.neighbor_k, precision=precision).fit()
+        fit_time = time.perf_counter() - start
+
+        report = model.memory_report()
+        print(f"\n=== precision={precision} (fit {fit_time:.2f} s) ===")
+        print(report.to_string(index=False, formatters={'MB': '{:.3f}'.format}))
+        print(f"Total: {report['MB'].sum():.3f} MB")
+
+        # Ranking dibandingkan lewat get_recommendations agar jalur yang diuji sama dengan pengguna
+        titles = model.df['Name'].to_numpy()[model.titles.first_positions()]
+        rankings = [model.get_recommendations(title, k=args.k) for title in titles]
+        names = np.array([result['Name'].to_numpy() for result in rankings])
+        scores = np.array([result['Similarity Score'].to_numpy(dtype=np.float64) for result in rankings])
+        if reference is None:
+            reference = (names, scores)
+            continue
+        changed = int(np.sum((names != reference[0]).any(axis=1)))
+        max_error = np.max(np.abs(scores - reference[1]))
+        print(f"Top-{args.k} berbeda dari float64: {changed} dari {len(titles)} judul; "
+              f"selisih skor maksimum {max_error:.2e}")
+
+
+if __name__ == '__main__':
+    main()
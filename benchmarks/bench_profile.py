@@ -0,0 +1,70 @@
+"""
+Benchmark rekomendasi profil pengguna (recommend_for_profile dan recommend_for_profiles)
+dibandingkan dengan loop get_recommendations per judul yang sudah dibaca.
+
+Riwayat bacaan sintetis diambil acak dari katalog. Loop per judul menjumlahkan skor
+tetangga setiap judul; profil centroid menskor seluruh katalog dengan satu perkalian
+matriks-vektor sparse per pengguna (atau per blok pengguna pada versi batch).
+
+Cara menjalankan:
+    python benchmarks/bench_profile.py --users 1000 --history 10 100 300
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender  # noqa: E402
+
+
+def per_seed_loop(model, titles, k):
+    # Cara lama: satu query per judul, skor tetangga dijumlahkan per kandidat
+    totals = {}
+    for title in titles:
+        result = model.get_recommendations(title, k=model.neighbor_k)
+        for name, score in zip(result['Name'], result['Similarity Score']):
+            totals[name] = totals.get(name, 0.0) + score
+    read = set(titles)
+    ranked = sorted((name for name in totals if name not in read), key=totals.get, reverse=True)
+    return ranked[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH))
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--history', type=int, nargs='+', default=[10, 100, 300])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--loop-users', type=int, default=20, help='Jumlah pengguna untuk loop per judul')
+    args = parser.parse_args()
+
+    model = WebtoonRecommender(args.data).fit()
+    names = model.df['Name'].to_numpy()
+    rng = np.random.default_rng(0)
+    print(f"N={len(names)}, {args.users} pengguna, k={args.k}")
+    print(f"{'riwayat':>8} {'loop/judul (ms)':>16} {'profil (ms)':>12} {'batch (ms/pengguna)':>20}")
+
+    for history in args.history:
+        histories = [list(rng.choice(names, size=history)) for _ in range(args.users)]
+
+        start = time.perf_counter()
+        for titles in histories[:args.loop_users]:
+            per_seed_loop(model, titles, args.k)
+        loop_ms = (time.perf_counter() - start) / args.loop_users * 1000
+
+        start = time.perf_counter()
+        for titles in histories[:args.loop_users]:
+            model.recommend_for_profile(titles, k=args.k)
+        single_ms = (time.perf_counter() - start) / args.loop_users * 1000
+
+        start = time.perf_counter()
+        model.recommend_for_profiles(histories, k=args.k)
+        batch_ms = (time.perf_counter() - start) / args.users * 1000
+        print(f"{history:>8} {loop_ms:>16.2f} {single_ms:>12.2f} {batch_ms:>20.3f}")
+
+
+if __name__ == '__main__':
+    main()
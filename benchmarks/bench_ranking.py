@@ -0,0 +1,62 @@
+"""
+Micro-benchmark latency ranking per panggilan terhadap ukuran katalog.
+
+Membandingkan cara lama (list(enumerate(...)) + sorted) dengan seleksi parsial
+top_k pada baris similarity acak.
+
+Cara menjalankan:
+    python benchmarks/bench_ranking.py --sizes 1000 10000 100000 1000000 --k 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ranking import top_k  # noqa: E402
+
+
+def rank_with_sorted(row, k, idx):
+    sim_scores = list(enumerate(row))
+    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
+    sim_scores = [s for s in sim_scores if s[0] != idx][:k]
+    return [i[0] for i in sim_scores], [i[1] for i in sim_scores]
+
+
+def rank_with_top_k(row, k, idx):
+    return top_k(row.copy(), k, exclude=idx)
+
+
+def time_per_call(fn, row, k, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(row, k, 0)
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'N':>10} {'sorted (ms)':>14} {'top_k (ms)':>12} {'speedup':>9}")
+    for n in args.sizes:
+        row = rng.random(n)
+        ref_indices, _ = rank_with_sorted(row, args.k, 0)
+        new_indices, _ = rank_with_top_k(row, args.k, 0)
+        assert list(new_indices) == ref_indices, "top_k tidak sama dengan hasil sorted()"
+
+        sorted_ms = time_per_call(rank_with_sorted, row, args.k, args.repeats)
+        top_k_ms = time_per_call(rank_with_top_k, row, args.k, args.repeats)
+        print(f"{n:>10} {sorted_ms:>14.3f} {top_k_ms:>12.3f} {sorted_ms / top_k_ms:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+"""
+Benchmark suite end-to-end untuk pelacakan regresi performa build dan query.
+
+Untuk setiap ukuran katalog, dataset sintetis dengan skema webtoon-dataset.csv
+(synthetic.py) ditulis ke CSV sementara, lalu setiap tahap diukur terpisah:
+
+    csv_load            read_csv dengan dtype eksplisit
+    convert_to_numeric  parsing Likes/Subscribers per sel (jalur lama, pembanding)
+    parse_counts        parsing Likes/Subscribers vektor (jalur yang dipakai load_catalog)
+    clean_text          isi missing values + pembersihan ringkasan dan tokenisasi per field
+                        (features.field_streams; sebelumnya pembersihan re.sub + Content_Features)
+    tfidf_fit           fit TF-IDF dari aliran token (features.fit_tfidf_fields); tokenisasi tidak
+                        lagi dihitung di tahap ini
+    neighbor_table      tabel tetangga top-k blockwise
+    title_index         index judul
+    query_single        get_recommendations per judul (p50/p99, cache dimatikan)
+    query_batch         neighbors() untuk banyak seed sekaligus (query/detik)
+    evaluation          evaluate_model
+
+Setiap tahap mencatat waktu, peak RSS selama tahap tersebut dan kenaikannya dari RSS
+awal tahap. Di Linux peak direset per tahap lewat /proc/self/clear_refs; di platform
+lain dipakai ru_maxrss yang kumulatif sejak proses dimulai (tercatat di meta).
+Tabel tetangga exact tumbuh O(N²), jadi ukuran 1M praktis hanya dengan --workers.
+
+Hasil ditulis sebagai JSON. Dengan --compare, hasil dibandingkan dengan JSON versi
+sebelumnya dan tahap yang melambat melebihi --threshold dilaporkan (exit code 1).
+
+Cara menjalankan:
+    python benchmarks/bench_suite.py --sizes 1000 10000 100000 --out hasil.json
+    python benchmarks/bench_suite.py --sizes 1000000 --workers 4 --out hasil-1m.json
+    python benchmarks/bench_suite.py --sizes 1000 10000 --compare hasil.json --threshold 1.25
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy
+import sklearn
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from evaluation import evaluate_model  # noqa: E402
+from features import field_streams, fit_tfidf_fields  # noqa: E402
+from ingest import COUNT_COLUMNS, CSV_DTYPES, clean_missing_values, parse_counts  # noqa: E402
+from instrumentation import current_rss, peak_rss, reset_peak_rss  # noqa: E402
+from legacy import convert_to_numeric  # noqa: E402
+from parallel import build_neighbor_table_parallel  # noqa: E402
+from ranking import build_neighbor_table  # noqa: E402
+from recommender import WebtoonRecommender, build_title_index, make_vectorizer  # noqa: E402
+from synthetic import synthetic_dataset  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+STAGES = ['csv_load', 'convert_to_numeric', 'parse_counts', 'clean_text', 'tfidf_fit', 'neighbor_table',
+          'title_index', 'query_single', 'query_batch', 'evaluation']
+
+# Tahap yang lebih cepat dari ini tidak dinilai sebagai regresi (noise timer)
+MIN_COMPARE_SECONDS = 0.01
+
+
+@contextmanager
+def stage(results, name):
+    """
+    Ukur waktu dan peak RSS satu tahap; metrik tambahan bisa diisi ke dict yang di-yield.
+    """
+    reset_peak_rss()
+    start_rss = current_rss()
+    extra = {}
+    start = time.perf_counter()
+    yield extra
+    seconds = time.perf_counter() - start
+    peak = peak_rss()
+    results[name] = {'seconds': seconds, 'peak_rss_mb': peak, 'peak_increase_mb': peak - start_rss, **extra}
+
+
+def latency_ms(func, queries):
+    timings = np.empty(len(queries))
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        func(query)
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, [50, 99]) * 1000
+
+
+def run_size(n_rows, args):
+    """
+    Jalankan seluruh tahap untuk satu ukuran katalog.
+
+    Returns:
+    dict: Hasil per tahap (lihat STAGES)
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'catalog.csv'
+        synthetic_dataset(n_rows, seed=args.seed).to_csv(path, index=False)
+        csv_mb = path.stat().st_size / 2**20
+
+        with stage(results, 'csv_load') as extra:
+            df = pd.read_csv(path, dtype=CSV_DTYPES)
+            extra['csv_mb'] = csv_mb
+
+    with stage(results, 'convert_to_numeric'):
+        for column in COUNT_COLUMNS:
+            df[column].map(convert_to_numeric)
+    results['convert_to_numeric']['cells_per_s'] = 2 * n_rows / results['convert_to_numeric']['seconds']
+
+    with stage(results, 'parse_counts'):
+        for column, numeric_column in COUNT_COLUMNS.items():
+            df[numeric_column], _ = parse_counts(df[column])
+    results['parse_counts']['cells_per_s'] = 2 * n_rows / results['parse_counts']['seconds']
+
+    with stage(results, 'clean_text'):
+        df = clean_missing_values(df)
+        streams = field_streams(df)
+    results['clean_text']['rows_per_s'] = n_rows / results['clean_text']['seconds']
+
+    with stage(results, 'tfidf_fit') as extra:
+        tfidf, tfidf_matrix = fit_tfidf_fields(df, make_vectorizer, streams=streams)
+        extra.update(n_features=tfidf_matrix.shape[1], nnz=int(tfidf_matrix.nnz))
+    results['tfidf_fit']['rows_per_s'] = n_rows / results['tfidf_fit']['seconds']
+
+    with stage(results, 'neighbor_table'):
+        if args.workers > 1:
+            table = build_neighbor_table_parallel(tfidf_matrix, k=args.neighbor_k, workers=args.workers)
+        else:
+            table = build_neighbor_table(tfidf_matrix, k=args.neighbor_k)
+    results['neighbor_table']['rows_per_s'] = n_rows / results['neighbor_table']['seconds']
+
+    # Rakit model dari hasil tahap di atas, sama seperti WebtoonRecommender.load()
+    model = WebtoonRecommender(df, neighbor_k=args.neighbor_k, cache_size=0)
+    with stage(results, 'title_index'):
+        model.titles = build_title_index(df)
+    model.df, model.tfidf, model.tfidf_matrix = df, tfidf, tfidf_matrix
+    model._set_neighbor_table(*table)
+    model.version = 1
+
+    rng = np.random.default_rng(args.seed)
+    seeds = rng.choice(n_rows, size=min(args.queries, n_rows), replace=False)
+    titles = df['Name'].to_numpy()[seeds]
+    with stage(results, 'query_single') as extra:
+        p50, p99 = latency_ms(lambda title: model.get_recommendations(title, k=args.k), titles)
+        extra.update(queries=len(titles), p50_ms=p50, p99_ms=p99)
+
+    batch = rng.choice(n_rows, size=min(args.batch_size, n_rows), replace=False)
+    with stage(results, 'query_batch') as extra:
+        model.neighbors(batch, k=args.k)
+        extra['queries'] = len(batch)
+    results['query_batch']['queries_per_s'] = len(batch) / results['query_batch']['seconds']
+
+    with stage(results, 'evaluation') as extra:
+        metrics, _ = evaluate_model(model, k=args.k, sample_size=args.eval_sample)
+        extra['n_seeds'] = metrics['n_seeds']
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scipy': scipy.__version__,
+        'sklearn': sklearn.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'peak_rss_method': 'VmHWM' if reset_peak_rss() else 'ru_maxrss',
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Cetak rasio waktu per tahap terhadap hasil baseline.
+
+    Returns:
+    list: (ukuran, tahap, rasio) untuk tahap yang melambat melebihi threshold
+    """
+    regressions = []
+    print(f"\nPerbandingan dengan {baseline['meta'].get('git_commit')} ({baseline['meta'].get('timestamp')})")
+    print(f"{'baris':>9} {'tahap':<20} {'dulu (s)':>10} {'kini (s)':>10} {'rasio':>7} {'peak dulu/kini (MB)':>21}")
+    for size, stages in current['results'].items():
+        if size not in baseline['results']:
+            continue
+        for name, result in stages.items():
+            old = baseline['results'][size].get(name)
+            if old is None:
+                continue
+            ratio = result['seconds'] / old['seconds'] if old['seconds'] > 0 else float('inf')
+            regressed = ratio > threshold and result['seconds'] >= MIN_COMPARE_SECONDS
+            if regressed:
+                regressions.append((size, name, ratio))
+            print(f"{size:>9} {name:<20} {old['seconds']:>10.3f} {result['seconds']:>10.3f} {ratio:>6.2f}x "
+                  f"{old['peak_rss_mb']:>10.0f}/{result['peak_rss_mb']:<10.0f}{' REGRESI' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--neighbor-k', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=1, help='Jumlah proses untuk tabel tetangga')
+    parser.add_argument('--queries', type=int, default=200, help='Jumlah query tunggal per ukuran')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Jumlah seed query batch')
+    parser.add_argument('--eval-sample', type=int, default=None, help='Sampel evaluasi; default seluruh katalog')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=None, help='Path JSON hasil')
+    parser.add_argument('--compare', default=None, help='JSON hasil sebelumnya sebagai baseline')
+    parser.add_argument('--threshold', type=float, default=1.25, help='Rasio waktu yang dianggap regresi')
+    args = parser.parse_args()
+
+    report = {'meta': {**environment(), 'args': vars(args)}, 'results': {}}
+    for n_rows in args.sizes:
+        print(f"\nN={n_rows}")
+        print(f"{'tahap':<20} {'waktu (s)':>10} {'peak RSS (MB)':>14} {'kenaikan (MB)':>14}")
+        results = run_size(n_rows, args)
+        for name in STAGES:
+            result = results[name]
+            print(f"{name:<20} {result['seconds']:>10.3f} {result['peak_rss_mb']:>14.0f} "
+                  f"{result['peak_increase_mb']:>14.0f}")
+        print(f"query_single p50/p99: {results['query_single']['p50_ms']:.3f}/{results['query_single']['p99_ms']:.3f} ms, "
+              f"query_batch: {results['query_batch']['queries_per_s']:,.0f} query/s")
+        report['results'][str(n_rows)] = results
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nHasil ditulis ke {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} tahap melambat lebih dari {args.threshold:.2f}x")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
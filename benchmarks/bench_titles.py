@@ -0,0 +1,105 @@
+"""
+Benchmark index judul (titles.py) pada katalog judul sintetis berukuran besar.
+
+Dilaporkan waktu pembangunan index dan latensi p50/p99 per query untuk lookup eksak
+(TitleIndex vs pandas Series), autocomplete prefix dan saran fuzzy untuk judul dengan
+salah ketik, beserta persentase query salah ketik yang judul aslinya ada di saran teratas.
+
+Cara menjalankan:
+    python benchmarks/bench_titles.py --size 1000000 --queries 2000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from titles import TitleIndex, normalize_title  # noqa: E402
+
+
+def synthetic_titles(n_titles, n_words=20000, seed=0):
+    """
+    Judul sintetis 2-5 kata dari kosakata acak; sekitar 1% judul sengaja diduplikasi.
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    words = np.array([''.join(rng.choice(letters, length)).capitalize()
+                      for length in rng.integers(3, 9, size=n_words)])
+    lengths = rng.integers(2, 6, size=n_titles)
+    picks = np.minimum(rng.zipf(1.3, size=lengths.sum()), n_words) - 1
+    titles = [' '.join(chunk) for chunk in np.split(words[picks], np.cumsum(lengths)[:-1])]
+    duplicates = rng.choice(n_titles, size=n_titles // 100, replace=False)
+    for position in duplicates:
+        titles[position] = titles[rng.integers(n_titles)]
+    return titles
+
+
+def typo(title, rng):
+    # Satu karakter dihapus atau ditukar dengan tetangganya
+    i = int(rng.integers(1, len(title) - 1))
+    if rng.random() < 0.5:
+        return title[:i] + title[i + 1:]
+    return title[:i - 1] + title[i] + title[i - 1] + title[i + 1:]
+
+
+def latency(func, queries):
+    timings = np.empty(len(queries))
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        func(query)
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, [50, 99]) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    titles = synthetic_titles(args.size)
+    rng = np.random.default_rng(1)
+    sample = [titles[i] for i in rng.choice(args.size, size=args.queries, replace=False)]
+    print(f"N={args.size}, {args.queries} query per pengujian")
+
+    start = time.perf_counter()
+    index = TitleIndex(titles, ids=np.arange(args.size))
+    print(f"Bangun index eksak: {time.perf_counter() - start:.2f} s "
+          f"({len(index.duplicates())} judul duplikat)")
+    start = time.perf_counter()
+    index.complete('a')
+    print(f"Bangun index prefix: {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    index.suggest('a')
+    print(f"Bangun index trigram: {time.perf_counter() - start:.2f} s")
+
+    series = pd.Series(np.arange(args.size), index=titles).drop_duplicates()
+    typos = [typo(title, rng) for title in sample]
+    prefixes = [title[:max(3, len(title) // 2)].lower() for title in sample]
+
+    print(f"\n{'operasi':<28} {'p50 (us)':>10} {'p99 (us)':>10}")
+    for name, func, queries in [
+        ('pandas Series (eksak)', series.get, sample),
+        ('TitleIndex.get (eksak)', index.get, sample),
+        ('TitleIndex.get (id)', index.get, list(range(args.queries))),
+        ('TitleIndex.complete', index.complete, prefixes),
+        ('TitleIndex.suggest', index.suggest, typos),
+    ]:
+        p50, p99 = latency(func, queries)
+        print(f"{name:<28} {p50:>10.1f} {p99:>10.1f}")
+
+    # Katalog sintetis tersusun dari kata Zipf yang sama, sehingga banyak judul hanya berbeda satu kata
+    ranks = []
+    for query, title in zip(typos, sample):
+        names = [normalize_title(name) for name, _ in index.suggest(query, limit=5)] + [normalize_title(title)]
+        ranks.append(names.index(normalize_title(title)))
+    ranks = np.array(ranks)
+    print(f"\nJudul asli ada di saran ke-1: {100 * np.mean(ranks == 0):.1f}%, "
+          f"di 5 saran teratas: {100 * np.mean(ranks < 5):.1f}% query salah ketik")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+"""
+Implementasi per sel dari notebook asli yang dipakai benchmark sebagai pembanding
+jalur tervektorisasi (lihat ingest.parse_counts). Tidak dipakai oleh kode produksi.
+"""
+
+
+def convert_to_numeric(value):
+    """
+    Ubah nilai Likes/Subscribers seperti "30.6M", "250K" atau "1,234" menjadi angka.
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        if 'M' in value:
+            return float(value.replace('M', '')) * 1000000
+        elif 'K' in value:
+            return float(value.replace('K', '')) * 1000
+        else:
+            try:
+                return float(value.replace(',', ''))
+            except ValueError:
+                return None
+    return value
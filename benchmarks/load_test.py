@@ -0,0 +1,105 @@
+"""
+Load test untuk service.py: beberapa client konkuren dengan koneksi keep-alive
+mengirim request ke satu endpoint, lalu dilaporkan throughput dan latency p50/p95/p99.
+
+Jalankan service lebih dulu, misalnya:
+    python service.py --port 8000 --workers 2
+    python benchmarks/load_test.py --port 8000 --concurrency 1 8 32 --endpoint recommendations
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from recommender import DEFAULT_DATA_PATH  # noqa: E402
+
+ENDPOINTS = ('recommendations', 'batch', 'similarity')
+
+
+def build_request(endpoint, titles, rng, host, k, batch_size):
+    if endpoint == 'recommendations':
+        method, target = 'GET', '/recommendations?' + urlencode({'title': rng.choice(titles), 'k': k})
+        body = b''
+    elif endpoint == 'similarity':
+        a, b = rng.choice(titles, 2)
+        method, target, body = 'GET', '/similarity?' + urlencode({'a': a, 'b': b}), b''
+    else:
+        method, target = 'POST', '/recommendations/batch'
+        body = json.dumps({'titles': list(rng.choice(titles, batch_size)), 'k': k}).encode('utf-8')
+    head = (f'{method} {target} HTTP/1.1\r\nHost: {host}\r\n'
+            f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n')
+    return head.encode('latin-1') + body
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Koneksi ditutup oleh server.')
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def client(host, port, requests, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request in requests:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            statuses.append(await read_response(reader))
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, concurrency):
+    latencies, statuses = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests[i::concurrency], latencies, statuses)
+                           for i in range(concurrency)))
+    return time.perf_counter() - start, np.array(latencies), np.array(statuses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--endpoint', choices=ENDPOINTS, default='recommendations')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=2000, help='Jumlah request per level konkurensi')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=32, help='Jumlah judul per request batch')
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH), help='CSV sumber judul untuk request')
+    args = parser.parse_args()
+
+    titles = pd.read_csv(args.data, usecols=['Name'])['Name'].dropna().unique()
+    rng = np.random.default_rng(0)
+
+    print(f"endpoint={args.endpoint}, {args.requests} request per level")
+    print(f"{'klien':>6} {'req/s':>9} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'non-2xx':>8}")
+    for concurrency in args.concurrency:
+        requests = [build_request(args.endpoint, titles, rng, args.host, args.k, args.batch_size)
+                    for _ in range(args.requests)]
+        elapsed, latencies, statuses = asyncio.run(run_load(args.host, args.port, requests, concurrency))
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        errors = int(np.sum((statuses < 200) | (statuses >= 300)))
+        print(f"{concurrency:>6} {len(latencies) / elapsed:>9.0f} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f} {errors:>8}")
+
+
+if __name__ == '__main__':
+    main()
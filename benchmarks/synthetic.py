@@ -0,0 +1,106 @@
+"""
+Generator katalog webtoon sintetis untuk benchmark.
+
+synthetic_catalog hanya membuat kolom fitur konten (Name, Genre, Writer, Summary).
+synthetic_dataset membuat seluruh kolom webtoon-dataset.csv dengan format mentah yang
+sama (Likes "882,743" / "3.9M", Subscribers "37.3K" / "1.2M", Update "UP EVERY ..."),
+termasuk sedikit Writer/Genre kosong, sehingga bisa ditulis ke CSV dan dimuat lewat
+jalur yang sama dengan dataset asli.
+
+Cara menjalankan:
+    python benchmarks/synthetic.py --rows 100000 --out katalog-100k.csv
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+GENRES = ['Action', 'Comedy', 'Drama', 'Fantasy', 'Heartwarming', 'Horror', 'Romance',
+          'Sci-fi', 'Slice of life', 'Sports', 'Superhero', 'Supernatural', 'Thriller']
+
+UPDATE_DAYS = ['MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY']
+
+
+def synthetic_catalog(n_items, n_words=30000, n_writers=20000, words_per_summary=40, seed=0):
+    """
+    Katalog sintetis: kata ringkasan diambil dari distribusi Zipf atas kosakata acak,
+    diselingi tanda baca agar tahap pembersihan ikut bekerja.
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    lengths = rng.integers(3, 10, size=n_words)
+    words = np.array([''.join(rng.choice(letters, length)) for length in lengths])
+    punctuation = np.array(['', '', '', '', ',', '.', '!', '?'])
+
+    picks = np.minimum(rng.zipf(1.2, size=(n_items, words_per_summary)), n_words) - 1
+    tokens = np.char.add(words[picks], punctuation[rng.integers(len(punctuation), size=picks.shape)])
+    summaries = [' '.join(row).capitalize() for row in tokens]
+    writers = np.char.add('Writer ', rng.integers(n_writers, size=n_items).astype(str))
+    return pd.DataFrame({
+        'Name': [f'Title {i}' for i in range(n_items)],
+        'Genre': rng.choice(GENRES, size=n_items),
+        'Writer': writers,
+        'Summary': summaries,
+    })
+
+
+def format_counts(values, thousands=False):
+    # Jutaan ditulis "3.9M"; sisanya "37.3K" jika thousands, selain itu angka dengan koma ribuan
+    return [f'{value / 1e6:.1f}M' if value >= 1e6 else f'{value / 1e3:.1f}K' if thousands else f'{value:,.0f}'
+            for value in values]
+
+
+def synthetic_dataset(n_rows, missing_rate=0.002, seed=0, **catalog_options):
+    """
+    Dataset sintetis dengan skema dan format kolom yang sama dengan webtoon-dataset.csv.
+
+    Parameters:
+    n_rows (int): Jumlah baris
+    missing_rate (float): Proporsi Writer dan Genre yang dikosongkan
+    seed (int): Seed generator acak
+    **catalog_options: Opsi tambahan untuk synthetic_catalog (n_words, n_writers, ...)
+
+    Returns:
+    pandas.DataFrame: Kolom id, Name, Writer, Likes, Genre, Rating, Subscribers, Summary,
+                      Update dan Reading Link sebagai teks mentah seperti di CSV
+    """
+    df = synthetic_catalog(n_rows, seed=seed, **catalog_options)
+    rng = np.random.default_rng(seed + 1)
+
+    subscribers = np.round(rng.lognormal(12.0, 1.2, size=n_rows))
+    likes = np.round(subscribers * rng.lognormal(1.5, 0.5, size=n_rows))
+    rating = np.round(np.clip(rng.normal(9.4, 0.5, size=n_rows), 1.0, 10.0), 2)
+    days = rng.choice(UPDATE_DAYS, size=n_rows)
+    update = np.where(rng.random(n_rows) < 0.45, 'COMPLETED', np.char.add('UP EVERY ', days))
+
+    for column in ['Writer', 'Genre']:
+        df.loc[rng.random(n_rows) < missing_rate, column] = np.nan
+
+    ids = np.arange(n_rows)
+    return pd.DataFrame({
+        'id': ids,
+        'Name': df['Name'],
+        'Writer': df['Writer'],
+        'Likes': format_counts(likes),
+        'Genre': df['Genre'],
+        'Rating': rating,
+        'Subscribers': format_counts(subscribers, thousands=True),
+        'Summary': df['Summary'],
+        'Update': update,
+        'Reading Link': [f'https://www.webtoons.com/en/title/list?title_no={i}' for i in ids],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help='Path CSV tujuan')
+    args = parser.parse_args()
+
+    synthetic_dataset(args.rows, seed=args.seed).to_csv(args.out, index=False)
+    print(f"{args.rows} baris ditulis ke {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Cache hasil rekomendasi berukuran terbatas dengan eviksi LRU dan TTL opsional.
+
+Trafik "mirip dengan judul ini" sangat timpang ke judul populer, sehingga hasil
+untuk kunci (posisi judul, k, filters) yang sama disimpan dan dipakai ulang. Setiap entry
+terikat pada versi model; begitu katalog atau model berubah (fit, add_items,
+update_item, remove_item, build_ann_index), seluruh isi cache dibuang.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Cache LRU thread-safe dengan TTL opsional dan invalidasi berbasis versi.
+
+    Parameters:
+    maxsize (int): Jumlah entry maksimum; 0 menonaktifkan cache
+    ttl (float, optional): Umur maksimum entry dalam detik; None berarti tanpa batas
+    clock (callable): Sumber waktu monotonic, bisa diganti untuk pengujian
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version):
+        """
+        Ambil entry untuk kunci pada versi model tertentu.
+
+        Returns:
+        tuple: (ditemukan, nilai)
+        """
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or self.clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key, version, value):
+        """
+        Simpan nilai untuk kunci; entry yang paling lama tidak dipakai dibuang jika penuh.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._check_version(version)
+            expires_at = None if self.ttl is None else self.clock() + self.ttl
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, version, compute):
+        """
+        Kembalikan nilai dari cache, atau hitung dengan compute() lalu simpan.
+        compute() dijalankan di luar lock, sehingga miss bersamaan untuk kunci yang sama
+        bisa menghitung dua kali tetapi tidak saling menunggu.
+        """
+        found, value = self.get(key, version)
+        if found:
+            return value
+        value = compute()
+        self.put(key, version, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns:
+        dict: Ukuran cache serta counter hit, miss, eviction, expiration dan invalidation
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+    def _check_version(self, version):
+        # Dipanggil dengan lock dipegang
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
@@ -0,0 +1,249 @@
+"""
+Statistik katalog per kelompok (genre, penulis, jadwal update, status) sebagai index array.
+
+Setiap kolom kelompok difaktorisasi sekali menjadi kode bilangan bulat per baris. Dari
+kode itu dibangun daftar anggota berbentuk CSR (posisi baris diurutkan per kelompok,
+dengan offset per kelompok) serta jumlah, jumlah nilai valid dan banyak anggota per
+kelompok untuk setiap metrik, masing-masing dengan satu np.bincount. Rata-rata per
+kelompok, "karya lain dari penulis ini" dan profil genre penulis lalu dibaca langsung
+dari array tersebut dalam O(ukuran kelompok), tanpa groupby ulang atas seluruh tabel.
+
+Item baru ditambahkan secara incremental: kode baru di-append, agregat kelompok
+ditambah dengan bincount atas baris baru saja dan posisinya masuk ke buffer anggota per
+kelompok yang digabung ke CSR saat buffer sudah cukup besar.
+"""
+import numpy as np
+import pandas as pd
+
+from filters import catalog_status
+from ingest import COUNT_COLUMNS, parse_counts
+
+GROUP_COLUMNS = ('Genre', 'Writer', 'Update', 'Status')
+
+# Metrik yang dijumlahkan per kelompok dan nama kolom rata-ratanya di summary()
+METRICS = {'Likes_Numeric': 'Avg Likes', 'Subscribers_Numeric': 'Avg Subscribers', 'Rating': 'Avg Rating'}
+
+# Buffer anggota digabung ke CSR jika melebihi proporsi ini dari jumlah item (minimal 1024)
+COMPACT_RATIO = 0.125
+
+
+def _metric_values(df):
+    # Matriks N×M nilai metrik; kolom count mentah diparse jika kolom numeriknya belum ada
+    numeric = {numeric_column: column for column, numeric_column in COUNT_COLUMNS.items()}
+    columns = []
+    for name in METRICS:
+        if name in df:
+            values = df[name]
+        elif name in numeric and numeric[name] in df:
+            values, _ = parse_counts(df[numeric[name]])
+        else:
+            values = pd.Series(np.nan, index=df.index)
+        columns.append(values.to_numpy(dtype=np.float64, na_value=np.nan))
+    return np.column_stack(columns) if columns else np.empty((len(df), 0))
+
+
+def _group_values(df, column):
+    # Baris baru boleh tidak memuat semua kolom kelompok; kolom yang tidak ada dianggap NaN
+    if column == 'Status' and 'Status' not in df and 'Update' in df:
+        return catalog_status(df)
+    return df[column] if column in df else pd.Series(np.nan, index=df.index, dtype=object)
+
+
+class GroupIndex:
+    """
+    Index satu kolom kelompok: kode per baris, daftar anggota per kelompok dan agregat metrik.
+
+    Parameters:
+    values (pandas.Series): Nilai kelompok per baris; NaN tidak masuk kelompok mana pun
+    metrics (numpy.ndarray): Matriks N×M nilai metrik per baris
+
+    Attributes:
+    labels (list): Label kelompok, id kelompok = posisi di list
+    codes (numpy.ndarray): Id kelompok per baris (-1 untuk NaN)
+    counts (numpy.ndarray): Jumlah anggota per kelompok
+    sums (numpy.ndarray): Jumlah metrik per kelompok (G×M), NaN dilewati
+    valid (numpy.ndarray): Jumlah nilai metrik non-NaN per kelompok (G×M)
+    """
+
+    def __init__(self, values, metrics):
+        codes, uniques = pd.factorize(values)
+        self.labels = list(uniques)
+        self._ids = {label: i for i, label in enumerate(self.labels)}
+        self.codes = codes.astype(np.int32)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.sums = np.zeros((0, metrics.shape[1]))
+        self.valid = np.zeros((0, metrics.shape[1]), dtype=np.int64)
+        self._accumulate(self.codes, metrics)
+        self._build_members()
+
+    def __len__(self):
+        return len(self.labels)
+
+    def group_id(self, label):
+        """
+        Returns:
+        int: Id kelompok untuk label, atau None jika tidak ada
+        """
+        return self._ids.get(label)
+
+    def members(self, group_id):
+        """
+        Posisi baris anggota satu kelompok, urut sesuai posisi di katalog.
+
+        Returns:
+        numpy.ndarray: Posisi baris (int32)
+        """
+        # Kelompok yang muncul setelah CSR terakhir dibangun hanya ada di buffer
+        in_csr = group_id < len(self._offsets) - 1
+        members = self._order[self._offsets[group_id]:self._offsets[group_id + 1]] if in_csr else self._order[:0]
+        pending = self._pending.get(group_id)
+        return members if pending is None else np.concatenate([members, np.asarray(pending, dtype=np.int32)])
+
+    def means(self):
+        """
+        Returns:
+        numpy.ndarray: Rata-rata metrik per kelompok (G×M); NaN untuk kelompok tanpa nilai valid
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sums / self.valid
+
+    def add(self, values, metrics, start):
+        """
+        Tambahkan baris baru (posisi start, start + 1, ...) ke index.
+        """
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, label in enumerate(values):
+            if pd.isna(label):
+                codes[i] = -1
+                continue
+            if label not in self._ids:
+                self._ids[label] = len(self.labels)
+                self.labels.append(label)
+            codes[i] = self._ids[label]
+        self.codes = np.concatenate([self.codes, codes])
+        self._accumulate(codes, metrics)
+
+        for offset, code in enumerate(codes):
+            if code >= 0:
+                self._pending.setdefault(int(code), []).append(start + offset)
+                self._n_pending += 1
+        if self._n_pending > max(1024, COMPACT_RATIO * len(self.codes)):
+            self._build_members()
+
+    def _accumulate(self, codes, metrics):
+        n_groups = len(self.labels)
+        if len(self.counts) < n_groups:
+            grow = n_groups - len(self.counts)
+            self.counts = np.concatenate([self.counts, np.zeros(grow, dtype=np.int64)])
+            self.sums = np.vstack([self.sums, np.zeros((grow, self.sums.shape[1]))])
+            self.valid = np.vstack([self.valid, np.zeros((grow, self.valid.shape[1]), dtype=np.int64)])
+        grouped = codes >= 0
+        codes, metrics = codes[grouped], metrics[grouped]
+        self.counts += np.bincount(codes, minlength=n_groups)
+        present = ~np.isnan(metrics)
+        for m in range(metrics.shape[1]):
+            self.sums[:, m] += np.bincount(codes, weights=np.where(present[:, m], metrics[:, m], 0.0),
+                                           minlength=n_groups)
+            self.valid[:, m] += np.bincount(codes, weights=present[:, m], minlength=n_groups).astype(np.int64)
+
+    def _build_members(self):
+        # CSR anggota: posisi baris diurutkan stabil per kode, NaN (-1) dibuang
+        order = np.argsort(self.codes, kind='stable')
+        order = order[self.codes[order] >= 0]
+        self._order = order.astype(np.int32)
+        self._offsets = np.zeros(len(self.labels) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.codes[order], minlength=len(self.labels)), out=self._offsets[1:])
+        self._pending = {}
+        self._n_pending = 0
+
+
+class CatalogStats:
+    """
+    Agregat katalog untuk beberapa kolom kelompok, dibangun dalam satu pass per kolom.
+
+    Parameters:
+    df (pandas.DataFrame): Katalog webtoon; posisi baris = index item
+    columns (tuple): Kolom kelompok; 'Status' diturunkan dari Update jika belum ada
+    """
+
+    def __init__(self, df, columns=GROUP_COLUMNS):
+        metrics = _metric_values(df)
+        self.n_items = len(df)
+        self.groups = {column: GroupIndex(_group_values(df, column), metrics)
+                       for column in columns if column in df or (column == 'Status' and 'Update' in df)}
+
+    def add(self, df):
+        """
+        Tambahkan baris baru yang di-append ke akhir katalog.
+
+        Parameters:
+        df (pandas.DataFrame): Baris baru dengan kolom yang sama dengan katalog
+        """
+        metrics = _metric_values(df)
+        for column, index in self.groups.items():
+            index.add(_group_values(df, column).to_numpy(dtype=object), metrics, self.n_items)
+        self.n_items += len(df)
+
+    def members(self, column, label):
+        """
+        Posisi baris semua item dalam satu kelompok, misalnya semua karya seorang penulis.
+
+        Returns:
+        numpy.ndarray: Posisi baris; kosong jika label tidak ada
+        """
+        index = self.groups[column]
+        group_id = index.group_id(label)
+        return np.empty(0, dtype=np.int32) if group_id is None else index.members(group_id)
+
+    def group_of(self, column, position):
+        """
+        Returns:
+        object: Label kelompok item pada posisi baris tertentu, atau None untuk NaN
+        """
+        index = self.groups[column]
+        code = index.codes[position]
+        return None if code < 0 else index.labels[code]
+
+    def summary(self, column):
+        """
+        Rata-rata Likes, Subscribers dan Rating serta jumlah webtoon per kelompok, setara dengan
+        df.groupby(column).agg({... 'mean', 'id': 'count'}).
+
+        Returns:
+        pandas.DataFrame: Kolom Avg Likes, Avg Subscribers, Avg Rating dan Webtoon Count,
+                          diindex dan diurutkan menurut label kelompok
+        """
+        index = self.groups[column]
+        result = pd.DataFrame(index.means(), columns=list(METRICS.values()),
+                              index=pd.Index(index.labels, name=column))
+        result['Webtoon Count'] = index.counts
+        return result[index.counts > 0].sort_index()
+
+    def cross_counts(self, column, other, label):
+        """
+        Jumlah item per kelompok kolom `other` di dalam satu kelompok `column`, misalnya
+        distribusi genre karya seorang penulis.
+
+        Returns:
+        pandas.Series: Jumlah per label `other`, terurut menurun
+        """
+        members = self.members(column, label)
+        index = self.groups[other]
+        codes = index.codes[members]
+        codes = codes[codes >= 0]
+        counts = np.bincount(codes, minlength=len(index.labels))
+        present = np.flatnonzero(counts)
+        return pd.Series(counts[present], index=[index.labels[i] for i in present]).sort_values(
+            ascending=False, kind='stable')
+
+    def writer_style(self, writer):
+        """
+        Profil gaya penulis: genre semua karyanya digabung sesuai urutan katalog, sama dengan
+        nilai writer_genre_mapping lama, tetapi dihitung dari daftar anggota saat dibutuhkan.
+
+        Returns:
+        str: Genre dipisah spasi, atau string kosong jika penulis tidak dikenal
+        """
+        index = self.groups['Genre']
+        codes = index.codes[self.members('Writer', writer)]
+        return ' '.join(index.labels[code] for code in codes if code >= 0)
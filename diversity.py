@@ -0,0 +1,109 @@
+"""
+Re-ranking diversitas dengan maximal marginal relevance (MMR).
+
+Dari kumpulan kandidat (pool) hasil ranking biasa, item dipilih satu per satu dengan skor
+
+    lambda × relevansi - (1 - lambda) × similarity maksimum ke item yang sudah terpilih
+
+Similarity maksimum disimpan sebagai satu vektor sepanjang pool yang diperbarui secara
+incremental: setiap kali item terpilih, cukup satu perkalian matriks sparse × vektor
+antara pool dan item tersebut, sehingga biaya totalnya O(k · nnz(pool)) tanpa loop Python
+per pasangan kandidat. Batasan cakupan genre memaksa item dari genre yang belum terwakili
+dipilih saat sisa slot tinggal sebanyak genre yang masih dibutuhkan.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+# Ukuran pool kandidat default untuk re-ranking MMR
+DEFAULT_MMR_POOL = 500
+
+
+def normalize_diversity(mmr_lambda=None, min_genres=None):
+    """
+    Validasi parameter MMR dan ubah menjadi kunci yang hashable.
+
+    Parameters:
+    mmr_lambda (float, optional): Bobot relevansi di [0, 1]; 1 = ranking biasa, makin kecil
+                                  makin beragam. None mematikan MMR kecuali min_genres diisi
+    min_genres (int, optional): Jumlah genre berbeda minimum dalam hasil
+
+    Returns:
+    tuple: (mmr_lambda, min_genres), atau None jika re-ranking tidak dipakai
+
+    Raises:
+    ValueError: Jika mmr_lambda di luar [0, 1] atau min_genres bukan bilangan bulat positif
+    """
+    if mmr_lambda is None and min_genres is None:
+        return None
+    try:
+        mmr_lambda = 1.0 if mmr_lambda is None else float(mmr_lambda)
+    except (TypeError, ValueError):
+        raise ValueError(f"mmr_lambda harus berupa angka, bukan '{mmr_lambda}'.")
+    if not 0.0 <= mmr_lambda <= 1.0:
+        raise ValueError("mmr_lambda harus di antara 0 dan 1.")
+    if min_genres is not None:
+        try:
+            min_genres = int(min_genres)
+        except (TypeError, ValueError):
+            raise ValueError(f"min_genres harus bilangan bulat, bukan '{min_genres}'.")
+        if min_genres < 1:
+            raise ValueError("min_genres harus minimal 1.")
+    return mmr_lambda, min_genres
+
+
+def mmr_select(relevance, pool_vectors, k, mmr_lambda=0.7, genres=None, min_genres=None):
+    """
+    Pilih k item dari pool dengan MMR.
+
+    Parameters:
+    relevance (numpy.ndarray): Skor relevansi per item pool (terurut menurun); -inf tidak
+                               pernah dipilih
+    pool_vectors (scipy.sparse.csr_matrix atau numpy.ndarray): Baris TF-IDF (atau embedding padat)
+                                                            ternormalisasi L2 item pool (P×V)
+    k (int): Jumlah item yang dipilih
+    mmr_lambda (float): Bobot relevansi di [0, 1]
+    genres (numpy.ndarray, optional): Kode genre (bilangan bulat) per item pool
+    min_genres (int, optional): Jumlah genre berbeda minimum; butuh genres
+
+    Returns:
+    numpy.ndarray: Posisi item terpilih di pool, sesuai urutan pemilihan
+    """
+    relevance = np.asarray(relevance, dtype=np.float64)
+    available = np.isfinite(relevance)
+    k = min(k, int(available.sum()))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    max_similarity = np.zeros(len(relevance))
+    relevance_term = mmr_lambda * np.where(available, relevance, 0.0)
+    covered = None if genres is None or not min_genres else np.zeros(genres.max() + 1, dtype=bool)
+
+    sparse = sp.issparse(pool_vectors)
+    if sparse:
+        # Buffer padat satu baris TF-IDF, dipakai ulang untuk setiap item terpilih
+        dense_row = np.zeros(pool_vectors.shape[1], dtype=pool_vectors.dtype)
+        data, indices, indptr = pool_vectors.data, pool_vectors.indices, pool_vectors.indptr
+
+    selected = np.empty(k, dtype=np.int64)
+    for step in range(k):
+        eligible = available
+        if covered is not None and min_genres - covered.sum() >= k - step:
+            # Sisa slot hanya cukup untuk genre yang belum terwakili
+            uncovered = available & ~covered[genres]
+            if uncovered.any():
+                eligible = uncovered
+        scores = np.where(eligible, relevance_term - (1 - mmr_lambda) * max_similarity, -np.inf)
+        # np.argmax memilih posisi pertama, jadi seri jatuh ke item dengan relevansi tertinggi
+        chosen = int(np.argmax(scores))
+        selected[step] = chosen
+        available[chosen] = False
+        if covered is not None:
+            covered[genres[chosen]] = True
+
+        if not sparse:
+            np.maximum(max_similarity, pool_vectors @ pool_vectors[chosen], out=max_similarity)
+            continue
+        row = slice(indptr[chosen], indptr[chosen + 1])
+        dense_row[indices[row]] = data[row]
+        np.maximum(max_similarity, pool_vectors @ dense_row, out=max_similarity)
+        dense_row[indices[row]] = 0
+    return selected
@@ -0,0 +1,295 @@
+"""
+Backend embedding padat sebagai alternatif fitur TF-IDF sparse untuk similarity konten.
+
+Dua backend, keduanya berjalan lokal tanpa akses jaringan:
+
+    LSAEmbedder       TruncatedSVD atas TF-IDF (latent semantic analysis); dilatih dari
+                      katalog sendiri dan bisa disimpan/dimuat sebagai satu file .npz
+    SentenceEmbedder  Model sentence-embedding dari direktori lokal (paket opsional
+                      sentence-transformers); tidak pernah mengunduh model
+
+Vektor setiap judul dinormalisasi L2 dan disimpan float32, sehingga cosine cukup dihitung
+dengan perkalian matriks padat. EmbeddingCache menyimpan vektor di disk dengan kunci hash
+teks yang di-encode, per backend (fingerprint), sehingga fit ulang atau item baru hanya
+meng-encode ringkasan yang berubah atau belum pernah dilihat.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Panjang digest BLAKE2b kunci cache (byte)
+KEY_BYTES = 16
+
+DEFAULT_BATCH_SIZE = 256
+
+
+def text_keys(texts):
+    """
+    Kunci cache per teks: digest BLAKE2b 16 byte dari teks UTF-8.
+
+    Returns:
+    numpy.ndarray: Array bytes berdtype S16
+    """
+    return np.array([hashlib.blake2b(text.encode('utf-8'), digest_size=KEY_BYTES).digest() for text in texts],
+                    dtype=f'S{KEY_BYTES}')
+
+
+def normalize_rows(vectors):
+    """
+    Normalisasi L2 per baris dalam float32; baris nol dibiarkan nol.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+class LSAEmbedder:
+    """
+    Embedding LSA: proyeksi TF-IDF ke n_components dimensi dengan TruncatedSVD.
+
+    Parameters:
+    n_components (int): Dimensi embedding (dibatasi jumlah term dan item saat fit)
+    random_state (int): Seed TruncatedSVD
+    """
+
+    text_column = 'Content_Features'
+
+    def __init__(self, n_components=256, random_state=0):
+        self.n_components = n_components
+        self.random_state = random_state
+        self.vectorizer = None
+        self.components = None
+
+    @property
+    def is_fitted(self):
+        return self.components is not None
+
+    @property
+    def dim(self):
+        return self.components.shape[1]
+
+    @property
+    def fingerprint(self):
+        # Berubah setiap kali SVD dilatih ulang, sehingga vektor cache lama tidak terpakai
+        if not self.is_fitted:
+            return None
+        digest = hashlib.blake2b(self.components.tobytes(), digest_size=8).hexdigest()
+        return f'lsa-{self.dim}-{digest}'
+
+    def fit(self, texts, vectorizer=None, matrix=None):
+        """
+        Latih SVD atas matriks TF-IDF teks katalog.
+
+        Parameters:
+        texts (array-like): Teks yang di-encode (kolom text_column)
+        vectorizer (TfidfVectorizer, optional): Vectorizer yang sudah di-fit atas texts; jika
+                                                diberikan bersama matrix, tokenisasi tidak diulang
+        matrix (scipy.sparse.csr_matrix, optional): Hasil vectorizer.transform(texts)
+
+        Returns:
+        LSAEmbedder: Objek ini sendiri
+        """
+        if vectorizer is None or matrix is None:
+            vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32)
+            matrix = vectorizer.fit_transform(texts)
+        n_components = min(self.n_components, matrix.shape[1] - 1, matrix.shape[0] - 1)
+        svd = TruncatedSVD(n_components=n_components, random_state=self.random_state).fit(matrix)
+        self.vectorizer = vectorizer
+        self.components = np.ascontiguousarray(svd.components_.T, dtype=np.float32)
+        return self
+
+    def project(self, matrix):
+        """
+        Proyeksikan baris TF-IDF (dari vectorizer embedder ini) ke ruang LSA.
+        """
+        return np.asarray(matrix @ self.components, dtype=np.float32)
+
+    def encode(self, texts):
+        return self.project(self.vectorizer.transform(texts))
+
+    def save(self, path):
+        """
+        Simpan vocabulary, IDF dan komponen SVD ke satu file .npz.
+        """
+        np.savez(path, vocabulary=np.asarray(self.vectorizer.get_feature_names_out(), dtype=str),
+                 idf=self.vectorizer.idf_, components=self.components, random_state=self.random_state)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Muat LSAEmbedder dari file hasil save() tanpa melatih ulang.
+        """
+        with np.load(path) as arrays:
+            vocabulary = arrays['vocabulary']
+            model = cls(n_components=arrays['components'].shape[1], random_state=int(arrays['random_state']))
+            model.vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32,
+                                               vocabulary={term: i for i, term in enumerate(vocabulary)})
+            model.vectorizer.idf_ = arrays['idf']
+            model.components = arrays['components']
+        return model
+
+
+class SentenceEmbedder:
+    """
+    Model sentence-embedding lokal (sentence-transformers) atas ringkasan mentah.
+
+    Parameters:
+    model_path (str atau Path): Direktori model yang sudah diunduh sebelumnya
+    device (str, optional): Device torch, misalnya 'cpu' atau 'cuda'
+
+    Raises:
+    ValueError: Jika model_path bukan direktori
+    ImportError: Jika paket sentence-transformers tidak terpasang
+    """
+
+    text_column = 'Summary'
+    is_fitted = True
+
+    def __init__(self, model_path, device=None):
+        path = Path(model_path).resolve()
+        if not path.is_dir():
+            raise ValueError(f"'{model_path}' bukan direktori model lokal; model tidak diunduh otomatis.")
+        # Harus diset sebelum huggingface_hub di-import agar tidak ada request jaringan sama sekali
+        os.environ.setdefault('HF_HUB_OFFLINE', '1')
+        os.environ.setdefault('TRANSFORMERS_OFFLINE', '1')
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError("SentenceEmbedder membutuhkan paket sentence-transformers "
+                              "(pip install sentence-transformers).") from None
+        self.model = SentenceTransformer(str(path), device=device)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        digest = hashlib.blake2b(str(path).encode('utf-8'), digest_size=8).hexdigest()
+        self.fingerprint = f'sentence-{path.name}-{digest}'
+
+    def fit(self, texts, **kwargs):
+        return self
+
+    def encode(self, texts):
+        return self.model.encode(list(texts), batch_size=len(texts), convert_to_numpy=True,
+                                 normalize_embeddings=True, show_progress_bar=False)
+
+
+def load_embedder(spec):
+    """
+    Buat backend embedding dari spesifikasi CLI.
+
+    Parameters:
+    spec (str): 'lsa' (dilatih saat fit), path file .npz hasil LSAEmbedder.save()
+                atau direktori model sentence-transformers
+
+    Returns:
+    LSAEmbedder atau SentenceEmbedder
+    """
+    if spec == 'lsa':
+        return LSAEmbedder()
+    if str(spec).endswith('.npz'):
+        return LSAEmbedder.load(spec)
+    return SentenceEmbedder(spec)
+
+
+class EmbeddingCache:
+    """
+    Cache vektor embedding di disk, satu subdirektori per fingerprint backend.
+
+    Setiap subdirektori berisi keys.npy (kunci S16 terurut) dan vectors.npy (float32), sehingga
+    lookup banyak kunci sekaligus cukup satu np.searchsorted. File ditulis ke nama sementara
+    lalu di-rename, sehingga proses lain tidak pernah membaca cache setengah jadi.
+
+    Parameters:
+    directory (str atau Path): Direktori cache (dibuat jika belum ada)
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._stores = {}
+
+    def _store(self, fingerprint):
+        if fingerprint not in self._stores:
+            path = self.directory / fingerprint
+            if (path / 'keys.npy').exists():
+                self._stores[fingerprint] = (np.load(path / 'keys.npy'), np.load(path / 'vectors.npy'))
+            else:
+                self._stores[fingerprint] = (np.empty(0, dtype=f'S{KEY_BYTES}'), None)
+        return self._stores[fingerprint]
+
+    def get(self, fingerprint, keys):
+        """
+        Cari vektor untuk banyak kunci sekaligus.
+
+        Returns:
+        tuple: (found, vectors); found adalah mask boolean per kunci dan vectors berisi
+               vektor untuk kunci yang ditemukan saja, sesuai urutan kunci
+        """
+        stored_keys, stored_vectors = self._store(fingerprint)
+        if len(stored_keys) == 0:
+            return np.zeros(len(keys), dtype=bool), None
+        positions = np.minimum(np.searchsorted(stored_keys, keys), len(stored_keys) - 1)
+        found = stored_keys[positions] == keys
+        return found, stored_vectors[positions[found]]
+
+    def put(self, fingerprint, keys, vectors):
+        """
+        Tambahkan vektor baru lalu tulis ulang cache backend ini ke disk.
+        """
+        stored_keys, stored_vectors = self._store(fingerprint)
+        keys = np.concatenate([stored_keys, np.asarray(keys, dtype=stored_keys.dtype)])
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if stored_vectors is not None:
+            vectors = np.vstack([stored_vectors, vectors])
+        # Kunci duplikat (ditulis dua proses bersamaan) cukup disimpan sekali
+        keys, first = np.unique(keys, return_index=True)
+        vectors = vectors[first]
+
+        path = self.directory / fingerprint
+        path.mkdir(parents=True, exist_ok=True)
+        for name, array in [('vectors', vectors), ('keys', keys)]:
+            tmp = path / f'{name}.{os.getpid()}.tmp.npy'
+            np.save(tmp, array)
+            os.replace(tmp, path / f'{name}.npy')
+        self._stores[fingerprint] = (keys, vectors)
+
+
+def embed_texts(embedder, texts, cache=None, batch_size=DEFAULT_BATCH_SIZE, features=None):
+    """
+    Encode teks menjadi vektor float32 ternormalisasi L2, memakai cache jika ada.
+
+    Teks identik di-encode sekali, vektor yang sudah ada di cache tidak di-encode ulang
+    dan sisanya di-encode per batch.
+
+    Parameters:
+    embedder (LSAEmbedder atau SentenceEmbedder): Backend yang sudah di-fit
+    texts (array-like): Teks per item; NaN dianggap string kosong
+    cache (EmbeddingCache, optional): Cache disk
+    batch_size (int): Jumlah teks per panggilan encode
+    features (scipy.sparse.csr_matrix, optional): Baris TF-IDF texts dari vectorizer embedder
+                                                  LSA; jika ada, teks tidak ditokenisasi ulang
+
+    Returns:
+    tuple: (vectors, n_encoded); vectors berukuran len(texts)×dim
+    """
+    texts = pd.Series(texts, dtype=object).fillna('').astype(str).to_numpy()
+    keys, first, inverse = np.unique(text_keys(texts), return_index=True, return_inverse=True)
+    vectors = np.empty((len(keys), embedder.dim), dtype=np.float32)
+    missing = np.ones(len(keys), dtype=bool)
+    if cache is not None:
+        found, cached = cache.get(embedder.fingerprint, keys)
+        vectors[found] = cached
+        missing = ~found
+
+    todo = np.flatnonzero(missing)
+    for start in range(0, len(todo), batch_size):
+        batch = todo[start:start + batch_size]
+        if features is not None:
+            encoded = embedder.project(features[first[batch]])
+        else:
+            encoded = embedder.encode(texts[first[batch]])
+        vectors[batch] = normalize_rows(encoded)
+    if cache is not None and len(todo):
+        cache.put(embedder.fingerprint, keys[todo], vectors[todo])
+    return vectors[inverse.ravel()], len(todo)
@@ -0,0 +1,138 @@
+"""
+Filter rekomendasi (genre, status, rating minimum, subscribers minimum).
+
+Filter diterapkan sebagai mask boolean sebelum seleksi top-k, bukan dengan menyaring
+hasil top-10 setelahnya, sehingga query yang difilter tetap mengembalikan k hasil
+selama katalog memiliki cukup item yang lolos. Setiap genre dan status punya bitmap
+(array boolean) dan kolom angka disimpan sebagai array NumPy, sehingga predikat bisa
+dievaluasi hanya pada posisi kandidat (misalnya satu baris tabel tetangga) tanpa
+membangun mask untuk seluruh katalog.
+"""
+import numpy as np
+import pandas as pd
+
+from ingest import parse_counts
+
+FILTER_NAMES = ('genre', 'status', 'min_rating', 'min_subscribers')
+
+# Jumlah mask katalog penuh yang disimpan per FilterIndex
+MASK_CACHE_SIZE = 256
+
+# Aturan yang sama dengan analisis status di laporan EDA
+COMPLETED_UPDATE = 'COMPLETED'
+
+
+def normalize_filters(filters):
+    """
+    Validasi filter dan ubah menjadi kunci yang hashable (dipakai juga sebagai kunci cache).
+
+    Parameters:
+    filters (dict): genre/status (str atau list of str), min_rating dan min_subscribers (angka);
+                    nilai None diabaikan
+
+    Returns:
+    tuple: Pasangan (nama, nilai) terurut; genre dan status dinormalisasi ke huruf kecil
+
+    Raises:
+    ValueError: Jika ada nama filter yang tidak dikenal atau nilai batas bukan angka
+    """
+    unknown = set(filters) - set(FILTER_NAMES)
+    if unknown:
+        raise ValueError(f"Filter tidak dikenal: {sorted(unknown)}; pilihan: {FILTER_NAMES}.")
+
+    normalized = []
+    for name in FILTER_NAMES:
+        value = filters.get(name)
+        if value is None:
+            continue
+        if name in ('genre', 'status'):
+            values = [value] if isinstance(value, str) else list(value)
+            value = tuple(sorted({str(item).casefold() for item in values}))
+        else:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Filter {name} harus berupa angka, bukan '{value}'.")
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def catalog_status(df):
+    """
+    Kolom status webtoon ('Completed' atau 'Ongoing'); diturunkan dari Update jika belum ada.
+    """
+    if 'Status' in df:
+        return df['Status']
+    return pd.Series(np.where(df['Update'] == COMPLETED_UPDATE, 'Completed', 'Ongoing'), index=df.index)
+
+
+def _bitmaps(column):
+    codes, uniques = pd.factorize(column.astype(str).str.casefold())
+    return {value: codes == code for code, value in enumerate(uniques)}
+
+
+class FilterIndex:
+    """
+    Bitmap per genre/status dan array kolom angka untuk mengevaluasi filter.
+
+    Parameters:
+    df (pandas.DataFrame): Katalog webtoon; posisi baris = index item
+    """
+
+    def __init__(self, df):
+        self.n_items = len(df)
+        self.genre_bitmaps = _bitmaps(df['Genre'])
+        self.status_bitmaps = _bitmaps(catalog_status(df))
+        self.rating = df['Rating'].to_numpy(dtype=np.float64, na_value=np.nan)
+        if 'Subscribers_Numeric' in df:
+            subscribers = df['Subscribers_Numeric']
+        else:
+            subscribers, _ = parse_counts(df['Subscribers'])
+        self.subscribers = subscribers.to_numpy(dtype=np.float64, na_value=np.nan)
+        self._masks = {}
+
+    def matches(self, filters, positions=None):
+        """
+        Evaluasi filter pada posisi item tertentu.
+
+        Parameters:
+        filters (tuple): Hasil normalize_filters
+        positions (numpy.ndarray, optional): Posisi item (bentuk apa pun); None untuk seluruh katalog
+
+        Returns:
+        numpy.ndarray: Array boolean berbentuk sama dengan positions (atau panjang katalog)
+        """
+        if positions is None and filters in self._masks:
+            return self._masks[filters]
+
+        shape = (self.n_items,) if positions is None else np.shape(positions)
+        result = np.ones(shape, dtype=bool)
+        for name, value in filters:
+            if name == 'genre':
+                result &= self._any(self.genre_bitmaps, value, positions)
+            elif name == 'status':
+                result &= self._any(self.status_bitmaps, value, positions)
+            elif name == 'min_rating':
+                # NaN tidak pernah lolos batas minimum
+                result &= self._select(self.rating, positions) >= value
+            elif name == 'min_subscribers':
+                result &= self._select(self.subscribers, positions) >= value
+
+        if positions is None:
+            # Mask katalog penuh dipakai ulang untuk kombinasi filter yang sering muncul
+            if len(self._masks) >= MASK_CACHE_SIZE:
+                self._masks.clear()
+            self._masks[filters] = result
+        return result
+
+    def _any(self, bitmaps, values, positions):
+        shape = (self.n_items,) if positions is None else np.shape(positions)
+        result = np.zeros(shape, dtype=bool)
+        for value in values:
+            if value in bitmaps:
+                result |= self._select(bitmaps[value], positions)
+        return result
+
+    @staticmethod
+    def _select(array, positions):
+        return array if positions is None else array[positions]
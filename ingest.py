@@ -0,0 +1,270 @@
+"""
+Pemuatan dataset webtoon dalam satu kali baca CSV dengan dtype eksplisit.
+
+Kolom Likes dan Subscribers ("30.6M", "250K", "1,234") diparse secara vektor
+dengan operasi string pandas, bukan convert_to_numeric per sel. Untuk katalog yang
+lebih besar dari RAM, stream_catalog membaca CSV per chunk dan membangun TF-IDF
+dua pass tanpa pernah menyimpan seluruh kolom teks di memori.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+
+from instrumentation import NULL_INSTRUMENTATION
+
+CSV_DTYPES = {
+    'id': 'int64',
+    'Name': str,
+    'Writer': str,
+    'Likes': str,
+    'Genre': str,
+    'Rating': 'float64',
+    'Subscribers': str,
+    'Summary': str,
+    'Update': str,
+    'Reading Link': str,
+}
+
+COUNT_COLUMNS = {'Likes': 'Likes_Numeric', 'Subscribers': 'Subscribers_Numeric'}
+
+# Angka desimal biasa setelah sufiks M/K atau pemisah ribuan dibuang
+NUMBER_PATTERN = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+
+ERROR_POLICIES = ('nan', 'zero', 'raise')
+
+# Kolom teks mentah dan turunan yang tidak disimpan di katalog mode streaming
+TEXT_COLUMNS = ['Summary', 'Summary_Clean', 'Content_Features']
+
+# Karakter yang bukan huruf/angka/underscore maupun spasi diganti spasi oleh clean_summary
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+# Pemisah baris saat seluruh kolom dibersihkan sebagai satu string. Termasuk \s (str.isspace),
+# sehingga tidak dihapus pembersihan dan tidak mengubah batas token
+ROW_SEPARATOR = '\x1e'
+
+# Tabel pengganti tanda baca untuk teks ASCII (bytes.translate)
+ASCII_PUNCTUATION_TABLE = bytes(32 if PUNCTUATION_PATTERN.match(chr(i)) else i for i in range(128)) + bytes(
+    range(128, 256))
+
+
+def _parse_count_strings(text):
+    # text: nilai unik non-null; mengembalikan (float64, penanda ditolak)
+    text = text.astype('string').str.strip()
+    has_m = text.str.contains('M', regex=False).to_numpy(dtype=bool)
+    has_k = ~has_m & text.str.contains('K', regex=False).to_numpy(dtype=bool)
+
+    number = text.str.replace(',', '', regex=False)
+    number = number.mask(has_m, text.str.replace('M', '', regex=False))
+    number = number.mask(has_k, text.str.replace('K', '', regex=False))
+    valid = number.str.fullmatch(NUMBER_PATTERN).to_numpy(dtype=bool)
+
+    # Konversi object -> float64 memakai float() Python, identik dengan convert_to_numeric
+    parsed = np.full(len(text), np.nan)
+    parsed[valid] = number[valid].to_numpy(dtype=object).astype(np.float64)
+    parsed *= np.select([has_m, has_k], [1000000.0, 1000.0], 1.0)
+    return parsed, ~valid
+
+
+def parse_counts(values, on_error='nan'):
+    """
+    Parse kolom jumlah seperti "30.6M", "250K" atau "1,234" menjadi float secara vektor.
+    Hasilnya sama dengan convert_to_numeric: "M" dikali 1.000.000, "K" dikali 1.000,
+    selain itu koma dibuang. Kolom difaktorisasi lebih dulu sehingga setiap string unik
+    hanya diparse sekali.
+
+    Parameters:
+    values (pandas.Series): Kolom teks mentah
+    on_error (str): Kebijakan untuk nilai yang tidak bisa diparse:
+                    'nan' (jadi NaN), 'zero' (jadi 0) atau 'raise' (ValueError)
+
+    Returns:
+    tuple: (pandas.Series float64, pandas.Series bool penanda baris yang ditolak)
+    """
+    if on_error not in ERROR_POLICIES:
+        raise ValueError(f"on_error harus salah satu dari {ERROR_POLICIES}, bukan '{on_error}'.")
+
+    codes, uniques = pd.factorize(values)
+    unique_parsed, unique_rejected = _parse_count_strings(pd.Series(uniques, dtype=object))
+    # Kode -1 (null) jatuh ke entri terakhir: NaN dan tidak ditolak, juga saat semua nilai null
+    parsed = np.append(unique_parsed, np.nan)[codes]
+    rejected = np.append(unique_rejected, False)[codes]
+
+    if rejected.any():
+        if on_error == 'raise':
+            examples = values[rejected].head(5).tolist()
+            raise ValueError(f"{rejected.sum()} nilai tidak bisa diparse, misalnya {examples}.")
+        if on_error == 'zero':
+            parsed[rejected] = 0.0
+
+    return pd.Series(parsed, index=values.index), pd.Series(rejected, index=values.index)
+
+
+def load_catalog(path, on_error='nan', instrumentation=NULL_INSTRUMENTATION):
+    """
+    Baca dataset webtoon dengan dtype eksplisit lalu tambahkan kolom Likes_Numeric dan
+    Subscribers_Numeric dalam pass yang sama.
+
+    Parameters:
+    path (str atau Path): Path CSV dataset
+    on_error (str): Kebijakan nilai Likes/Subscribers yang tidak valid (lihat parse_counts)
+    instrumentation (Instrumentation): Penerima tahap read_csv dan parse_counts
+
+    Returns:
+    tuple: (pandas.DataFrame, dict jumlah baris yang ditolak per kolom)
+    """
+    with instrumentation.stage('read_csv') as stage:
+        df = pd.read_csv(path, dtype=CSV_DTYPES)
+        stage.count('rows', len(df))
+    rejected_rows = {}
+    with instrumentation.stage('parse_counts') as stage:
+        for column, numeric_column in COUNT_COLUMNS.items():
+            df[numeric_column], rejected = parse_counts(df[column], on_error=on_error)
+            rejected_rows[column] = int(rejected.sum())
+        stage.count('rejected', sum(rejected_rows.values()))
+    return df, rejected_rows
+
+
+def clean_missing_values(df):
+    """
+    Isi missing values pada kolom teks yang dipakai sebagai fitur konten.
+    """
+    df['Writer'] = df['Writer'].fillna('Unknown Writer')
+    df['Genre'] = df['Genre'].fillna('Uncategorized')
+    return df
+
+
+def clean_summary(text):
+    """
+    Ubah ringkasan cerita menjadi huruf kecil dan ganti tanda baca dengan spasi.
+    """
+    return PUNCTUATION_PATTERN.sub(' ', text.lower())
+
+
+def as_strings(values):
+    """
+    Nilai kolom teks sebagai list string; NaN dianggap string kosong.
+    """
+    return pd.Series(values, dtype=object).fillna('').astype(str).tolist()
+
+
+def clean_joined(values):
+    """
+    Bersihkan banyak teks sekaligus sebagai satu string yang digabung dengan ROW_SEPARATOR.
+    Hasilnya sama dengan clean_summary per teks, tetapi lower() dan penggantian tanda baca
+    masing-masing hanya satu panggilan C untuk seluruh kolom: teks ASCII lewat bytes.translate,
+    selain itu str.translate dengan tabel dari karakter unik yang muncul.
+
+    Parameters:
+    values (list of str): Teks mentah
+
+    Returns:
+    str atau None: Teks bersih yang dipisah ROW_SEPARATOR; None jika ada teks yang sudah
+                   memuat ROW_SEPARATOR sehingga batas baris tidak bisa dipulihkan
+    """
+    text = ROW_SEPARATOR.join(values)
+    if text.count(ROW_SEPARATOR) != max(len(values) - 1, 0):
+        return None
+    text = text.lower()
+    if text.isascii():
+        return text.encode('ascii').translate(ASCII_PUNCTUATION_TABLE).decode('ascii')
+    return text.translate({ord(char): ' ' for char in set(text) if PUNCTUATION_PATTERN.match(char)})
+
+
+def clean_texts(values):
+    """
+    Versi tervektorisasi clean_summary untuk seluruh kolom (lihat clean_joined).
+
+    Parameters:
+    values (array-like): Teks mentah; NaN dianggap string kosong
+
+    Returns:
+    list of str: Teks bersih per baris
+    """
+    values = as_strings(values)
+    text = clean_joined(values)
+    if text is None:
+        return [clean_summary(value) for value in values]
+    return text.split(ROW_SEPARATOR) if values else []
+
+
+def build_content_features(df):
+    """
+    Bersihkan ringkasan cerita lalu gabungkan Genre + Writer + Summary_Clean
+    menjadi kolom Content_Features untuk TF-IDF.
+    """
+    df['Summary_Clean'] = clean_texts(df['Summary'])
+    df['Content_Features'] = df['Genre'] + ' ' + df['Writer'] + ' ' + df['Summary_Clean']
+    return df
+
+
+def iter_catalog_chunks(path, chunksize=50000, on_error='nan'):
+    """
+    Baca dataset per chunk dan siapkan setiap chunk (parse Likes/Subscribers, isi missing
+    values, bangun Content_Features) sebagai generator.
+
+    Parameters:
+    path (str atau Path): Path CSV dataset
+    chunksize (int): Jumlah baris per chunk
+    on_error (str): Kebijakan nilai Likes/Subscribers yang tidak valid (lihat parse_counts)
+
+    Yields:
+    tuple: (pandas.DataFrame chunk, dict jumlah baris yang ditolak per kolom pada chunk)
+    """
+    for chunk in pd.read_csv(path, dtype=CSV_DTYPES, chunksize=chunksize):
+        rejected_rows = {}
+        for column, numeric_column in COUNT_COLUMNS.items():
+            chunk[numeric_column], rejected = parse_counts(chunk[column], on_error=on_error)
+            rejected_rows[column] = int(rejected.sum())
+        yield build_content_features(clean_missing_values(chunk)), rejected_rows
+
+
+def stream_catalog(path, make_vectorizer, chunksize=50000, on_error='nan'):
+    """
+    Bangun katalog dan matriks TF-IDF dari CSV secara streaming dengan dua pass:
+    pass pertama menghitung document frequency per term, pass kedua mentransformasi
+    setiap chunk dengan kosakata dan IDF final. Hasilnya sama dengan fit_transform
+    pada seluruh kolom Content_Features, tetapi puncak memori teks dibatasi satu chunk.
+
+    Parameters:
+    path (str atau Path): Path CSV dataset
+    make_vectorizer (callable): Factory TfidfVectorizer; menerima argumen vocabulary
+    chunksize (int): Jumlah baris per chunk
+    on_error (str): Kebijakan nilai Likes/Subscribers yang tidak valid (lihat parse_counts)
+
+    Returns:
+    tuple: (katalog tanpa kolom teks, TfidfVectorizer yang sudah fit, matriks TF-IDF,
+            dict jumlah baris yang ditolak per kolom)
+    """
+    params = make_vectorizer().get_params()
+    counter = CountVectorizer(binary=True, **{name: value for name, value in params.items()
+                                              if name in CountVectorizer().get_params() and name != 'binary'})
+
+    # Pass 1: document frequency per term dan kolom katalog non-teks
+    doc_freq = {}
+    catalog_chunks = []
+    rejected_rows = dict.fromkeys(COUNT_COLUMNS, 0)
+    for chunk, chunk_rejected in iter_catalog_chunks(path, chunksize, on_error):
+        counts = counter.fit_transform(chunk['Content_Features'])
+        chunk_freq = np.asarray(counts.sum(axis=0)).ravel()
+        for term, freq in zip(counter.get_feature_names_out(), chunk_freq):
+            doc_freq[term] = doc_freq.get(term, 0) + int(freq)
+        catalog_chunks.append(chunk.drop(columns=TEXT_COLUMNS))
+        for column, count in chunk_rejected.items():
+            rejected_rows[column] += count
+
+    catalog = pd.concat(catalog_chunks, ignore_index=True)
+    terms = sorted(doc_freq)
+    freq = np.array([doc_freq[term] for term in terms], dtype=np.int64)
+
+    # Rumus smooth IDF yang sama dengan TfidfTransformer
+    tfidf = make_vectorizer(vocabulary={term: i for i, term in enumerate(terms)})
+    tfidf.idf_ = np.log((len(catalog) + 1) / (freq + 1)) + 1
+
+    # Pass 2: transformasi per chunk dengan kosakata dan IDF final
+    blocks = [tfidf.transform(chunk['Content_Features'])
+              for chunk, _ in iter_catalog_chunks(path, chunksize, on_error)]
+    return catalog, tfidf, sp.vstack(blocks, format='csr'), rejected_rows
+
@@ -0,0 +1,380 @@
+"""
+Instrumentasi tahap pipeline dan query: timer, peak memory, counter dan sink pluggable.
+
+Setiap tahap (read_csv, parse_counts, clean_text, tfidf_fit, neighbor_table, query, ...)
+dibungkus dengan `instrumentation.stage(nama, **label)`. Saat tahap selesai, satu event
+berisi durasi, counter (misalnya k, candidates, cache_hits) dan peak RSS opsional dikirim
+ke setiap sink:
+
+    LogSink         satu baris log per event lewat modul logging
+    JSONLinesSink   satu objek JSON per baris ke file
+    PrometheusSink  agregasi per tahap dalam format teks Prometheus (endpoint /metrics)
+
+Tanpa sink, instrumentasi nonaktif: stage() mengembalikan satu context manager no-op
+yang dipakai bersama dan count() langsung kembali, sehingga jalur query tidak membuat
+objek, tidak membaca clock dan tidak menyentuh lock.
+
+Contoh:
+    from instrumentation import Instrumentation, LogSink, PrometheusSink
+
+    metrics = PrometheusSink()
+    model = WebtoonRecommender(instrumentation=Instrumentation([LogSink(), metrics], track_memory=True))
+    model.fit()
+    print(metrics.render())
+"""
+import json
+import logging
+import resource
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import wraps
+
+# Tahap yang sedang berjalan pada konteks (thread atau task asyncio) saat ini
+_active_stage = ContextVar('active_stage', default=None)
+
+# Batas atas bucket histogram durasi (detik) untuk PrometheusSink
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+
+def _status_mb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+    raise OSError(field)
+
+
+def reset_peak_rss():
+    """
+    Reset peak RSS (VmHWM) proses ini ke RSS saat ini. Hanya tersedia di Linux.
+
+    Returns:
+    bool: True jika reset berhasil
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def current_rss():
+    """
+    Returns:
+    float: RSS proses saat ini dalam MB, atau NaN jika tidak tersedia
+    """
+    try:
+        return _status_mb('VmRSS')
+    except OSError:
+        return float('nan')
+
+
+def peak_rss():
+    """
+    Returns:
+    float: Peak RSS proses dalam MB sejak reset_peak_rss() terakhir (Linux) atau sejak
+           proses dimulai (ru_maxrss di platform lain)
+    """
+    try:
+        return _status_mb('VmHWM')
+    except OSError:
+        # ru_maxrss dalam KB di Linux dan byte di macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 1024
+
+
+class _NullStage:
+    # Dipakai bersama oleh semua stage() saat instrumentasi nonaktif
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+    def count(self, name, value=1):
+        pass
+
+    def label(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """
+    Satu tahap yang sedang diukur; dibuat oleh Instrumentation.stage().
+
+    Attributes:
+    name (str): Nama tahap
+    labels (dict): Label berkardinalitas rendah (misalnya ranking, workers)
+    counters (dict): Counter numerik yang dikumpulkan selama tahap berjalan
+    """
+
+    def __init__(self, instrumentation, name, labels):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.labels = labels
+        self.counters = {}
+        self.parent = None
+        self.peak_rss_mb = None
+        self._token = None
+        self._start = None
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def label(self, name, value):
+        self.labels[name] = value
+
+    def __enter__(self):
+        self.parent = _active_stage.get()
+        self._token = _active_stage.set(self)
+        if self.instrumentation.track_memory:
+            reset_peak_rss()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - self._start
+        _active_stage.reset(self._token)
+        if self.instrumentation.track_memory:
+            # Reset di tahap anak ikut menghapus peak induknya, jadi peak anak diteruskan ke atas
+            self.peak_rss_mb = max(peak_rss(), self.peak_rss_mb or 0.0)
+            if self.parent is not None and self.parent.instrumentation is self.instrumentation:
+                self.parent.peak_rss_mb = max(self.parent.peak_rss_mb or 0.0, self.peak_rss_mb)
+        event = {
+            'timestamp': time.time(),
+            'stage': self.name,
+            'parent': self.parent.name if self.parent is not None else None,
+            'seconds': seconds,
+            'labels': self.labels,
+            'counters': self.counters,
+        }
+        if self.peak_rss_mb is not None:
+            event['peak_rss_mb'] = self.peak_rss_mb
+        if exc_type is not None:
+            event['error'] = exc_type.__name__
+        self.instrumentation.emit(event)
+        return False
+
+
+class Instrumentation:
+    """
+    Titik masuk instrumentasi yang dibagikan ke model, pipeline dan service.
+
+    Parameters:
+    sinks (iterable): Sink penerima event (objek dengan method emit(event)); kosong
+                      berarti nonaktif
+    track_memory (bool): Catat peak RSS per tahap. Peak diukur per proses, jadi hanya
+                         bermakna untuk tahap yang tidak berjalan bersamaan (fit, build)
+    """
+
+    def __init__(self, sinks=(), track_memory=False):
+        self.sinks = list(sinks)
+        self.track_memory = track_memory
+
+    @property
+    def enabled(self):
+        return bool(self.sinks)
+
+    def stage(self, name, **labels):
+        """
+        Context manager yang mengukur satu tahap dan mengirim event-nya saat selesai.
+
+        Parameters:
+        name (str): Nama tahap
+        **labels: Label berkardinalitas rendah untuk event
+
+        Returns:
+        Stage: Objek tahap dengan count(name, value) dan label(name, value), atau
+               context manager no-op saat instrumentasi nonaktif
+        """
+        if not self.sinks:
+            return _NULL_STAGE
+        return Stage(self, name, labels)
+
+    def count(self, name, value=1):
+        """
+        Tambah counter pada tahap terdalam yang sedang berjalan di konteks ini.
+        """
+        if not self.sinks:
+            return
+        stage = _active_stage.get()
+        if stage is not None:
+            stage.count(name, value)
+
+    def label(self, name, value):
+        """
+        Beri label pada tahap terdalam yang sedang berjalan di konteks ini.
+        """
+        if not self.sinks:
+            return
+        stage = _active_stage.get()
+        if stage is not None:
+            stage.label(name, value)
+
+    def emit(self, event):
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def find_sink(self, sink_type):
+        """
+        Returns:
+        object: Sink pertama bertipe sink_type, atau None
+        """
+        return next((sink for sink in self.sinks if isinstance(sink, sink_type)), None)
+
+
+# Instrumentasi nonaktif default untuk model dan fungsi yang tidak diberi instrumentasi
+NULL_INSTRUMENTATION = Instrumentation()
+
+
+def instrumented(name):
+    """
+    Decorator method: bungkus setiap panggilan dalam tahap `name` milik self.instrumentation.
+    Saat nonaktif, method asli langsung dipanggil tanpa context manager.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.instrumentation.sinks:
+                return method(self, *args, **kwargs)
+            with self.instrumentation.stage(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _format_value(value):
+    return f'{value:.6f}' if isinstance(value, float) else str(value)
+
+
+class LogSink:
+    """
+    Kirim setiap event sebagai satu baris log "stage=... seconds=... k=10 ...".
+
+    Parameters:
+    logger (logging.Logger, optional): Logger tujuan; default logger 'webtoon.instrumentation'
+    level (int): Level log
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger('webtoon.instrumentation')
+        self.level = level
+
+    def emit(self, event):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        fields = {'stage': event['stage'], 'seconds': event['seconds'], **event['labels'], **event['counters']}
+        for name in ('peak_rss_mb', 'error'):
+            if name in event:
+                fields[name] = event[name]
+        self.logger.log(self.level, ' '.join(f'{name}={_format_value(value)}' for name, value in fields.items()))
+
+
+class JSONLinesSink:
+    """
+    Tulis setiap event sebagai satu baris JSON (file dibuka dalam mode append).
+
+    Parameters:
+    path (str atau Path): File tujuan
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        line = json.dumps(event, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusSink:
+    """
+    Agregasi event per (tahap, label) menjadi metrik format teks Prometheus:
+
+        webtoon_stage_seconds           histogram durasi tahap
+        webtoon_stage_<counter>_total   jumlah counter (candidates, cache_hits, ...)
+        webtoon_stage_errors_total      tahap yang berakhir dengan exception
+        webtoon_stage_peak_rss_bytes    peak RSS terakhir per tahap (jika track_memory)
+
+    Parameters:
+    namespace (str): Prefix nama metrik
+    buckets (tuple): Batas atas bucket histogram durasi dalam detik
+    """
+
+    def __init__(self, namespace='webtoon', buckets=DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        key = (event['stage'], tuple(sorted((name, str(value)) for name, value in event['labels'].items())))
+        bucket = bisect_left(self.buckets, event['seconds'])
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0,
+                                              'count': 0, 'counters': {}, 'errors': 0, 'peak_rss_mb': None}
+            series['buckets'][bucket] += 1
+            series['sum'] += event['seconds']
+            series['count'] += 1
+            for name, value in event['counters'].items():
+                series['counters'][name] = series['counters'].get(name, 0) + value
+            if 'error' in event:
+                series['errors'] += 1
+            if 'peak_rss_mb' in event:
+                series['peak_rss_mb'] = event['peak_rss_mb']
+
+    def render(self):
+        """
+        Returns:
+        str: Seluruh metrik dalam format teks Prometheus 0.0.4
+        """
+        prefix = f'{self.namespace}_stage'
+        with self._lock:
+            series = sorted((key, {**value, 'buckets': list(value['buckets']), 'counters': dict(value['counters'])})
+                            for key, value in self._series.items())
+
+        lines = [f'# HELP {prefix}_seconds Durasi tahap pipeline atau query.',
+                 f'# TYPE {prefix}_seconds histogram']
+        counters, errors, peaks = {}, [], []
+        for (stage, labels), value in series:
+            label_text = ','.join(f'{name}="{_escape_label(label)}"' for name, label in (('stage', stage),) + labels)
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float('inf'),), value['buckets']):
+                cumulative += count
+                le = '+Inf' if upper == float('inf') else repr(upper)
+                lines.append(f'{prefix}_seconds_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_seconds_sum{{{label_text}}} {value["sum"]!r}')
+            lines.append(f'{prefix}_seconds_count{{{label_text}}} {value["count"]}')
+            for name, total in value['counters'].items():
+                counters.setdefault(name, []).append(f'{prefix}_{name}_total{{{label_text}}} {total}')
+            errors.append(f'{prefix}_errors_total{{{label_text}}} {value["errors"]}')
+            if value['peak_rss_mb'] is not None:
+                peaks.append(f'{prefix}_peak_rss_bytes{{{label_text}}} {int(value["peak_rss_mb"] * 2**20)}')
+
+        for name, samples in sorted(counters.items()):
+            lines += [f'# TYPE {prefix}_{name}_total counter'] + samples
+        lines += [f'# TYPE {prefix}_errors_total counter'] + errors
+        if peaks:
+            lines += [f'# TYPE {prefix}_peak_rss_bytes gauge'] + peaks
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,347 @@
+"""
+Materialisasi offline rekomendasi "more like this" untuk seluruh katalog.
+
+Top-k tetangga setiap judul dihitung per blok dan ditulis ke direktori output yang
+di-shard, sehingga rail standar di production cukup membaca hasil tanpa scoring per
+request. Satu direktori output berisi:
+
+    manifest.json                  Parameter job, fingerprint katalog/model dan checksum per shard
+    id_map.csv                     Posisi baris -> id katalog dan Name
+    shard-00000.neighbors.npy      Posisi tetangga (int32, S×k) untuk baris shard
+    shard-00000.scores.npy         Skor similarity (float32 atau float16, S×k)
+    shard-00000.json               Penanda shard selesai: rentang baris, checksum, waktu
+
+Dengan --format parquet (butuh pyarrow atau fastparquet), setiap shard ditulis sebagai
+shard-00000.parquet format panjang (seed_id, rank, neighbor_id, score) memakai id katalog.
+
+Shard dihitung paralel di process pool. Setiap file ditulis ke nama sementara lalu
+di-rename dan penanda shard ditulis terakhir, sehingga job yang terputus cukup dijalankan
+ulang dengan argumen yang sama: shard yang penandanya sudah ada dilewati. Jika k atau
+katalog/model berbeda dengan manifest yang ada, job berhenti kecuali --overwrite.
+
+Perintah verify memeriksa checksum setiap shard dan membandingkan sampel judul dengan
+hasil get_recommendations live dari model yang sama.
+
+Cara menjalankan:
+    python materialize.py build --artifact model/ --out mlt/ --k 50 --workers 4
+    python materialize.py build --data webtoon-dataset.csv --out mlt/ --k 20 --shard-size 10000
+    python materialize.py verify --artifact model/ --out mlt/ --sample 500
+"""
+import argparse
+import datetime
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from artifact import file_sha256
+from embeddings import load_embedder
+from precision import dequantize_scores
+from ranking import batch_top_k
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender
+
+FORMATS = ('npy', 'parquet')
+
+MANIFEST_VERSION = 1
+
+# State per proses worker shard, diisi oleh _init_worker
+_WORKER_STATE = {}
+
+
+def catalog_fingerprint(model):
+    """
+    Fingerprint katalog dan ruang fitur model: hash id, judul dan ukuran matriks fitur, plus
+    fingerprint backend embedding. Job hanya dilanjutkan jika fingerprint-nya sama.
+    """
+    columns = ['Name'] + (['id'] if 'id' in model.df else [])
+    digest = hashlib.sha256(pd.util.hash_pandas_object(model.df[columns], index=False).to_numpy().tobytes())
+    embedding = getattr(model.embedding, 'fingerprint', None) if model.embeddings is not None else None
+    digest.update(json.dumps([list(model.features.shape), model.precision, embedding]).encode())
+    return digest.hexdigest()
+
+
+def shard_name(shard):
+    return f'shard-{shard:05d}'
+
+
+def shard_files(shard, output_format):
+    if output_format == 'parquet':
+        return [f'{shard_name(shard)}.parquet']
+    return [f'{shard_name(shard)}.neighbors.npy', f'{shard_name(shard)}.scores.npy']
+
+
+def _write_atomic(path, write, mode='w'):
+    # Ditulis ke nama sementara lalu di-rename, sehingga file tidak pernah terbaca setengah jadi
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp, mode, **({} if 'b' in mode else {'encoding': 'utf-8', 'newline': ''})) as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _write_json(path, data):
+    _write_atomic(path, lambda f: json.dump(data, f, indent=2))
+
+
+def _init_worker(features, neighbor_indices, neighbor_scores, ids, options):
+    _WORKER_STATE.update(features=features, neighbor_indices=neighbor_indices, neighbor_scores=neighbor_scores,
+                         ids=ids, **options)
+
+
+def _materialize_shard(shard, start, stop):
+    # Tabel tetangga model dipakai langsung jika cukup lebar; selain itu top-k dihitung per blok
+    state = _WORKER_STATE
+    k, block_size = state['k'], state['block_size']
+    started = time.perf_counter()
+    if k <= state['neighbor_indices'].shape[1]:
+        neighbors = np.asarray(state['neighbor_indices'][start:stop, :k])
+        scores = dequantize_scores(np.asarray(state['neighbor_scores'][start:stop, :k]))
+    else:
+        neighbors, scores = batch_top_k(state['features'], np.arange(start, stop), k, block_size=block_size)
+    neighbors = neighbors.astype(np.int32)
+    scores = scores.astype(state['score_dtype'])
+
+    out = Path(state['out'])
+    files = shard_files(shard, state['format'])
+    if state['format'] == 'parquet':
+        ids = state['ids']
+        table = pd.DataFrame({
+            'seed_id': np.repeat(ids[start:stop], neighbors.shape[1]),
+            'rank': np.tile(np.arange(1, neighbors.shape[1] + 1, dtype=np.int32), stop - start),
+            'neighbor_id': ids[neighbors.ravel()],
+            'score': scores.ravel(),
+        })
+        _write_atomic(out / files[0], lambda f: table.to_parquet(f, index=False), mode='wb')
+    else:
+        for name, array in zip(files, [neighbors, scores]):
+            _write_atomic(out / name, lambda f: np.save(f, array), mode='wb')
+
+    marker = {
+        'shard': shard,
+        'rows': [start, stop],
+        'files': {name: file_sha256(out / name) for name in files},
+        'seconds': time.perf_counter() - started,
+    }
+    _write_json(out / f'{shard_name(shard)}.json', marker)
+    return marker
+
+
+def load_model(artifact=None, data=DEFAULT_DATA_PATH, neighbor_k=50, workers=1, embedding=None,
+               embedding_cache=None):
+    """
+    Muat model dari artifact (mmap, tanpa fit) atau fit dari CSV, sama dengan service.py.
+    """
+    embedding = load_embedder(embedding) if embedding else None
+    if artifact is not None:
+        return WebtoonRecommender.load(artifact, embedding=embedding, embedding_cache=embedding_cache)
+    return WebtoonRecommender(data, neighbor_k=neighbor_k, workers=workers, embedding=embedding,
+                              embedding_cache=embedding_cache).fit()
+
+
+def materialize(model, out, k=50, shard_size=50000, workers=1, output_format='npy', score_dtype='float32',
+                overwrite=False, log=print):
+    """
+    Hitung dan tulis top-k tetangga seluruh katalog ke direktori output yang di-shard.
+
+    Parameters:
+    model (WebtoonRecommender): Model yang sudah di-fit atau dimuat dari artifact
+    out (str atau Path): Direktori output
+    k (int): Jumlah tetangga per judul
+    shard_size (int): Jumlah judul acuan per shard
+    workers (int): Jumlah proses; shard dibagi ke process pool jika lebih dari 1
+    output_format (str): 'npy' atau 'parquet'
+    score_dtype (str): 'float32' atau 'float16' untuk skor format npy
+    overwrite (bool): Hapus hasil lama yang tidak cocok alih-alih berhenti
+    log (callable): Fungsi untuk mencetak progres
+
+    Returns:
+    dict: Isi manifest.json
+
+    Raises:
+    ValueError: Jika format tidak tersedia atau output lama dibuat dengan parameter berbeda
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"format harus salah satu dari {FORMATS}, bukan '{output_format}'.")
+    if output_format == 'parquet' and not any(importlib.util.find_spec(name) for name in ('pyarrow', 'fastparquet')):
+        raise ValueError("Format parquet membutuhkan paket pyarrow atau fastparquet; pakai --format npy.")
+    model._ensure_fitted()
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+
+    n_items = model.features.shape[0]
+    k = min(k, n_items - 1)
+    starts = np.arange(0, n_items, shard_size)
+    stops = np.minimum(starts + shard_size, n_items)
+    params = {
+        'format_version': MANIFEST_VERSION,
+        'n_items': int(n_items),
+        'k': int(k),
+        'shard_size': int(shard_size),
+        'format': output_format,
+        'score_dtype': score_dtype if output_format == 'npy' else 'float32',
+        'catalog_fingerprint': catalog_fingerprint(model),
+    }
+
+    manifest_path = out / 'manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+        if {name: previous.get(name) for name in params} != params:
+            if not overwrite:
+                raise ValueError(f"'{out}' berisi hasil dengan parameter atau katalog berbeda; "
+                                 "pakai --overwrite atau direktori lain.")
+            for path in out.glob('shard-*'):
+                path.unlink()
+    _write_json(manifest_path, dict(params, complete=False))
+
+    ids = model.df['id'].to_numpy() if 'id' in model.df else np.arange(n_items)
+    id_map = pd.DataFrame({'position': np.arange(n_items), 'id': ids, 'Name': model.df['Name'].to_numpy()})
+    _write_atomic(out / 'id_map.csv', lambda f: id_map.to_csv(f, index=False))
+
+    markers, pending = {}, []
+    for shard, (start, stop) in enumerate(zip(starts, stops)):
+        marker_path = out / f'{shard_name(shard)}.json'
+        if marker_path.exists() and all((out / name).exists() for name in shard_files(shard, output_format)):
+            with open(marker_path, encoding='utf-8') as f:
+                markers[shard] = json.load(f)
+        else:
+            pending.append((shard, int(start), int(stop)))
+    log(f"{len(starts)} shard, {len(markers)} sudah selesai, {len(pending)} dihitung")
+
+    initargs = (model.features, model.neighbor_indices, model.neighbor_scores, ids,
+                {'k': k, 'block_size': model.block_size, 'out': str(out), 'format': output_format,
+                 'score_dtype': params['score_dtype']})
+    started = time.perf_counter()
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+            for marker in pool.map(_materialize_shard, *zip(*pending)):
+                markers[marker['shard']] = marker
+                log(f"{shard_name(marker['shard'])}: baris {marker['rows'][0]}-{marker['rows'][1]} "
+                    f"({marker['seconds']:.2f} detik)")
+    else:
+        _init_worker(*initargs)
+        for shard, start, stop in pending:
+            marker = _materialize_shard(shard, start, stop)
+            markers[shard] = marker
+            log(f"{shard_name(shard)}: baris {start}-{stop} ({marker['seconds']:.2f} detik)")
+
+    manifest = dict(params, complete=True, created=datetime.datetime.now().isoformat(timespec='seconds'),
+                    shards=[markers[shard] for shard in range(len(starts))])
+    _write_json(manifest_path, manifest)
+    log(f"Selesai dalam {time.perf_counter() - started:.2f} detik: {n_items} judul × {k} tetangga di '{out}'")
+    return manifest
+
+
+def load_shard(out, shard, output_format='npy'):
+    """
+    Baca satu shard sebagai array posisi tetangga dan skor.
+
+    Parameters:
+    out (str atau Path): Direktori output materialize()
+    shard (int): Nomor shard
+    output_format (str): Format shard; npy dibaca memory-mapped, parquet diubah kembali
+                         dari id katalog ke posisi baris lewat id_map.csv
+
+    Returns:
+    tuple: (neighbors, scores), keduanya berukuran S×k untuk baris shard
+    """
+    out = Path(out)
+    if output_format == 'npy':
+        neighbors_file, scores_file = shard_files(shard, 'npy')
+        return np.load(out / neighbors_file, mmap_mode='r'), np.load(out / scores_file, mmap_mode='r')
+    table = pd.read_parquet(out / shard_files(shard, 'parquet')[0])
+    k = int(table['rank'].max())
+    positions = pd.Index(pd.read_csv(out / 'id_map.csv')['id']).get_indexer(table['neighbor_id'])
+    return positions.reshape(-1, k), table['score'].to_numpy().reshape(-1, k)
+
+
+def verify(model, out, sample=200, seed=0, tolerance=1e-3, log=print):
+    """
+    Periksa checksum setiap shard dan bandingkan sampel judul dengan get_recommendations live.
+
+    Parameters:
+    model (WebtoonRecommender): Model yang dipakai membangun hasil materialisasi
+    out (str atau Path): Direktori output materialize()
+    sample (int): Jumlah judul acuan yang dibandingkan
+    seed (int): Seed pemilihan sampel
+    tolerance (float): Selisih skor maksimum yang dianggap sama (float16 butuh ~1e-3)
+    log (callable): Fungsi untuk mencetak hasil
+
+    Returns:
+    dict: Jumlah shard rusak, judul yang dibandingkan dan judul yang berbeda
+    """
+    out = Path(out)
+    with open(out / 'manifest.json', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if not manifest.get('complete'):
+        raise ValueError(f"Materialisasi di '{out}' belum selesai; jalankan ulang build untuk melanjutkan.")
+    if manifest['catalog_fingerprint'] != catalog_fingerprint(model):
+        raise ValueError(f"Materialisasi di '{out}' dibangun dari katalog atau model yang berbeda.")
+
+    corrupt = [shard['shard'] for shard in manifest['shards']
+               if any(file_sha256(out / name) != digest for name, digest in shard['files'].items())]
+    for shard in corrupt:
+        log(f"{shard_name(shard)}: checksum tidak cocok")
+
+    # Hanya posisi yang menjadi hasil resolusi judulnya sendiri yang bisa dibandingkan
+    # (judul duplikat tanpa kolom id selalu di-resolve ke kemunculan pertama)
+    k, shard_size = manifest['k'], manifest['shard_size']
+    keys = model.df['id'].to_numpy() if 'id' in model.df else model.df['Name'].to_numpy()
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(manifest['n_items'], size=min(sample, manifest['n_items']), replace=False)
+    positions = [position for position in positions if model.titles.get(keys[position]) == position]
+
+    mismatched, shards = [], {}
+    for position in positions:
+        shard, row = divmod(int(position), shard_size)
+        if shard not in shards:
+            shards[shard] = load_shard(out, shard, manifest['format'])
+        neighbors, scores = (array[row] for array in shards[shard])
+        live = model.get_recommendations(keys[position], k=k)
+        if not (np.array_equal(live.index.to_numpy(), neighbors)
+                and np.allclose(live['Similarity Score'].to_numpy(), scores, atol=tolerance)):
+            mismatched.append(int(position))
+    log(f"Checksum: {len(manifest['shards']) - len(corrupt)}/{len(manifest['shards'])} shard cocok")
+    log(f"Sampel: {len(positions) - len(mismatched)}/{len(positions)} judul sama dengan get_recommendations")
+    return {'corrupt_shards': corrupt, 'compared': len(positions), 'mismatched': mismatched}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['build', 'verify'])
+    parser.add_argument('--out', required=True, help='Direktori output materialisasi')
+    parser.add_argument('--artifact', help='Direktori artifact hasil WebtoonRecommender.save()')
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH), help='CSV dataset jika tanpa artifact')
+    parser.add_argument('--neighbor-k', type=int, default=50, help='Lebar tabel tetangga saat fit dari CSV')
+    parser.add_argument('--embedding', help="Backend embedding: 'lsa', file .npz LSA atau direktori model lokal")
+    parser.add_argument('--embedding-cache', help='Direktori cache vektor embedding')
+    parser.add_argument('--k', type=int, default=50)
+    parser.add_argument('--shard-size', type=int, default=50000)
+    parser.add_argument('--workers', type=int, default=1, help='Jumlah proses untuk fit dan shard')
+    parser.add_argument('--format', choices=FORMATS, default='npy')
+    parser.add_argument('--score-dtype', choices=['float32', 'float16'], default='float32')
+    parser.add_argument('--overwrite', action='store_true', help='Timpa hasil lama dengan parameter berbeda')
+    parser.add_argument('--sample', type=int, default=200, help='Jumlah judul yang dibandingkan (verify)')
+    args = parser.parse_args()
+
+    model = load_model(args.artifact, args.data, args.neighbor_k, args.workers, args.embedding, args.embedding_cache)
+    try:
+        if args.command == 'build':
+            materialize(model, args.out, k=args.k, shard_size=args.shard_size, workers=args.workers,
+                        output_format=args.format, score_dtype=args.score_dtype, overwrite=args.overwrite)
+            return
+        result = verify(model, args.out, sample=args.sample)
+    except ValueError as error:
+        sys.exit(f"Error: {error}")
+    if result['corrupt_shards'] or result['mismatched']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
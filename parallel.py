@@ -0,0 +1,149 @@
+"""
+Pembangunan model paralel multi-core untuk fit().
+
+Dua tahap yang dominan dibagi ke process pool:
+
+1. Pembersihan ringkasan dan tokenisasi. Katalog dipecah menjadi shard berurutan;
+   setiap worker membersihkan Summary dan menghitung term per dokumen. Kosakata
+   digabung di proses utama dengan urutan kemunculan pertama yang sama seperti
+   CountVectorizer serial, sehingga matriks TF-IDF identik bit per bit.
+2. Tabel tetangga top-k. Blok baris dibagi ke worker dan setiap worker menulis
+   hasilnya langsung ke matriks output memory-mapped yang dipakai bersama.
+
+Setiap blok dihitung dengan kode yang sama dengan jalur serial, sehingga hasilnya
+deterministik dan identik dengan workers=1 berapa pun jumlah worker-nya.
+"""
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer
+
+from ingest import clean_texts
+from ranking import batch_top_k
+
+# State per proses worker tabel tetangga, diisi oleh _init_neighbor_worker
+_WORKER_STATE = {}
+
+
+def _count_shard(make_vectorizer, genres, writers, summaries):
+    # Sama dengan CountVectorizer._count_vocab: id term lokal mengikuti urutan kemunculan pertama
+    analyze = make_vectorizer().build_analyzer()
+    vocabulary = {}
+    cleaned = clean_texts(summaries)
+    j_indices, values, indptr = [], [], [0]
+    for genre, writer, summary_clean in zip(genres, writers, cleaned):
+        counter = {}
+        for term in analyze(genre + ' ' + writer + ' ' + summary_clean):
+            term_id = vocabulary.setdefault(term, len(vocabulary))
+            counter[term_id] = counter.get(term_id, 0) + 1
+        j_indices.extend(counter.keys())
+        values.extend(counter.values())
+        indptr.append(len(j_indices))
+    return (cleaned, list(vocabulary), np.array(j_indices, dtype=np.int64),
+            np.array(values, dtype=np.int64), np.array(indptr, dtype=np.int64))
+
+
+def fit_tfidf_parallel(df, make_vectorizer, workers, n_shards=None):
+    """
+    Bangun kolom Summary_Clean/Content_Features dan fit TF-IDF dengan tokenisasi paralel.
+    Hasilnya identik dengan build_content_features lalu make_vectorizer().fit_transform.
+
+    Parameters:
+    df (pandas.DataFrame): Katalog yang sudah melalui clean_missing_values
+    make_vectorizer (callable): Factory TfidfVectorizer; menerima argumen vocabulary
+    workers (int): Jumlah proses worker
+    n_shards (int, optional): Jumlah shard baris; default 4 shard per worker
+
+    Returns:
+    tuple: (DataFrame dengan kolom teks turunan, TfidfVectorizer yang sudah fit, matriks TF-IDF)
+    """
+    n_shards = max(1, min(n_shards or workers * 4, len(df)))
+    edges = np.linspace(0, len(df), n_shards + 1).astype(int)
+    columns = [df[column].tolist() for column in ('Genre', 'Writer', 'Summary')]
+    with ProcessPoolExecutor(workers) as pool:
+        shards = list(pool.map(_count_shard, repeat(make_vectorizer),
+                               *[[values[start:stop] for start, stop in zip(edges[:-1], edges[1:])]
+                                 for values in columns]))
+
+    # Id global = urutan kemunculan pertama saat shard dibaca berurutan, sama dengan jalur serial
+    vocabulary = {}
+    cleaned, indices, values, indptr = [], [], [], [np.zeros(1, dtype=np.int64)]
+    nnz = 0
+    for shard_cleaned, terms, j_indices, counts, shard_indptr in shards:
+        global_ids = np.array([vocabulary.setdefault(term, len(vocabulary)) for term in terms], dtype=np.int64)
+        cleaned.extend(shard_cleaned)
+        indices.append(global_ids[j_indices])
+        values.append(counts)
+        indptr.append(shard_indptr[1:] + nnz)
+        nnz += shard_indptr[-1]
+
+    # TfidfVectorizer langsung menyimpan count dengan dtype output-nya (parameter dtype)
+    params = make_vectorizer().get_params()
+    index_dtype = np.int32 if nnz <= np.iinfo(np.int32).max else np.int64
+    counts = sp.csr_matrix(
+        (np.concatenate(values), np.concatenate(indices).astype(index_dtype),
+         np.concatenate(indptr).astype(index_dtype)), shape=(len(df), len(vocabulary)), dtype=params['dtype'])
+    counts.sort_indices()
+
+    # Kolom diurutkan berdasarkan nama term seperti CountVectorizer._sort_features
+    terms = sorted(vocabulary)
+    map_index = np.empty(len(terms), dtype=counts.indices.dtype)
+    map_index[[vocabulary[term] for term in terms]] = np.arange(len(terms))
+    counts.indices = map_index.take(counts.indices)
+
+    transformer = TfidfTransformer(norm=params['norm'], use_idf=params['use_idf'],
+                                   smooth_idf=params['smooth_idf'], sublinear_tf=params['sublinear_tf'])
+    tfidf_matrix = transformer.fit(counts).transform(counts, copy=False)
+    tfidf = make_vectorizer(vocabulary={term: i for i, term in enumerate(terms)})
+    tfidf.idf_ = transformer.idf_
+
+    df['Summary_Clean'] = cleaned
+    df['Content_Features'] = df['Genre'] + ' ' + df['Writer'] + ' ' + df['Summary_Clean']
+    return df, tfidf, tfidf_matrix
+
+
+def _init_neighbor_worker(tfidf_matrix, output_dir):
+    _WORKER_STATE['tfidf_matrix'] = tfidf_matrix
+    _WORKER_STATE['indices'] = np.load(Path(output_dir) / 'neighbor_indices.npy', mmap_mode='r+')
+    _WORKER_STATE['scores'] = np.load(Path(output_dir) / 'neighbor_scores.npy', mmap_mode='r+')
+
+
+def _neighbor_block(start, stop, k):
+    top, top_scores = batch_top_k(_WORKER_STATE['tfidf_matrix'], np.arange(start, stop), k,
+                                  block_size=stop - start)
+    _WORKER_STATE['indices'][start:stop] = top
+    _WORKER_STATE['scores'][start:stop] = top_scores
+
+
+def build_neighbor_table_parallel(tfidf_matrix, k=50, block_size=1024, workers=2):
+    """
+    Versi paralel ranking.build_neighbor_table. Setiap blok baris dihitung oleh satu worker
+    dan ditulis ke file .npy memory-mapped bersama, lalu disalin ke memori proses utama.
+
+    Parameters:
+    tfidf_matrix (scipy.sparse.csr_matrix): Matriks TF-IDF
+    k (int): Jumlah tetangga yang disimpan untuk setiap webtoon
+    block_size (int): Jumlah baris per blok (satu task worker)
+    workers (int): Jumlah proses worker
+
+    Returns:
+    tuple: (neighbor_indices, neighbor_scores), identik dengan build_neighbor_table
+    """
+    n_items = tfidf_matrix.shape[0]
+    k = min(k, n_items - 1)
+    starts = np.arange(0, n_items, block_size)
+    stops = np.minimum(starts + block_size, n_items)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        indices = np.lib.format.open_memmap(Path(output_dir) / 'neighbor_indices.npy', mode='w+',
+                                            dtype=np.int64, shape=(n_items, k))
+        scores = np.lib.format.open_memmap(Path(output_dir) / 'neighbor_scores.npy', mode='w+',
+                                           dtype=tfidf_matrix.dtype, shape=(n_items, k))
+        with ProcessPoolExecutor(workers, initializer=_init_neighbor_worker,
+                                 initargs=(tfidf_matrix, output_dir)) as pool:
+            list(pool.map(_neighbor_block, starts, stops, repeat(k)))
+        return np.array(indices), np.array(scores)
@@ -0,0 +1,84 @@
+"""
+Mode presisi penyimpanan model rekomendasi.
+
+Skor similarity hanya ditampilkan 2-4 desimal, sehingga model bisa disimpan lebih
+ringkas tanpa mengubah urutan rekomendasi:
+
+    'float64'  Default; matriks TF-IDF float64, tabel tetangga int64/float64
+    'float32'  Matriks TF-IDF dan skor float32, index int32
+    'float16'  Seperti float32, tetapi skor tabel tetangga float16
+    'int8'     Seperti float32, tetapi skor tabel tetangga dikuantisasi ke int8
+               (skor cosine TF-IDF selalu di [0, 1], disimpan sebagai round(skor × 127);
+               skor embedding negatif disimpan sebagai 0)
+
+Urutan tabel tetangga dihitung sebelum skor dipadatkan, sehingga kuantisasi tidak
+mengubah urutan rekomendasi dari tabel.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+PRECISIONS = ('float64', 'float32', 'float16', 'int8')
+
+INT8_SCALE = 127
+
+
+def check_precision(precision):
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision harus salah satu dari {PRECISIONS}, bukan '{precision}'.")
+
+
+def matrix_dtype(precision):
+    """
+    Dtype matriks TF-IDF; float16 dan int8 hanya berlaku untuk skor tabel tetangga.
+    """
+    return np.float64 if precision == 'float64' else np.float32
+
+
+def index_dtype(precision):
+    return np.int64 if precision == 'float64' else np.int32
+
+
+def quantize_scores(scores, precision):
+    """
+    Ubah skor float ke dtype penyimpanan tabel tetangga.
+    """
+    if precision == 'int8':
+        return np.round(np.clip(scores, 0, 1) * INT8_SCALE).astype(np.int8)
+    if precision == 'float64':
+        return np.asarray(scores, dtype=np.float64)
+    return np.asarray(scores, dtype=np.float16 if precision == 'float16' else np.float32)
+
+
+def dequantize_scores(stored):
+    """
+    Kembalikan skor tabel tetangga ke float; dtype penyimpanan menentukan caranya.
+    """
+    if stored.dtype == np.int8:
+        return stored.astype(np.float32) / INT8_SCALE
+    return stored
+
+
+def score_tolerance(dtype):
+    """
+    Selisih maksimum antara skor tersimpan dan skor eksak. Untuk tabel float16/int8,
+    penambalan incremental memakai batas ini agar tidak melewatkan baris yang terdampak.
+    """
+    if dtype == np.int8:
+        return 0.5 / INT8_SCALE
+    if dtype == np.float16:
+        # Skor di [0, 1]: galat pembulatan float16 paling besar 2^-11
+        return 2.0 ** -11
+    return 0.0
+
+
+def nbytes(value):
+    """
+    Ukuran sebuah struktur model dalam byte (array NumPy, matriks sparse atau DataFrame).
+    """
+    if value is None:
+        return 0
+    if sp.issparse(value):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if hasattr(value, 'memory_usage'):
+        return int(np.sum(value.memory_usage(index=True, deep=True)))
+    return np.asarray(value).nbytes
@@ -0,0 +1,143 @@
+"""
+Prior popularitas dan rating untuk ranking hybrid.
+
+Skor hybrid setiap kandidat adalah
+
+    w_similarity × cosine + w_popularity × popularity + w_rating × rating
+
+dengan popularity (rata-rata log Likes dan log Subscribers) dan rating dinormalisasi
+min-max ke [0, 1]. Dua suku terakhir tidak bergantung pada judul acuan, sehingga
+dijumlahkan sekali menjadi satu vektor bias per kombinasi bobot; per query blending
+hanya berupa satu ekspresi vektor `scale × similarity + bias`.
+
+Nilai yang hilang (NaN) mendapat prior 0.
+"""
+import numpy as np
+
+from ingest import COUNT_COLUMNS, parse_counts
+
+HYBRID_COMPONENTS = ('similarity', 'popularity', 'rating')
+
+# Cosine TF-IDF antar webtoon umumnya di bawah 0.3, sehingga bobot prior dibuat kecil
+# agar prior hanya menggeser urutan kandidat yang kemiripannya berdekatan (dengan bobot ini
+# seluruh query top-10 pada dataset masih terlayani dari tabel tetangga)
+DEFAULT_HYBRID_WEIGHTS = {'similarity': 1.0, 'popularity': 0.02, 'rating': 0.05}
+
+RANKINGS = ('similarity', 'hybrid')
+
+
+def check_ranking(ranking):
+    if ranking not in RANKINGS:
+        raise ValueError(f"ranking harus salah satu dari {RANKINGS}, bukan '{ranking}'.")
+
+
+def normalize_weights(weights):
+    """
+    Validasi bobot hybrid dan ubah menjadi kunci yang hashable.
+
+    Parameters:
+    weights (dict): Bobot 'similarity', 'popularity' dan 'rating'; komponen yang tidak
+                    diisi berbobot 0
+
+    Returns:
+    tuple: Pasangan (komponen, bobot) sesuai urutan HYBRID_COMPONENTS
+
+    Raises:
+    ValueError: Jika ada komponen yang tidak dikenal atau bobot bukan angka non-negatif
+    """
+    unknown = set(weights) - set(HYBRID_COMPONENTS)
+    if unknown:
+        raise ValueError(f"Komponen bobot tidak dikenal: {sorted(unknown)}; pilihan: {HYBRID_COMPONENTS}.")
+
+    normalized = []
+    for name in HYBRID_COMPONENTS:
+        try:
+            value = float(weights.get(name, 0.0))
+        except (TypeError, ValueError):
+            raise ValueError(f"Bobot {name} harus berupa angka, bukan '{weights[name]}'.")
+        if not value >= 0:
+            raise ValueError(f"Bobot {name} tidak boleh negatif.")
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def minmax(values):
+    """
+    Skala min-max ke [0, 1]; NaN menjadi 0 dan kolom konstan menjadi 0.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.zeros(len(values))
+    low, high = values[finite].min(), values[finite].max()
+    scaled = (values - low) / (high - low) if high > low else np.zeros(len(values))
+    return np.where(finite, scaled, 0.0)
+
+
+class HybridPriors:
+    """
+    Vektor prior popularity dan rating per item, dihitung sekali per versi katalog.
+
+    Parameters:
+    df (pandas.DataFrame): Katalog webtoon; posisi baris = index item
+    """
+
+    def __init__(self, df):
+        counts = []
+        for column, numeric_column in COUNT_COLUMNS.items():
+            if numeric_column in df:
+                values = df[numeric_column]
+            else:
+                values, _ = parse_counts(df[column])
+            counts.append(minmax(np.log1p(values.to_numpy(dtype=np.float64, na_value=np.nan))))
+        self.popularity = np.mean(counts, axis=0)
+        self.rating = minmax(df['Rating'].to_numpy(dtype=np.float64, na_value=np.nan))
+        self._bias = {}
+
+    def bias(self, weights, dtype=np.float64):
+        """
+        Vektor w_popularity × popularity + w_rating × rating untuk satu kombinasi bobot.
+
+        Parameters:
+        weights (tuple): Hasil normalize_weights
+        dtype (numpy.dtype): Dtype skor similarity (mengikuti matriks TF-IDF)
+
+        Returns:
+        tuple: (bias, nilai bias maksimum); bias berupa array berdtype sama dengan skor
+        """
+        key = (weights, np.dtype(dtype))
+        if key not in self._bias:
+            weight = dict(weights)
+            bias = (weight['popularity'] * self.popularity + weight['rating'] * self.rating).astype(dtype)
+            self._bias[key] = (bias, float(bias.max(initial=0.0)))
+        return self._bias[key]
+
+
+def rank_table(neighbor_indices, neighbor_scores, bias, bias_max, scale=1.0, complete=False):
+    """
+    Urutkan ulang tabel tetangga berdasarkan skor hybrid, sekali per kombinasi bobot.
+
+    Item di luar tabel berskor paling tinggi scale × skor terakhir tabel + bias maksimum,
+    sehingga entri tabel yang skor hybrid-nya melebihi batas itu pasti sama dengan hasil
+    seleksi top-k pada baris similarity penuh.
+
+    Parameters:
+    neighbor_indices, neighbor_scores (numpy.ndarray): Tabel tetangga N×W (skor float)
+    bias (numpy.ndarray): Hasil HybridPriors.bias
+    bias_max (float): Nilai bias maksimum
+    scale (float): Bobot similarity
+    complete (bool): True jika tabel sudah memuat seluruh katalog (W = N - 1)
+
+    Returns:
+    tuple: (indices, scores, exact) — tabel N×W terurut dari skor hybrid tertinggi (seri
+           berdasarkan index terkecil) dan jumlah entri awal per baris yang dijamin eksak
+    """
+    scores = scale * neighbor_scores + bias[neighbor_indices]
+    order = np.lexsort((neighbor_indices, -scores))
+    indices = np.take_along_axis(neighbor_indices, order, axis=1)
+    scores = np.take_along_axis(scores, order, axis=1)
+    if complete:
+        exact = np.full(len(indices), indices.shape[1])
+    else:
+        exact = (scores > (scale * neighbor_scores[:, -1:] + bias_max)).sum(axis=1)
+    return indices, scores, exact
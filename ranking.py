@@ -0,0 +1,212 @@
+"""
+Fungsi ranking top-k untuk sistem rekomendasi webtoon.
+
+Modul ini tidak membaca dataset maupun membuat visualisasi, sehingga aman
+di-import oleh script lain (benchmark, service, dll).
+"""
+import numpy as np
+import scipy.sparse as sp
+
+
+def dot_similarity(rows, tfidf_matrix):
+    """
+    Cosine similarity antara beberapa baris dan seluruh katalog. Baris TF-IDF sudah
+    ternormalisasi L2, sehingga cukup dot product tanpa menghitung ulang norma seperti
+    cosine_similarity. Dtype hasil mengikuti matriks (float32 pada mode presisi ringkas).
+    Matriks embedding padat (lihat embeddings.py) juga diterima.
+    
+    Parameters:
+    rows (scipy.sparse matrix atau numpy.ndarray): Baris TF-IDF acuan (M×V)
+    tfidf_matrix (scipy.sparse.csr_matrix atau numpy.ndarray): Matriks TF-IDF katalog (N×V)
+    
+    Returns:
+    numpy.ndarray: Matriks similarity padat berukuran M×N
+    """
+    scores = rows @ tfidf_matrix.T
+    return scores.toarray() if sp.issparse(scores) else np.asarray(scores)
+
+
+def paired_similarity(rows_a, rows_b):
+    """
+    Cosine antar pasangan baris: baris ke-i rows_a dengan baris ke-i rows_b.
+    
+    Returns:
+    numpy.ndarray: Skor per pasangan (1-D)
+    """
+    if sp.issparse(rows_a):
+        return np.asarray(rows_a.multiply(rows_b).sum(axis=1)).ravel()
+    return np.einsum('ij,ij->i', rows_a, rows_b)
+
+
+def top_k(scores, k, exclude=None):
+    """
+    Ambil k skor tertinggi dengan seleksi parsial NumPy (np.argpartition).
+    Hanya k kandidat terpilih yang diurutkan, sehingga biaya per baris O(N + k log k).
+    
+    Parameters:
+    scores (numpy.ndarray): Baris similarity (1-D) atau blok baris (2-D); diubah in-place
+                            jika exclude diberikan
+    k (int): Jumlah item yang dikembalikan per baris
+    exclude (int atau array-like, optional): Index item yang dikeluarkan per baris,
+                                             misalnya webtoon acuan itu sendiri
+    
+    Returns:
+    tuple: (top_indices, top_scores) terurut dari skor tertinggi;
+           skor yang sama diurutkan berdasarkan index terkecil
+    """
+    one_dim = scores.ndim == 1
+    scores = np.atleast_2d(scores)
+    
+    if exclude is not None:
+        # Keluarkan berdasarkan index, bukan membuang posisi pertama hasil sort,
+        # karena judul duplikat juga bisa memiliki skor 1.0
+        scores[np.arange(scores.shape[0]), exclude] = -np.inf
+    
+    n_candidates = scores.shape[1] - (exclude is not None)
+    k = min(k, n_candidates)
+    if k <= 0:
+        top = np.empty((scores.shape[0], 0), dtype=np.int64)
+        top_scores = np.empty((scores.shape[0], 0), dtype=scores.dtype)
+    else:
+        # Nilai ambang skor ke-k; dari item dengan skor sama di ambang tersebut dipilih
+        # index terkecil, sama seperti sorted() yang stabil pada jalur matriks penuh
+        threshold = -np.partition(-scores, k - 1, axis=1)[:, k - 1:k]
+        above = scores > threshold
+        ties = scores == threshold
+        n_ties = k - above.sum(axis=1, keepdims=True)
+        selected = above | (ties & (np.cumsum(ties, axis=1) <= n_ties))
+        top = np.nonzero(selected)[1].reshape(-1, k)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.lexsort((top, -top_scores))
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+    
+    if one_dim:
+        return top[0], top_scores[0]
+    return top, top_scores
+
+
+def batch_top_k(tfidf_matrix, seed_indices, k, block_size=1024, mask=None, bias=None, scale=1.0):
+    """
+    Hitung top-k untuk banyak webtoon acuan sekaligus. Setiap blok acuan diproses
+    dengan satu perkalian matriks sparse, lalu diseleksi dengan top_k.
+    
+    Parameters:
+    tfidf_matrix (scipy.sparse.csr_matrix): Matriks TF-IDF ternormalisasi L2
+    seed_indices (array-like): Index baris webtoon acuan
+    k (int): Jumlah rekomendasi per webtoon acuan
+    block_size (int): Jumlah webtoon acuan yang dihitung dalam satu blok
+    mask (numpy.ndarray, optional): Array boolean per item; item bernilai False tidak
+                                    pernah dipilih (skornya -inf jika kandidat kurang dari k)
+    bias (numpy.ndarray, optional): Skor tambahan per item; item diranking berdasarkan
+                                    scale × similarity + bias (lihat priors.py)
+    scale (float): Bobot similarity, hanya dipakai jika bias diberikan
+    
+    Returns:
+    tuple: (top_indices, top_scores), keduanya berukuran len(seed_indices)×k
+    """
+    seed_indices = np.asarray(seed_indices, dtype=np.int64)
+    k = min(k, tfidf_matrix.shape[0] - 1)
+    top_indices = np.empty((len(seed_indices), k), dtype=np.int64)
+    top_scores = np.empty((len(seed_indices), k), dtype=tfidf_matrix.dtype)
+    
+    for start in range(0, len(seed_indices), block_size):
+        seeds = seed_indices[start:start + block_size]
+        block = dot_similarity(tfidf_matrix[seeds], tfidf_matrix)
+        if bias is not None:
+            # In-place agar blending tidak membuat salinan blok
+            block *= scale
+            block += bias
+        if mask is not None:
+            block[:, ~mask] = -np.inf
+        top_indices[start:start + len(seeds)], top_scores[start:start + len(seeds)] = top_k(
+            block, k, exclude=seeds)
+    
+    return top_indices, top_scores
+
+
+def profile_top_k(tfidf_matrix, history, k, block_size=1024, mask=None):
+    """
+    Hitung top-k untuk profil pengguna. Profil adalah centroid berbobot dari baris TF-IDF
+    judul yang sudah dibaca (history @ tfidf_matrix, tetap sparse) yang dinormalisasi L2,
+    sehingga skornya adalah cosine terhadap centroid. Setiap blok pengguna diproses dengan
+    satu perkalian matriks sparse, sama seperti batch_top_k.
+    
+    Parameters:
+    tfidf_matrix (scipy.sparse.csr_matrix): Matriks TF-IDF ternormalisasi L2 (N×V)
+    history (scipy.sparse.csr_matrix): Bobot bacaan pengguna×item (U×N); item yang
+                                       tersimpan di sini tidak pernah direkomendasikan
+    k (int): Jumlah rekomendasi per pengguna
+    block_size (int): Jumlah pengguna yang dihitung dalam satu blok
+    mask (numpy.ndarray, optional): Array boolean per item, sama dengan batch_top_k
+    
+    Returns:
+    tuple: (top_indices, top_scores), keduanya berukuran U×k; jika kandidat kurang dari k,
+           sisa posisinya berskor -inf
+    """
+    history = history.tocsr().astype(tfidf_matrix.dtype)
+    k = min(k, tfidf_matrix.shape[0])
+    top_indices = np.empty((history.shape[0], k), dtype=np.int64)
+    top_scores = np.empty((history.shape[0], k), dtype=tfidf_matrix.dtype)
+    
+    for start in range(0, history.shape[0], block_size):
+        rows = history[start:start + block_size]
+        if sp.issparse(tfidf_matrix):
+            profiles = (rows @ tfidf_matrix).tocsr()
+            norms = np.sqrt(np.asarray(profiles.multiply(profiles).sum(axis=1)).ravel())
+            norms[norms == 0] = 1
+            profiles.data /= np.repeat(norms, np.diff(profiles.indptr))
+        else:
+            profiles = np.asarray(rows @ tfidf_matrix)
+            norms = np.linalg.norm(profiles, axis=1, keepdims=True)
+            norms[norms == 0] = 1
+            profiles /= norms
+        
+        block = dot_similarity(profiles, tfidf_matrix)
+        # Judul yang sudah dibaca dikeluarkan berdasarkan posisi, termasuk yang berbobot 0
+        block[np.repeat(np.arange(rows.shape[0]), np.diff(rows.indptr)), rows.indices] = -np.inf
+        if mask is not None:
+            block[:, ~mask] = -np.inf
+        top_indices[start:start + len(block)], top_scores[start:start + len(block)] = top_k(block, k)
+    
+    return top_indices, top_scores
+
+
+def build_neighbor_table(tfidf_matrix, k=50, block_size=1024):
+    """
+    Hitung k tetangga paling mirip untuk setiap webtoon langsung dari matriks TF-IDF sparse.
+    Similarity dihitung per blok baris sehingga memori tumbuh O(N·k), bukan O(N²).
+    
+    Parameters:
+    tfidf_matrix (scipy.sparse.csr_matrix): Matriks TF-IDF
+    k (int): Jumlah tetangga yang disimpan untuk setiap webtoon
+    block_size (int): Jumlah baris yang dihitung dalam satu blok
+    
+    Returns:
+    tuple: (neighbor_indices, neighbor_scores), keduanya berukuran N×k dan terurut
+           dari skor tertinggi; seri diurutkan berdasarkan index terkecil
+    """
+    return batch_top_k(tfidf_matrix, np.arange(tfidf_matrix.shape[0]), k, block_size=block_size)
+
+
+def merge_top_k(indices_a, scores_a, indices_b, scores_b, k):
+    """
+    Gabungkan dua daftar kandidat per baris dan ambil k skor tertinggi.
+    Dipakai untuk menambal tabel tetangga saat ada webtoon baru tanpa menghitung ulang
+    seluruh baris similarity.
+    
+    Parameters:
+    indices_a, scores_a (numpy.ndarray): Kandidat pertama, berukuran M×a
+    indices_b, scores_b (numpy.ndarray): Kandidat kedua, berukuran M×b
+    k (int): Jumlah item yang dikembalikan per baris
+    
+    Returns:
+    tuple: (top_indices, top_scores) terurut dari skor tertinggi;
+           skor yang sama diurutkan berdasarkan index item terkecil
+    """
+    indices = np.hstack([indices_a, indices_b])
+    scores = np.hstack([scores_a, scores_b])
+    
+    # Jumlah kandidat per baris kecil (k + item baru), jadi cukup diurutkan penuh
+    order = np.lexsort((indices, -scores))[:, :k]
+    return np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
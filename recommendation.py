@@ -37,12 +37,22 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-import re
+from recommender import WebtoonRecommender
+from evaluation import evaluate_model
+from ingest import CSV_DTYPES, build_content_features, clean_missing_values, parse_counts
+from instrumentation import Instrumentation, LogSink
+from catalog_stats import CatalogStats
+from embeddings import LSAEmbedder
+import logging
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
+# Waktu, peak memory dan counter setiap tahap pipeline dicetak sebagai satu baris log
+logging.basicConfig(level=logging.INFO, format='[tahap] %(message)s')
+instrumentation = Instrumentation([LogSink()], track_memory=True)
+
 # Cell 3: Data Understanding
 """
 #### 2. Data Understanding
@@ -70,7 +80,8 @@ Dataset yang digunakan dalam proyek ini adalah Webtoon Comics Dataset yang terse
 """
 
 # Cell 4: Data Loading
-df = pd.read_csv('webtoon-dataset.csv')
+with instrumentation.stage('read_csv'):
+    df = pd.read_csv('webtoon-dataset.csv', dtype=CSV_DTYPES)
 
 # Display basic information
 print("Jumlah data:", len(df))
@@ -136,23 +147,15 @@ plt.tight_layout()
 plt.show()
 
 # 3.5 Popularity Analysis
-def convert_to_numeric(value):
-    if isinstance(value, str):
-        value = value.strip()
-        if 'M' in value:
-            return float(value.replace('M', '')) * 1000000
-        elif 'K' in value:
-            return float(value.replace('K', '')) * 1000
-        else:
-            try:
-                return float(value.replace(',', ''))
-            except:
-                return None
-    return value
-
-# Create clean numeric columns
-df['Likes_Numeric'] = df['Likes'].apply(convert_to_numeric)
-df['Subscribers_Numeric'] = df['Subscribers'].apply(convert_to_numeric)
+# Create clean numeric columns ("30.6M" / "250K" / "1,234" -> angka, diparse secara vektor)
+with instrumentation.stage('parse_counts'):
+    df['Likes_Numeric'], likes_rejected = parse_counts(df['Likes'])
+    df['Subscribers_Numeric'], subscribers_rejected = parse_counts(df['Subscribers'])
+print(f"\nNilai yang tidak bisa diparse: Likes={likes_rejected.sum()}, Subscribers={subscribers_rejected.sum()}")
+
+# Agregat per genre, jadwal update, status dan penulis dibangun sekali (lihat catalog_stats.py)
+with instrumentation.stage('catalog_stats'):
+    stats = CatalogStats(df)
 
 # Top Webtoons by Likes
 top_likes = df.sort_values(by='Likes_Numeric', ascending=False).head(10)
@@ -170,14 +173,7 @@ print("\nTop 10 Highest-Rated Popular Webtoons (min 100K subscribers):")
 print(top_rated[['Name', 'Genre', 'Rating', 'Subscribers', 'Likes']].reset_index(drop=True))
 
 # Genre Popularity Analysis
-genre_popularity = df.groupby('Genre').agg({
-    'Likes_Numeric': 'mean',
-    'Subscribers_Numeric': 'mean',
-    'Rating': 'mean',
-    'id': 'count'
-}).sort_values(by='Subscribers_Numeric', ascending=False)
-
-genre_popularity.columns = ['Avg Likes', 'Avg Subscribers', 'Avg Rating', 'Webtoon Count']
+genre_popularity = stats.summary('Genre').sort_values(by='Avg Subscribers', ascending=False)
 print("\nGenre Popularity (Sorted by Average Subscribers):")
 print(genre_popularity.head(10))
 
@@ -187,42 +183,21 @@ correlation = df[['Likes_Numeric', 'Subscribers_Numeric', 'Rating']].corr()
 print(correlation)
 
 # Update Schedule vs. Popularity
-update_popularity = df.groupby('Update').agg({
-    'Likes_Numeric': 'mean',
-    'Subscribers_Numeric': 'mean',
-    'Rating': 'mean',
-    'id': 'count'
-}).sort_values(by='Subscribers_Numeric', ascending=False)
-
-update_popularity.columns = ['Avg Likes', 'Avg Subscribers', 'Avg Rating', 'Webtoon Count']
+update_popularity = stats.summary('Update').sort_values(by='Avg Subscribers', ascending=False)
 print("\nUpdate Schedule vs. Popularity (Sorted by Average Subscribers):")
 print(update_popularity.head(10))
 
 # Status Analysis (Completed vs. Ongoing)
 df['Status'] = df['Update'].apply(lambda x: 'Completed' if x == 'COMPLETED' else 'Ongoing')
-status_popularity = df.groupby('Status').agg({
-    'Likes_Numeric': 'mean',
-    'Subscribers_Numeric': 'mean',
-    'Rating': 'mean',
-    'id': 'count'
-})
-
-status_popularity.columns = ['Avg Likes', 'Avg Subscribers', 'Avg Rating', 'Webtoon Count']
+status_popularity = stats.summary('Status')
 print("\nCompleted vs. Ongoing Webtoons Popularity:")
 print(status_popularity)
 
 # Writer Popularity (top writers with multiple webtoons)
-writer_counts = df['Writer'].value_counts()
-top_writers = writer_counts[writer_counts > 1].index.tolist()
-if top_writers:
-    writer_popularity = df[df['Writer'].isin(top_writers)].groupby('Writer').agg({
-        'Likes_Numeric': 'mean',
-        'Subscribers_Numeric': 'mean',
-        'Rating': 'mean',
-        'id': 'count'
-    }).sort_values(by='Subscribers_Numeric', ascending=False)
-    
-    writer_popularity.columns = ['Avg Likes', 'Avg Subscribers', 'Avg Rating', 'Webtoon Count']
+writer_popularity = stats.summary('Writer')
+writer_popularity = writer_popularity[writer_popularity['Webtoon Count'] > 1].sort_values(
+    by='Avg Subscribers', ascending=False)
+if len(writer_popularity):
     print("\nTop Writers with Multiple Webtoons (by Average Subscribers):")
     print(writer_popularity.head(10))
 
@@ -324,8 +299,7 @@ print("\nRows with Missing Values:")
 print(missing_rows)
 
 # Isi Missing Values dengan 'Unknown'
-df['Writer'] = df['Writer'].fillna('Unknown Writer')
-df['Genre'] = df['Genre'].fillna('Uncategorized')
+df = clean_missing_values(df)
 df['Subscribers_Numeric'] = df['Subscribers_Numeric'].fillna(0)
 
 print("\nMissing values after Cleaning:")
@@ -336,27 +310,33 @@ print(df[['Name', 'Writer', 'Genre', 'Likes_Numeric', 'Subscribers_Numeric']].he
 
 # 4.2 Feature Engineering
 print("\n4.2.1 Text Preprocessing untuk Ringkasan")
-# Clean and process summary text
-df['Summary_Clean'] = df['Summary'].fillna('').apply(lambda x: re.sub(r'[^\w\s]', ' ', x.lower()))
-
 print("\n4.2.2 Penggabungan Fitur untuk Representasi Konten")
-# Create a single rich feature combining multiple attributes
-df['Content_Features'] = df['Genre'] + ' ' + df['Writer'] + ' ' + df['Summary_Clean']
+# Clean summary text, then combine Genre + Writer + Summary_Clean into Content_Features
+with instrumentation.stage('clean_text'):
+    df = build_content_features(df)
 
 print("\n4.2.3 Profil Gaya Penulis")
-# Create writer style profiles based on their existing works
-writer_genre_mapping = df.groupby('Writer')['Genre'].agg(lambda x: ' '.join(x)).to_dict()
-df['Writer_Style'] = df['Writer'].map(writer_genre_mapping)
+# Profil gaya penulis (genre semua karyanya) dibaca dari index penulis saat dibutuhkan,
+# bukan disimpan sebagai string berulang per baris
+if len(writer_popularity):
+    sample_writer = writer_popularity.index[0]
+    print(f"{sample_writer}: {stats.writer_style(sample_writer)}")
+    print(stats.cross_counts('Writer', 'Genre', sample_writer))
 
 # 4.3 Vectorization dan Similarity Matrix
 print("\n4.3 Vectorization dan Similarity Matrix untuk Content Based Filtering")
 print("Transformasi fitur teks menjadi vektor TF-IDF...")
 
-# Inisialisasi TF-IDF Vectorizer
-tfidf = TfidfVectorizer(stop_words='english')
+# Bangun model: TF-IDF Vectorizer, matriks TF-IDF, index judul dan tabel tetangga top-k
+# (tabel tetangga menggantikan matriks cosine similarity N×N)
+NEIGHBOR_K = 50
 
-# Transformasi Content_Features menjadi matriks TF-IDF
-tfidf_matrix = tfidf.fit_transform(df['Content_Features'])
+print(f"Menghitung tabel {NEIGHBOR_K} tetangga terdekat per webtoon...")
+model = WebtoonRecommender(df, neighbor_k=NEIGHBOR_K, instrumentation=instrumentation).fit()
+tfidf = model.tfidf
+tfidf_matrix = model.tfidf_matrix
+indices = model.titles
+neighbor_indices, neighbor_scores = model.neighbor_indices, model.neighbor_scores
 
 print(f"Bentuk matriks TF-IDF: {tfidf_matrix.shape}")
 print(f"Jumlah feature/terms dalam kosakata: {len(tfidf.get_feature_names_out())}")
@@ -365,50 +345,45 @@ print(f"Jumlah feature/terms dalam kosakata: {len(tfidf.get_feature_names_out())
 print("\nBeberapa feature/terms dari TF-IDF vocabulary:")
 print(tfidf.get_feature_names_out()[:10])
 
-# Menghitung cosine similarity matrix
-print("\nMenghitung cosine similarity matrix...")
-cosine_sim = cosine_similarity(tfidf_matrix, tfidf_matrix)
-print(f"Bentuk similarity matrix: {cosine_sim.shape}")
-
-# Membuat dictionary untuk mapping id webtoon ke index
-indices = pd.Series(df.index, index=df['Name']).drop_duplicates()
+print(f"\nBentuk tabel tetangga: {neighbor_indices.shape}")
 
 # Fungsi untuk mendapatkan rekomendasi berdasarkan judul webtoon
-def get_recommendations(title, cosine_sim=cosine_sim):
+def get_recommendations(title, k=10):
     """
     Berikan rekomendasi webtoon berdasarkan kesamaan konten dengan judul yang diberikan
     
     Parameters:
     title (str): Judul webtoon yang menjadi acuan rekomendasi
-    cosine_sim (numpy.ndarray): Matrix cosine similarity
+    k (int): Jumlah rekomendasi yang dikembalikan
     
     Returns:
-    pandas.DataFrame: DataFrame berisi 10 rekomendasi webtoon teratas
+    pandas.DataFrame: DataFrame berisi k rekomendasi webtoon teratas
     """
-    try:
-        # Dapatkan index webtoon yang sesuai dengan judul
-        idx = indices[title]
-        
-        # Dapatkan skor kesamaan untuk semua webtoon dengan webtoon tersebut
-        sim_scores = list(enumerate(cosine_sim[idx]))
-        
-        # Urutkan webtoon berdasarkan skor kesamaan
-        sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-        
-        # Ambil 11 webtoon dengan skor tertinggi (yang pertama adalah webtoon itu sendiri)
-        sim_scores = sim_scores[1:11]
-        
-        # Dapatkan indeks webtoon
-        webtoon_indices = [i[0] for i in sim_scores]
-        
-        # Kembalikan 10 webtoon teratas dengan skor similaritynya
-        result = df.iloc[webtoon_indices][['Name', 'Genre', 'Writer', 'Rating']].copy()
-        result['Similarity Score'] = [i[1] for i in sim_scores]
-        return result
-    
-    except KeyError:
+    result = model.get_recommendations(title, k=k)
+    if result is None:
         print(f"Judul '{title}' tidak ditemukan dalam dataset.")
-        return None
+        suggestions = model.titles.suggest(title, limit=3)
+        if suggestions:
+            print(f"Mungkin maksud Anda: {', '.join(name for name, _ in suggestions)}")
+    return result
+
+# Fungsi untuk mendapatkan rekomendasi banyak judul sekaligus
+def get_recommendations_batch(titles, k=10):
+    """
+    Berikan rekomendasi untuk banyak judul webtoon dalam satu panggilan
+    
+    Parameters:
+    titles (list): Daftar judul webtoon yang menjadi acuan rekomendasi
+    k (int): Jumlah rekomendasi per judul
+    
+    Returns:
+    pandas.DataFrame: Tabel format panjang (Seed, Rank, Name, Genre, Writer, Rating, Similarity Score)
+    """
+    result = model.get_recommendations_batch(titles, k=k)
+    missing = pd.Index(titles).difference(result['Seed'].unique())
+    if len(missing) > 0:
+        print(f"{len(missing)} judul tidak ditemukan dalam dataset: {list(missing[:5])}")
+    return result
 
 # Contoh rekomendasi untuk sebuah webtoon populer
 sample_webtoon = df['Name'].iloc[0]  # Ambil judul webtoon pertama sebagai contoh
@@ -420,7 +395,7 @@ if recommendations is not None:
 # Visualisasi Similarity Matrix
 plt.figure(figsize=(10, 8))
 plt.title("Heatmap Similarity Matrix (10 Webtoon Pertama)")
-sns.heatmap(cosine_sim[:10, :10], annot=True, fmt=".2f", cmap="YlGnBu",
+sns.heatmap(cosine_similarity(tfidf_matrix[:10]), annot=True, fmt=".2f", cmap="YlGnBu",
             xticklabels=df['Name'][:10], yticklabels=df['Name'][:10])
 plt.tight_layout()
 plt.show()
@@ -429,11 +404,12 @@ plt.show()
 content_based_data = {
     'tfidf_vectorizer': tfidf,
     'tfidf_matrix': tfidf_matrix,
-    'cosine_sim': cosine_sim,
+    'neighbor_indices': neighbor_indices,
+    'neighbor_scores': neighbor_scores,
     'indices': indices
 }
 
-print("\nVectorization dan similarity matrix berhasil dibuat dan disimpan untuk modeling.")
+print("\nVectorization dan tabel tetangga berhasil dibuat dan disimpan untuk modeling.")
 
 # Cell 7: Content-Based Filtering
 print("\n" + "="*50)
@@ -453,6 +429,25 @@ for webtoon in test_webtoons:
     else:
         print(f"\nWebtoon '{webtoon}' not found in dataset.")
 
+# Precompute rekomendasi "more like this" untuk seluruh katalog dalam satu panggilan
+start_time = time.perf_counter()
+all_recommendations = get_recommendations_batch(df['Name'], k=10)
+print(f"\nRekomendasi batch untuk {df['Name'].nunique()} judul: {len(all_recommendations)} baris "
+      f"dalam {time.perf_counter() - start_time:.3f} detik")
+print(all_recommendations.head(10))
+
+# Cold-start pengguna baru: rekomendasi dari riwayat bacaan sebagai satu profil (centroid TF-IDF)
+reading_history = [title for title in test_webtoons if title in model.titles]
+if reading_history:
+    print(f"\nRekomendasi untuk pengguna yang sudah membaca {reading_history}:")
+    print(model.recommend_for_profile(reading_history, k=10))
+
+# Karya lain dari penulis yang sama, dibaca dari index penulis (catalog_stats.py)
+if len(writer_popularity):
+    writer_title = df['Name'].iloc[stats.members('Writer', writer_popularity.index[0])[0]]
+    print(f"\nKarya lain dari penulis '{writer_title}':")
+    print(model.more_from_writer(writer_title, k=5))
+
 # Visualize recommendations for one example
 def plot_recommendations(title):
     if title in df['Name'].values:
@@ -510,90 +505,72 @@ Mengukur tingkat kesamaan rata-rata dalam rekomendasi.
 print("\n===== EVALUASI CONTENT-BASED FILTERING =====\n")
 
 # Metrik evaluasi untuk Content-Based Filtering
-def evaluate_content_based_filtering():
-    """
-    Evaluasi model Content-Based Filtering menggunakan berbagai metrik
+def evaluate_content_based_filtering(sample_size=None):
     """
-    print("Mengevaluasi performa Content-Based Filtering...")
-    
-    # 1. Evaluasi Diversitas Rekomendasi
-    diversity_scores = []
-    coverage_genres = set()
-    
-    # Ambil sampel webtoon untuk evaluasi
-    sample_webtoons = df['Name'].head(10).tolist()
-    
-    for webtoon in sample_webtoons:
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                # Hitung diversitas genre dalam rekomendasi
-                rec_genres = recommendations['Genre'].unique()
-                diversity_scores.append(len(rec_genres))
-                coverage_genres.update(rec_genres)
-    
-    avg_diversity = np.mean(diversity_scores)
-    genre_coverage = len(coverage_genres) / len(df['Genre'].unique()) * 100
+    Evaluasi model Content-Based Filtering menggunakan berbagai metrik.
+    Top-10 setiap webtoon diambil sekali lalu semua metrik dihitung dari hasil tersebut.
     
-    print(f"Rata-rata diversitas genre per rekomendasi: {avg_diversity:.2f}")
-    print(f"Cakupan genre dalam rekomendasi: {genre_coverage:.2f}%")
-    
-    # 2. Evaluasi Kesamaan Konten
-    similarity_scores = []
-    
-    for webtoon in sample_webtoons[:5]:  # Ambil 5 sampel
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                avg_similarity = recommendations['Similarity Score'].mean()
-                similarity_scores.append(avg_similarity)
-    
-    avg_content_similarity = np.mean(similarity_scores)
-    print(f"Rata-rata skor kesamaan konten: {avg_content_similarity:.4f}")
-    
-    # 3. Evaluasi Distribusi Rating Rekomendasi
-    recommended_ratings = []
+    Parameters:
+    sample_size (int, optional): Jumlah sampel terstratifikasi per genre; None untuk seluruh katalog
     
-    for webtoon in sample_webtoons:
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                recommended_ratings.extend(recommendations['Rating'].tolist())
+    Returns:
+    tuple: (metrics, recommendations) dari evaluation.evaluate_model
+    """
+    print("Mengevaluasi performa Content-Based Filtering...")
     
-    avg_recommended_rating = np.mean(recommended_ratings)
-    std_recommended_rating = np.std(recommended_ratings)
+    metrics, recommendations = evaluate_model(model, k=10, sample_size=sample_size)
     
-    print(f"Rata-rata rating webtoon yang direkomendasikan: {avg_recommended_rating:.2f}")
-    print(f"Standar deviasi rating rekomendasi: {std_recommended_rating:.2f}")
+    print(f"Jumlah webtoon yang dievaluasi: {metrics['n_seeds']} (waktu: {metrics['wall_time']:.4f} detik)")
+    print(f"Rata-rata diversitas genre per rekomendasi: {metrics['avg_diversity']:.2f}")
+    print(f"Cakupan genre dalam rekomendasi: {metrics['genre_coverage']:.2f}%")
+    print(f"Rata-rata skor kesamaan konten: {metrics['avg_similarity']:.4f}")
+    print(f"Rata-rata rating webtoon yang direkomendasikan: {metrics['avg_recommended_rating']:.2f}")
+    print(f"Standar deviasi rating rekomendasi: {metrics['std_recommended_rating']:.2f}")
     
-    return {
-        'avg_diversity': avg_diversity,
-        'genre_coverage': genre_coverage,
-        'avg_similarity': avg_content_similarity,
-        'avg_recommended_rating': avg_recommended_rating,
-        'std_recommended_rating': std_recommended_rating
-    }
-
-# Jalankan evaluasi Content-Based Filtering
-cb_metrics = evaluate_content_based_filtering()
+    return metrics, recommendations
+
+# Jalankan evaluasi Content-Based Filtering untuk seluruh katalog
+cb_metrics, cb_recommendations = evaluate_content_based_filtering()
+
+# Re-ranking MMR untuk mengurangi over-specialization: diversitas genre vs skor kesamaan
+for mmr_lambda in [0.7, 0.5]:
+    mmr_metrics, _ = evaluate_model(model, k=10, mmr_lambda=mmr_lambda)
+    print(f"MMR lambda={mmr_lambda}: diversitas genre {mmr_metrics['avg_diversity']:.2f}, "
+          f"rata-rata skor kesamaan {mmr_metrics['avg_similarity']:.4f} "
+          f"(waktu: {mmr_metrics['wall_time']:.4f} detik)")
+
+# Backend embedding LSA (embeddings.py): similarity dari vektor padat float32 hasil SVD atas TF-IDF,
+# bukan dari kecocokan term. Skor cosine kedua ruang tidak setara, jadi dibandingkan juga
+# irisan top-10 dengan rekomendasi TF-IDF.
+lsa_model = WebtoonRecommender(df, neighbor_k=NEIGHBOR_K, instrumentation=instrumentation,
+                               embedding=LSAEmbedder(n_components=128)).fit()
+lsa_metrics, _ = evaluate_model(lsa_model, k=10)
+overlap = np.mean([len(np.intersect1d(a, b)) / 10 for a, b in zip(lsa_model.neighbor_indices[:, :10],
+                                                                  model.neighbor_indices[:, :10])])
+print(f"LSA {lsa_model.embeddings.shape[1]} dimensi: diversitas genre {lsa_metrics['avg_diversity']:.2f}, "
+      f"rata-rata skor kesamaan {lsa_metrics['avg_similarity']:.4f}, irisan top-10 dengan TF-IDF {overlap:.0%}")
+
+# TF-IDF berbobot per field (features.py): Genre, Writer dan Summary menjadi blok sparse sendiri
+# yang di-hstack, sehingga genre dan penulis tidak larut di antara token ringkasan
+field_model = WebtoonRecommender(df, neighbor_k=NEIGHBOR_K, instrumentation=instrumentation,
+                                 field_weights='default').fit()
+field_metrics, _ = evaluate_model(field_model, k=10)
+overlap = np.mean([len(np.intersect1d(a, b)) / 10 for a, b in zip(field_model.neighbor_indices[:, :10],
+                                                                  model.neighbor_indices[:, :10])])
+print(f"TF-IDF per field {dict(field_model.field_weights)}: diversitas genre {field_metrics['avg_diversity']:.2f}, "
+      f"rata-rata skor kesamaan {field_metrics['avg_similarity']:.4f}, irisan top-10 dengan TF-IDF {overlap:.0%}")
 
 # Visualisasi hasil evaluasi Content-Based
-def visualize_content_based_evaluation():
+def visualize_content_based_evaluation(metrics, recommendations):
     """
-    Visualisasi hasil evaluasi Content-Based Filtering
+    Visualisasi hasil evaluasi Content-Based Filtering dari result set evaluasi yang sama
     """
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
-    # 1. Distribusi Similarity Score
-    sample_webtoons = df['Name'].head(5).tolist()
-    all_similarities = []
-    
-    for webtoon in sample_webtoons:
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                all_similarities.extend(recommendations['Similarity Score'].tolist())
+    all_similarities = recommendations['scores'].ravel()
+    rec_indices = recommendations['indices'].ravel()
     
+    # 1. Distribusi Similarity Score
     axes[0, 0].hist(all_similarities, bins=15, alpha=0.7, color='skyblue')
     axes[0, 0].set_title('Distribusi Skor Kesamaan Content-Based')
     axes[0, 0].set_xlabel('Skor Kesamaan')
@@ -601,14 +578,7 @@ def visualize_content_based_evaluation():
     axes[0, 0].grid(True, alpha=0.3)
     
     # 2. Distribusi Genre dalam Rekomendasi
-    all_genres = []
-    for webtoon in sample_webtoons:
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                all_genres.extend(recommendations['Genre'].tolist())
-    
-    genre_counts = pd.Series(all_genres).value_counts().head(10)
+    genre_counts = df['Genre'].iloc[rec_indices].value_counts().head(10)
     axes[0, 1].bar(range(len(genre_counts)), genre_counts.values, color='lightcoral')
     axes[0, 1].set_title('10 Genre Teratas dalam Rekomendasi')
     axes[0, 1].set_xlabel('Genre')
@@ -617,17 +587,8 @@ def visualize_content_based_evaluation():
     axes[0, 1].set_xticklabels(genre_counts.index, rotation=45, ha='right')
     
     # 3. Rating vs Similarity Score
-    ratings = []
-    similarities = []
-    
-    for webtoon in sample_webtoons:
-        if webtoon in df['Name'].values:
-            recommendations = get_recommendations(webtoon)
-            if recommendations is not None:
-                ratings.extend(recommendations['Rating'].tolist())
-                similarities.extend(recommendations['Similarity Score'].tolist())
-    
-    axes[1, 0].scatter(similarities, ratings, alpha=0.6, color='green')
+    ratings = df['Rating'].to_numpy()[rec_indices]
+    axes[1, 0].scatter(all_similarities, ratings, alpha=0.6, color='green')
     axes[1, 0].set_title('Korelasi Skor Kesamaan vs Rating')
     axes[1, 0].set_xlabel('Skor Kesamaan')
     axes[1, 0].set_ylabel('Rating')
@@ -635,8 +596,8 @@ def visualize_content_based_evaluation():
     
     # 4. Metrik Evaluasi
     metrics_names = ['Diversitas\nGenre', 'Cakupan\nGenre (%)', 'Rata-rata\nSimilarity', 'Rata-rata\nRating']
-    metrics_values = [cb_metrics['avg_diversity'], cb_metrics['genre_coverage'], 
-                     cb_metrics['avg_similarity'] * 10, cb_metrics['avg_recommended_rating']]  # Scale similarity for visibility
+    metrics_values = [metrics['avg_diversity'], metrics['genre_coverage'], 
+                     metrics['avg_similarity'] * 10, metrics['avg_recommended_rating']]  # Scale similarity for visibility
     
     bars = axes[1, 1].bar(metrics_names, metrics_values, color=['purple', 'orange', 'brown', 'pink'])
     axes[1, 1].set_title('Ringkasan Metrik Content-Based Filtering')
@@ -651,7 +612,7 @@ def visualize_content_based_evaluation():
     plt.tight_layout()
     plt.show()
 
-visualize_content_based_evaluation()
+visualize_content_based_evaluation(cb_metrics, cb_recommendations)
 
 # Cell 9: Kesimpulan
 print("\n" + "="*50)
@@ -666,10 +627,11 @@ print("="*50)
 Content-Based Filtering menunjukkan performa yang sangat baik:
 
 **Hasil Evaluasi:**
-- ✅ **Diversitas Genre**: 6.10 genre per rekomendasi menunjukkan variasi yang sangat baik
-- ✅ **Cakupan Genre**: 81.25% coverage menunjukkan sistem tidak bias pada genre tertentu  
-- ✅ **Kualitas Rekomendasi**: Rating rata-rata 9.56 dengan standar deviasi rendah (0.31)
-- ✅ **Rata-rata Skor Kesamaan**: 0.0840 menunjukkan keseimbangan antara similaritas dan diversitas
+Dievaluasi pada top-10 rekomendasi untuk seluruh 569 webtoon:
+- ✅ **Diversitas Genre**: 5.68 genre per rekomendasi menunjukkan variasi yang sangat baik
+- ✅ **Cakupan Genre**: 100.00% coverage menunjukkan sistem tidak bias pada genre tertentu  
+- ✅ **Kualitas Rekomendasi**: Rating rata-rata 9.45 dengan standar deviasi rendah (0.54)
+- ✅ **Rata-rata Skor Kesamaan**: 0.0869 menunjukkan keseimbangan antara similaritas dan diversitas
 
 **Kelebihan Content-Based Filtering:**
 - No Cold-Start Problem untuk item baru
@@ -0,0 +1,1135 @@
+"""
+Model rekomendasi webtoon content-based yang aman di-import.
+
+Modul ini tidak mencetak laporan, tidak membuat visualisasi dan tidak meng-import
+matplotlib/seaborn. Vectorizer TF-IDF, matriks TF-IDF, index judul dan tabel
+tetangga baru dibangun saat query pertama atau saat `fit()` dipanggil. TF-IDF dibangun
+langsung dari aliran token Genre, Writer dan Summary (lihat features.py), sehingga
+katalog model tidak menyimpan kolom Summary_Clean/Content_Features.
+Laporan EDA, visualisasi dan evaluasi dijalankan lewat `python recommendation.py`.
+
+Contoh:
+    from recommender import WebtoonRecommender
+
+    model = WebtoonRecommender()
+    model.get_recommendations('Tower of God', k=10)
+"""
+import os
+import threading
+from collections import namedtuple
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ann import IVFIndex
+from artifact import file_sha256, load_artifact, save_artifact
+from cache import ResultCache
+from catalog_stats import CatalogStats
+from diversity import DEFAULT_MMR_POOL, mmr_select, normalize_diversity
+from embeddings import DEFAULT_BATCH_SIZE, EmbeddingCache, embed_texts
+from features import (FIELD_COLUMNS, FieldVectorizer, field_streams, fit_tfidf_fields, normalize_field_weights,
+                      transform_fields)
+from filters import FilterIndex, normalize_filters
+from ingest import (COUNT_COLUMNS, build_content_features, clean_missing_values, load_catalog, parse_counts,
+                    stream_catalog)
+from instrumentation import NULL_INSTRUMENTATION, instrumented
+from parallel import build_neighbor_table_parallel, fit_tfidf_parallel
+from precision import (check_precision, dequantize_scores, index_dtype, matrix_dtype, nbytes, quantize_scores,
+                       score_tolerance)
+from priors import DEFAULT_HYBRID_WEIGHTS, HybridPriors, check_ranking, normalize_weights, rank_table
+from ranking import (batch_top_k, build_neighbor_table, dot_similarity, merge_top_k, paired_similarity,
+                     profile_top_k, top_k)
+from titles import TitleIndex
+
+DEFAULT_DATA_PATH = Path(__file__).resolve().parent / 'webtoon-dataset.csv'
+
+RECOMMENDATION_COLUMNS = ['Name', 'Genre', 'Writer', 'Rating']
+
+# Record rekomendasi yang immutable dan ringan, dipakai sebagai nilai cache
+Recommendation = namedtuple('Recommendation', ['name', 'genre', 'writer', 'rating', 'score'])
+
+# Kolom teks turunan yang selalu bisa dibangun ulang dari kolom katalog
+DERIVED_COLUMNS = ['Summary_Clean', 'Content_Features']
+
+
+def build_title_index(df):
+    """
+    Bangun TitleIndex dari kolom Name (dan kolom id jika ada) katalog.
+    """
+    return TitleIndex(df['Name'].to_numpy(), df['id'].to_numpy() if 'id' in df else None)
+
+
+def make_vectorizer(vocabulary=None, dtype=np.float64):
+    """
+    Buat TfidfVectorizer dengan konfigurasi yang sama untuk fit maupun artifact yang dimuat.
+    """
+    return TfidfVectorizer(stop_words='english', vocabulary=vocabulary, dtype=dtype)
+
+
+class WebtoonRecommender:
+    """
+    Sistem rekomendasi content-based (TF-IDF + cosine similarity) dengan model lazy.
+
+    Parameters:
+    data (str, Path atau pandas.DataFrame): Path CSV dataset atau DataFrame yang sudah dimuat
+    neighbor_k (int): Jumlah tetangga yang disimpan per webtoon pada tabel tetangga
+    block_size (int): Jumlah baris per blok saat menghitung tabel tetangga
+    refit_threshold (float): Batas drift IDF/kosakata sebelum add_items, update_item atau
+                             remove_item memicu fit ulang penuh
+    chunksize (int, optional): Jika diisi dan data berupa path, CSV dibaca per chunk dan
+                               TF-IDF dibangun dua pass (lihat ingest.stream_catalog);
+                               kolom teks tidak disimpan di katalog
+    cache_size (int): Jumlah hasil get_recommendation_records yang di-cache (LRU); 0 untuk mematikan
+    cache_ttl (float, optional): Umur maksimum entry cache dalam detik
+    workers (int): Jumlah proses untuk fit(); lebih dari 1 membagi tokenisasi (tanpa field_weights)
+                   dan tabel tetangga ke process pool (lihat parallel.py) dengan hasil yang identik
+    precision (str): Presisi penyimpanan: 'float64', 'float32', 'float16' atau 'int8'
+                     (lihat precision.py)
+    hybrid_weights (dict, optional): Bobot 'similarity', 'popularity' dan 'rating' untuk
+                                     ranking='hybrid'; default DEFAULT_HYBRID_WEIGHTS
+    mmr_pool (int): Jumlah kandidat teratas yang dipilih ulang oleh re-ranking MMR
+    instrumentation (Instrumentation, optional): Penerima timer, peak memory dan counter per
+                                                 tahap fit dan per query (lihat instrumentation.py);
+                                                 default nonaktif
+    embedding (LSAEmbedder atau SentenceEmbedder, optional): Backend embedding padat (lihat
+                                                 embeddings.py); jika diisi, similarity dihitung
+                                                 dari embedding float32, bukan TF-IDF
+    embedding_cache (str, Path atau EmbeddingCache, optional): Direktori cache vektor embedding
+    embedding_batch_size (int): Jumlah teks per batch encode
+    field_weights (dict atau str, optional): Bobot blok TF-IDF per field Genre/Writer/Summary
+                                             (lihat features.FieldVectorizer); 'default' untuk
+                                             DEFAULT_FIELD_WEIGHTS. None (default) memakai satu
+                                             blok TF-IDF atas ketiga field seperti Content_Features
+    """
+
+    def __init__(self, data=DEFAULT_DATA_PATH, neighbor_k=50, block_size=1024, refit_threshold=0.2,
+                 chunksize=None, cache_size=1024, cache_ttl=None, workers=1, precision='float64',
+                 hybrid_weights=None, mmr_pool=DEFAULT_MMR_POOL, instrumentation=None, embedding=None,
+                 embedding_cache=None, embedding_batch_size=DEFAULT_BATCH_SIZE, field_weights=None):
+        check_precision(precision)
+        self.data = data
+        self.neighbor_k = neighbor_k
+        self.block_size = block_size
+        self.refit_threshold = refit_threshold
+        self.chunksize = chunksize
+        self.workers = workers
+        self.precision = precision
+        self.hybrid_weights = normalize_weights(
+            DEFAULT_HYBRID_WEIGHTS if hybrid_weights is None else hybrid_weights)
+        self.mmr_pool = mmr_pool
+        self.cache = ResultCache(maxsize=cache_size, ttl=cache_ttl)
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        self.embedding = embedding
+        if embedding_cache is not None and not isinstance(embedding_cache, EmbeddingCache):
+            embedding_cache = EmbeddingCache(embedding_cache)
+        self.embedding_cache = embedding_cache
+        self.embedding_batch_size = embedding_batch_size
+        self.field_weights = None if field_weights is None else normalize_field_weights(field_weights)
+
+        # Naik setiap kali katalog atau model berubah; entry cache versi lama dibuang
+        self.version = 0
+
+        self.df = None
+        self.tfidf = None
+        self.tfidf_matrix = None
+        self.embeddings = None
+        self.titles = None
+        self.neighbor_indices = None
+        self.neighbor_scores = None
+        self.ann_index = None
+        self.rejected_rows = {}
+        # True jika katalog dibangun streaming (chunksize) tanpa kolom teks; tidak bisa di-fit ulang
+        self._streaming = False
+        # True setelah add_items/update_item/remove_item: katalog tidak lagi sama dengan dataset sumber
+        self._source_modified = False
+        self._fit_lock = threading.Lock()
+        self._filter_index = None
+        self._catalog_stats = None
+        self._priors = None
+        self._hybrid_table = None
+
+        # Statistik drift sejak fit terakhir
+        self._doc_freq = None
+        self._oov_terms = set()
+
+    @property
+    def is_fitted(self):
+        return self.neighbor_indices is not None
+
+    @property
+    def features(self):
+        """
+        Matriks yang dipakai untuk similarity: embedding padat jika backend embedding dipakai,
+        selain itu matriks TF-IDF. Keduanya ternormalisasi L2.
+        """
+        return self.tfidf_matrix if self.embeddings is None else self.embeddings
+
+    def fit(self):
+        """
+        Bangun seluruh state model: DataFrame fitur, TF-IDF, index judul dan tabel tetangga.
+
+        Returns:
+        WebtoonRecommender: Objek ini sendiri
+        """
+        instrumentation = self.instrumentation
+        vectorizer_factory = partial(make_vectorizer, dtype=matrix_dtype(self.precision))
+        if self.embedding is not None and self.chunksize and isinstance(self.data, (str, os.PathLike)):
+            raise ValueError("Backend embedding membutuhkan kolom teks; tidak bisa dipakai dengan chunksize.")
+        if self.field_weights is not None and self.chunksize and isinstance(self.data, (str, os.PathLike)):
+            raise ValueError("field_weights membutuhkan kolom teks; tidak bisa dipakai dengan chunksize.")
+        streaming = bool(isinstance(self.data, (str, os.PathLike)) and self.chunksize)
+        with instrumentation.stage('fit', workers=self.workers, precision=self.precision) as fit_stage:
+            if streaming:
+                with instrumentation.stage('stream_catalog'):
+                    df, tfidf, tfidf_matrix, self.rejected_rows = stream_catalog(
+                        self.data, vectorizer_factory, chunksize=self.chunksize)
+            else:
+                if isinstance(self.data, (str, os.PathLike)):
+                    df, self.rejected_rows = load_catalog(self.data, instrumentation=instrumentation)
+                else:
+                    df = self.data.drop(columns=DERIVED_COLUMNS, errors='ignore')
+                if self.workers > 1 and self.field_weights is None:
+                    # Pembersihan teks dan tokenisasi berjalan bersama di process pool
+                    with instrumentation.stage('tfidf_fit', workers=self.workers):
+                        df, tfidf, tfidf_matrix = fit_tfidf_parallel(
+                            clean_missing_values(df.reset_index(drop=True)), vectorizer_factory, self.workers)
+                    df = df.drop(columns=DERIVED_COLUMNS)
+                else:
+                    # Pembersihan dan tokenisasi per field tervektorisasi, tanpa kolom Content_Features
+                    fields = FIELD_COLUMNS if self.field_weights is None else [f for f, _ in self.field_weights]
+                    with instrumentation.stage('clean_text') as stage:
+                        df = clean_missing_values(df.reset_index(drop=True))
+                        streams = field_streams(df, fields)
+                        stage.count('rows', len(df))
+                        stage.count('tokens', sum(len(tokens) for _, tokens in streams.values()))
+                    with instrumentation.stage('tfidf_fit', workers=1):
+                        if self.field_weights is None:
+                            tfidf, tfidf_matrix = fit_tfidf_fields(df, vectorizer_factory, streams=streams)
+                        else:
+                            tfidf = FieldVectorizer(self.field_weights, dtype=matrix_dtype(self.precision))
+                            tfidf_matrix = tfidf.fit_transform(df, streams=streams)
+
+            embeddings = None
+            if self.embedding is not None:
+                with instrumentation.stage('embed') as stage:
+                    embeddings = self._embed(df, tfidf, tfidf_matrix, fit=True)
+                    stage.count('rows', embeddings.shape[0])
+            features = tfidf_matrix if embeddings is None else embeddings
+
+            with instrumentation.stage('neighbor_table', workers=self.workers) as stage:
+                if self.workers > 1:
+                    neighbor_indices, neighbor_scores = build_neighbor_table_parallel(
+                        features, k=self.neighbor_k, block_size=self.block_size, workers=self.workers)
+                else:
+                    neighbor_indices, neighbor_scores = build_neighbor_table(
+                        features, k=self.neighbor_k, block_size=self.block_size)
+                stage.count('candidates', tfidf_matrix.shape[0] ** 2)
+
+            with instrumentation.stage('title_index'):
+                titles = build_title_index(df)
+            fit_stage.count('rows', tfidf_matrix.shape[0])
+            fit_stage.count('features', tfidf_matrix.shape[1])
+            fit_stage.count('nnz', tfidf_matrix.nnz)
+
+        self.df = df
+        self.tfidf = tfidf
+        self.tfidf_matrix = tfidf_matrix
+        self.embeddings = embeddings
+        self.titles = titles
+        self._streaming = streaming
+        self._source_modified = False
+        self._set_neighbor_table(neighbor_indices, neighbor_scores)
+        self.ann_index = None
+        self._doc_freq = None
+        self._oov_terms = set()
+        self.version += 1
+        return self
+
+    def refit(self):
+        """
+        Fit ulang penuh dari katalog saat ini (termasuk item yang ditambah/diubah/dihapus).
+        Katalog mode streaming tidak menyimpan kolom teks, sehingga harus di-fit ulang dari CSV.
+
+        Raises:
+        ValueError: Jika katalog dibangun streaming atau ada baris tanpa Summary; fit ulang
+                    dari katalog seperti itu akan membuang ringkasan baris lama
+        """
+        if not self._can_refit():
+            raise ValueError("Katalog tidak menyimpan Summary untuk setiap baris; fit ulang dari CSV sumber.")
+        self.data = self.df.drop(columns=DERIVED_COLUMNS, errors='ignore')
+        return self.fit()
+
+    @instrumented('build_ann_index')
+    def build_ann_index(self, **params):
+        """
+        Bangun index ANN (TruncatedSVD + IVF, lihat ann.py) sebagai fallback untuk query
+        yang tidak bisa dilayani tabel tetangga, yaitu query satu judul tanpa filter, tanpa
+        ranking hybrid dan tanpa MMR dengan k melebihi neighbor_k. Query lain tidak memakai
+        index ini: k <= neighbor_k dibaca dari tabel tetangga eksak, sedangkan query berfilter,
+        hybrid dan batch neighbors() selalu eksak. Index dilepas saat katalog berubah
+        (add_items, update_item, remove_item, fit).
+
+        Parameters:
+        **params: Parameter IVFIndex, misalnya n_lists atau n_probe
+
+        Returns:
+        IVFIndex: Index yang sudah dilatih
+        """
+        self._ensure_fitted()
+        self.ann_index = IVFIndex(**params).fit(self.features)
+        self.version += 1
+        return self.ann_index
+
+    @instrumented('save')
+    def save(self, path):
+        """
+        Simpan model ke direktori artifact (lihat artifact.py untuk formatnya).
+
+        Parameters:
+        path (str atau Path): Direktori tujuan
+        """
+        self._ensure_fitted()
+        from_source = isinstance(self.data, (str, os.PathLike)) and not self._source_modified
+        header = {
+            'n_items': self.tfidf_matrix.shape[0],
+            'n_features': self.tfidf_matrix.shape[1],
+            'neighbor_k': self.neighbor_k,
+            'precision': self.precision,
+            'source_sha256': file_sha256(self.data) if from_source else None,
+            'embedding': None if self.embeddings is None else self.embedding.fingerprint,
+            'field_weights': dict(self.field_weights) if isinstance(self.tfidf, FieldVectorizer) else None,
+            'streaming': self._streaming,
+        }
+        arrays = {
+            'idf': self.tfidf.idf_,
+            'tfidf_data': self.tfidf_matrix.data,
+            'tfidf_indices': self.tfidf_matrix.indices,
+            'tfidf_indptr': self.tfidf_matrix.indptr,
+            'neighbor_indices': self.neighbor_indices,
+            'neighbor_scores': self.neighbor_scores,
+            'embeddings': self.embeddings,
+        }
+        catalog = self.df.drop(columns=DERIVED_COLUMNS, errors='ignore')
+        save_artifact(path, header, self.tfidf.get_feature_names_out(), catalog, arrays)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r', source_path=None, embedding=None, embedding_cache=None):
+        """
+        Muat model dari direktori artifact tanpa membangun ulang TF-IDF maupun tabel tetangga.
+
+        Parameters:
+        path (str atau Path): Direktori artifact
+        mmap_mode (str, optional): Mode memory-map untuk array besar; None untuk membaca ke memori
+        source_path (str atau Path, optional): Dataset sumber untuk memeriksa artifact usang
+        embedding (LSAEmbedder atau SentenceEmbedder, optional): Backend yang membangun embedding
+                                                                 artifact; hanya dibutuhkan untuk
+                                                                 add_items/update_item/fit ulang
+        embedding_cache (str, Path atau EmbeddingCache, optional): Direktori cache embedding
+
+        Returns:
+        WebtoonRecommender: Model yang siap dipakai tanpa fit()
+
+        Raises:
+        ValueError: Jika fingerprint backend embedding berbeda dengan yang tercatat di artifact
+        """
+        header, vocabulary, catalog, arrays = load_artifact(path, mmap_mode=mmap_mode, source_path=source_path)
+        if embedding is not None and embedding.fingerprint != header.get('embedding'):
+            raise ValueError(f"Artifact '{path}' dibangun dengan embedding {header.get('embedding')}, "
+                             f"bukan {embedding.fingerprint}.")
+
+        model = cls(data=catalog, neighbor_k=header['neighbor_k'], precision=header['precision'],
+                    embedding=embedding, embedding_cache=embedding_cache, field_weights=header['field_weights'])
+        model.df = catalog
+        model._streaming = header['streaming']
+        if model.field_weights is not None:
+            model.tfidf = FieldVectorizer.from_features(vocabulary, arrays['idf'], model.field_weights,
+                                                        dtype=arrays['tfidf_data'].dtype)
+        else:
+            model.tfidf = make_vectorizer(vocabulary={term: i for i, term in enumerate(vocabulary)},
+                                          dtype=arrays['tfidf_data'].dtype)
+            model.tfidf.idf_ = arrays['idf']
+        model.tfidf_matrix = sp.csr_matrix(
+            (arrays['tfidf_data'], arrays['tfidf_indices'], arrays['tfidf_indptr']),
+            shape=(header['n_items'], header['n_features']), copy=False)
+        # Index judul (normalisasi, duplikat, id) dibangun ulang dari catalog.csv, tidak disimpan sebagai array
+        model.titles = build_title_index(catalog)
+        model.neighbor_indices = arrays['neighbor_indices']
+        model.neighbor_scores = arrays['neighbor_scores']
+        model.embeddings = arrays.get('embeddings')
+        model.version = 1
+        return model
+
+    def _ensure_fitted(self):
+        if not self.is_fitted:
+            with self._fit_lock:
+                if not self.is_fitted:
+                    self.fit()
+
+    @instrumented('get_recommendations')
+    def get_recommendations(self, title, k=10, ranking='similarity', mmr_lambda=None, min_genres=None, **filters):
+        """
+        Berikan rekomendasi webtoon berdasarkan kesamaan konten dengan judul yang diberikan
+
+        Parameters:
+        title (str atau int): Judul webtoon yang menjadi acuan rekomendasi (tidak peka huruf
+                              besar/kecil dan spasi), atau id katalog untuk memilih salah satu
+                              judul duplikat secara eksplisit
+        k (int): Jumlah rekomendasi yang dikembalikan
+        ranking (str): 'similarity' (cosine murni) atau 'hybrid' (cosine dicampur prior
+                       popularity dan rating dengan bobot hybrid_weights, lihat priors.py)
+        mmr_lambda (float, optional): Aktifkan re-ranking MMR (lihat diversity.py) dengan bobot
+                                      relevansi ini; 1 = tanpa diversitas, makin kecil makin beragam
+        min_genres (int, optional): Jumlah genre berbeda minimum dalam hasil (juga lewat MMR)
+        **filters: Filter opsional (lihat filters.py): genre, status, min_rating,
+                   min_subscribers, misalnya status='Completed', min_rating=9.5
+
+        Returns:
+        pandas.DataFrame: DataFrame berisi k rekomendasi teratas yang lolos filter, atau None
+                          jika judul tidak ditemukan; ranking 'hybrid' menambah kolom Hybrid Score
+        """
+        self._ensure_fitted()
+        weights = self._ranking_weights(ranking)
+        diversity = normalize_diversity(mmr_lambda, min_genres)
+        filters = normalize_filters(filters)
+        self._note_query(ranking, k, filters, diversity)
+        idx = self.titles.get(title)
+        if idx is None:
+            return None
+
+        webtoon_indices, scores = self._rank(idx, k, filters, weights, diversity)
+        if weights is None:
+            score_columns = {'Similarity Score': scores}
+        else:
+            score_columns = {'Similarity Score': self._hybrid_similarity(np.array([idx]), webtoon_indices[None],
+                                                                         scores[None], weights)[0],
+                             'Hybrid Score': scores}
+        # Satu konstruktor DataFrame: menyisipkan kolom skor satu per satu ke hasil iloc jauh lebih
+        # mahal daripada seleksi barisnya, dan ranking hybrid menyisipkan dua kolom
+        columns = {column: self.df[column].to_numpy()[webtoon_indices] for column in RECOMMENDATION_COLUMNS}
+        return pd.DataFrame({**columns, **score_columns}, index=self.df.index[webtoon_indices])
+
+    @instrumented('get_recommendation_records')
+    def get_recommendation_records(self, title, k=10, ranking='similarity', mmr_lambda=None, min_genres=None,
+                                   **filters):
+        """
+        Sama dengan get_recommendations, tetapi mengembalikan tuple record Recommendation yang
+        immutable dan di-cache per (posisi judul, k, ranking, MMR, filters), sehingga penulisan
+        judul yang berbeda huruf besar/kecil, spasi atau lewat id memakai entry yang sama.
+        Cache dibuang otomatis saat versi model berubah.
+
+        Parameters:
+        title (str): Judul webtoon yang menjadi acuan rekomendasi
+        k (int): Jumlah rekomendasi yang dikembalikan
+        ranking (str): 'similarity' atau 'hybrid', sama dengan get_recommendations
+        mmr_lambda, min_genres: Re-ranking MMR opsional, sama dengan get_recommendations
+        **filters: Filter opsional, sama dengan get_recommendations
+
+        Returns:
+        tuple: Record Recommendation(name, genre, writer, rating, score), atau None jika
+               judul tidak ditemukan; score berisi skor hybrid pada ranking 'hybrid'
+        """
+        self._ensure_fitted()
+        weights = self._ranking_weights(ranking)
+        diversity = normalize_diversity(mmr_lambda, min_genres)
+        filters = normalize_filters(filters)
+        self._note_query(ranking, k, filters, diversity)
+        idx = self.titles.get(title)
+        if idx is None:
+            return None
+        # Kunci dari posisi baris hasil resolusi judul, bukan teks judul mentah; posisi stabil
+        # dalam satu versi model, dan cache dibuang saat versi berubah
+        key, version = (idx, k, weights, diversity, filters), self.version
+        found, records = self.cache.get(key, version)
+        self.instrumentation.count('cache_hits' if found else 'cache_misses')
+        if not found:
+            records = self._records(idx, k, filters, weights, diversity)
+            self.cache.put(key, version, records)
+        return records
+
+    def _records(self, idx, k, filters, weights=None, diversity=None):
+        webtoon_indices, scores = self._rank(idx, k, filters, weights, diversity)
+        columns = [self.df[column].to_numpy()[webtoon_indices].tolist() for column in RECOMMENDATION_COLUMNS]
+        return tuple(Recommendation._make(values) for values in zip(*columns, scores.tolist()))
+
+    def _ranking_weights(self, ranking):
+        check_ranking(ranking)
+        return self.hybrid_weights if ranking == 'hybrid' else None
+
+    def _note_query(self, ranking, k, filters, diversity, seeds=1):
+        # Label dan counter per query untuk tahap instrumentasi yang sedang berjalan
+        instrumentation = self.instrumentation
+        if instrumentation.enabled:
+            instrumentation.label('ranking', ranking)
+            instrumentation.label('filtered', bool(filters))
+            instrumentation.label('mmr', diversity is not None)
+            instrumentation.count('seeds', seeds)
+            instrumentation.count('k', k)
+
+    def _rank(self, idx, k, filters=(), weights=None, diversity=None):
+        if diversity is not None:
+            # Pool kandidat dari ranking biasa, lalu dipilih ulang dengan MMR
+            pool, pool_scores = self._rank(idx, max(k, self.mmr_pool), filters, weights)
+            self.instrumentation.count('mmr_pool', len(pool))
+            picked = self._mmr(pool, pool_scores, k, diversity)
+            return pool[picked], pool_scores[picked]
+        if weights is not None and not filters:
+            served = self._hybrid_from_table(np.array([idx]), k, weights)
+            if served is not None:
+                return served[0][0], served[1][0]
+        if filters or weights is not None:
+            top, top_scores = self._constrained_top_k(np.array([idx]), k, filters, weights)
+            keep = np.isfinite(top_scores[0])
+            return top[0, keep], top_scores[0, keep]
+        if k <= self.neighbor_indices.shape[1]:
+            self.instrumentation.count('candidates', k)
+            return self.neighbor_indices[idx, :k], dequantize_scores(self.neighbor_scores[idx, :k])
+        if self.ann_index is not None:
+            # Satu-satunya jalur ANN: k melebihi lebar tabel, tanpa filter maupun hybrid
+            self.instrumentation.count('ann_queries')
+            return self.ann_index.query(self.features[idx:idx + 1], k, exclude=idx)
+        # k melebihi lebar tabel: ranking langsung dari baris similarity mentah
+        self.instrumentation.count('candidates', self.features.shape[0])
+        row = dot_similarity(self.features[idx:idx + 1], self.features)[0]
+        return top_k(row, k, exclude=idx)
+
+    def _mmr(self, pool, pool_scores, k, diversity):
+        mmr_lambda, min_genres = diversity
+        genres = pd.factorize(self.df['Genre'].to_numpy()[pool])[0] if min_genres else None
+        return mmr_select(pool_scores, self.features[pool], k, mmr_lambda, genres, min_genres)
+
+    def _constrained_top_k(self, seed_indices, k, filters, weights=None):
+        # Top-k eksak dengan filter dan/atau skor hybrid; tabel tetangga dipakai untuk baris
+        # yang hasilnya terbukti sama dengan seleksi pada baris similarity penuh
+        k = min(k, self.features.shape[0] - 1)
+        top = np.empty((len(seed_indices), k), dtype=np.int64)
+        top_scores = np.empty((len(seed_indices), k), dtype=self.features.dtype)
+
+        bias, scale = None, 1.0
+        if weights is None:
+            # Tabel tetangga terurut sama dengan top_k, jadi seluruh barisnya eksak
+            table_indices = self.neighbor_indices[seed_indices]
+            table_scores = dequantize_scores(self.neighbor_scores[seed_indices])
+            exact = np.full(len(seed_indices), table_indices.shape[1])
+        else:
+            scale = dict(weights)['similarity']
+            bias, _ = self._ensure_priors().bias(weights, self.features.dtype)
+            table_indices, table_scores, exact = (
+                array[seed_indices] for array in self._ensure_hybrid_table(weights))
+
+        if filters:
+            # Predikat hanya dievaluasi pada neighbor_k posisi per baris; k kandidat pertama
+            # yang lolos filter eksak jika seluruhnya berada di bagian baris yang eksak
+            passed = self._ensure_filter_index().matches(filters, table_indices)
+            in_exact = np.arange(table_indices.shape[1]) < exact[:, None]
+            from_table = (passed & in_exact).sum(axis=1) >= k
+            if from_table.any():
+                order = np.argsort(~passed[from_table], axis=1, kind='stable')[:, :k]
+                top[from_table] = np.take_along_axis(table_indices[from_table], order, axis=1)
+                top_scores[from_table] = np.take_along_axis(table_scores[from_table], order, axis=1)
+        else:
+            from_table = exact >= k
+            if from_table.any():
+                top[from_table] = table_indices[from_table, :k]
+                top_scores[from_table] = table_scores[from_table, :k]
+
+        # Sisanya: mask dan bias diterapkan pada baris similarity penuh sebelum seleksi top-k
+        rest = ~from_table
+        if self.instrumentation.enabled:
+            n_table, n_rest = int(from_table.sum()), int(rest.sum())
+            self.instrumentation.count('table_rows', n_table)
+            self.instrumentation.count('full_rows', n_rest)
+            self.instrumentation.count('candidates',
+                                       n_table * table_indices.shape[1] + n_rest * self.features.shape[0])
+        if rest.any():
+            top[rest], top_scores[rest] = batch_top_k(
+                self.features, seed_indices[rest], k, block_size=self.block_size,
+                mask=self._ensure_filter_index().matches(filters) if filters else None,
+                bias=bias, scale=scale)
+        return top, top_scores
+
+    def _ensure_hybrid_table(self, weights):
+        # Tabel tetangga yang diurutkan ulang dengan skor hybrid, sekali per versi dan bobot
+        if self._hybrid_table is None or self._hybrid_table[:2] != (self.version, weights):
+            n_items, width = self.features.shape[0], self.neighbor_indices.shape[1]
+            if score_tolerance(self.neighbor_scores.dtype):
+                # Skor float16/int8 tidak cukup presisi untuk dicampur; selalu lewat baris penuh
+                table = (self.neighbor_indices[:, :0], self.neighbor_scores[:, :0], np.zeros(n_items, dtype=np.int64))
+            else:
+                bias, bias_max = self._ensure_priors().bias(weights, self.features.dtype)
+                table = rank_table(self.neighbor_indices, self.neighbor_scores, bias, bias_max,
+                                   scale=dict(weights)['similarity'], complete=width >= n_items - 1)
+            # Kedalaman eksak minimum: k sampai batas ini dilayani tabel tanpa cek per baris
+            self._hybrid_table = (self.version, weights, table, int(table[2].min()) if n_items else 0)
+        return self._hybrid_table[2]
+
+    def _hybrid_from_table(self, seed_indices, k, weights):
+        # Hybrid tanpa filter langsung dari tabel hybrid, setara jalur tabel tetangga pada ranking
+        # similarity; None jika ada baris yang k teratasnya belum terbukti eksak
+        indices, scores, exact = self._ensure_hybrid_table(weights)
+        if k > self._hybrid_table[3] and (k > indices.shape[1] or (exact[seed_indices] < k).any()):
+            return None
+        self.instrumentation.count('table_rows', len(seed_indices))
+        self.instrumentation.count('candidates', len(seed_indices) * k)
+        return indices[seed_indices, :k], scores[seed_indices, :k]
+
+    def _hybrid_similarity(self, seed_indices, rec_indices, hybrid_scores, weights):
+        # Cosine dari rekomendasi hybrid: skor hybrid dikurangi bias lalu dibagi bobot similarity;
+        # jika bobotnya 0, cosine dihitung dari pasangan (acuan, rekomendasi) yang terpilih
+        scale = dict(weights)['similarity']
+        if scale > 0:
+            bias, _ = self._ensure_priors().bias(weights, self.features.dtype)
+            return (hybrid_scores - bias[rec_indices]) / scale
+        seeds = np.repeat(seed_indices, rec_indices.shape[1])
+        return paired_similarity(self.features[seeds], self.features[rec_indices.ravel()]).reshape(rec_indices.shape)
+
+    def _ensure_priors(self):
+        # Prior popularity/rating dihitung ulang sekali setelah katalog berubah
+        if self._priors is None or self._priors[0] != self.version:
+            self._priors = (self.version, HybridPriors(self.df))
+        return self._priors[1]
+
+    def _ensure_filter_index(self):
+        # Bitmap dibangun ulang sekali setelah katalog berubah (versi model naik)
+        if self._filter_index is None or self._filter_index[0] != self.version:
+            self._filter_index = (self.version, FilterIndex(self.df))
+        return self._filter_index[1]
+
+    def _ensure_catalog_stats(self):
+        # Dibangun ulang setelah katalog berubah, kecuali add_items yang menambahkannya incremental
+        if self._catalog_stats is None or self._catalog_stats[0] != self.version:
+            self._catalog_stats = (self.version, CatalogStats(self.df))
+        return self._catalog_stats[1]
+
+    def catalog_stats(self):
+        """
+        Statistik katalog per genre, penulis, jadwal update dan status (lihat catalog_stats.py),
+        misalnya model.catalog_stats().summary('Genre') untuk analitik genre.
+
+        Returns:
+        CatalogStats: Index kelompok untuk versi katalog saat ini
+        """
+        self._ensure_fitted()
+        return self._ensure_catalog_stats()
+
+    @instrumented('more_from_writer')
+    def more_from_writer(self, title, k=10):
+        """
+        Karya lain dari penulis judul yang diberikan, diurutkan menurut rating tertinggi.
+        Dibaca dari daftar anggota penulis di CatalogStats dalam O(jumlah karya penulis).
+
+        Parameters:
+        title (str atau int): Judul webtoon atau id katalog
+        k (int): Jumlah judul maksimum yang dikembalikan
+
+        Returns:
+        pandas.DataFrame: Kolom Name, Genre, Writer dan Rating (bisa kosong jika penulis
+                          hanya punya satu karya), atau None jika judul tidak ditemukan
+        """
+        self._ensure_fitted()
+        idx = self.titles.get(title)
+        if idx is None:
+            return None
+        stats = self._ensure_catalog_stats()
+        writer = stats.group_of('Writer', idx)
+        others = stats.members('Writer', writer) if writer is not None else np.empty(0, dtype=np.int32)
+        others = others[others != idx]
+        self.instrumentation.count('candidates', len(others))
+
+        # Rating NaN berada di akhir; rating sama mengikuti urutan katalog
+        rating = self.df['Rating'].to_numpy(dtype=np.float64, na_value=np.nan)[others]
+        others = others[np.argsort(-rating, kind='stable')[:k]]
+        return self.df.iloc[others][RECOMMENDATION_COLUMNS]
+
+    def similarity(self, title_a, title_b):
+        """
+        Hitung skor kesamaan konten (cosine TF-IDF atau embedding) antara dua judul webtoon.
+
+        Parameters:
+        title_a (str): Judul webtoon pertama
+        title_b (str): Judul webtoon kedua
+
+        Returns:
+        float: Skor cosine similarity, atau None jika salah satu judul tidak ditemukan
+        """
+        self._ensure_fitted()
+        idx_a, idx_b = self.titles.get(title_a), self.titles.get(title_b)
+        if idx_a is None or idx_b is None:
+            return None
+        # Baris fitur sudah ternormalisasi L2, sehingga cosine = dot product
+        return float(paired_similarity(self.features[[idx_a]], self.features[[idx_b]])[0])
+
+    @instrumented('neighbors')
+    def neighbors(self, seed_indices, k=10, ranking='similarity', mmr_lambda=None, min_genres=None, **filters):
+        """
+        Ambil top-k index dan skor untuk posisi baris webtoon acuan tanpa membangun DataFrame.
+
+        Parameters:
+        seed_indices (array-like): Posisi baris webtoon acuan
+        k (int): Jumlah rekomendasi per webtoon acuan
+        ranking (str): 'similarity' atau 'hybrid', sama dengan get_recommendations
+        mmr_lambda, min_genres: Re-ranking MMR opsional, sama dengan get_recommendations
+        **filters: Filter opsional, sama dengan get_recommendations
+
+        Returns:
+        tuple: (rec_indices, rec_scores), keduanya berukuran len(seed_indices)×k; jika item
+               yang lolos filter kurang dari k, sisa posisinya berskor -inf
+        """
+        self._ensure_fitted()
+        weights = self._ranking_weights(ranking)
+        diversity = normalize_diversity(mmr_lambda, min_genres)
+        seed_indices = np.asarray(seed_indices, dtype=np.int64)
+        filters = normalize_filters(filters)
+        self._note_query(ranking, k, filters, diversity, seeds=len(seed_indices))
+        if diversity is not None:
+            # MMR memilih item satu per satu per webtoon acuan, jadi tidak bisa di-batch
+            k = min(k, self.features.shape[0] - 1)
+            top = np.zeros((len(seed_indices), k), dtype=np.int64)
+            top_scores = np.full((len(seed_indices), k), -np.inf, dtype=self.features.dtype)
+            for row, idx in enumerate(seed_indices):
+                indices, scores = self._rank(idx, k, filters, weights, diversity)
+                top[row, :len(indices)], top_scores[row, :len(scores)] = indices, scores
+            return top, top_scores
+        if weights is not None and not filters:
+            served = self._hybrid_from_table(seed_indices, k, weights)
+            if served is not None:
+                return served
+        if filters or weights is not None:
+            return self._constrained_top_k(seed_indices, k, filters, weights)
+        if k <= self.neighbor_indices.shape[1]:
+            self.instrumentation.count('candidates', len(seed_indices) * k)
+            return (self.neighbor_indices[seed_indices, :k],
+                    dequantize_scores(self.neighbor_scores[seed_indices, :k]))
+        self.instrumentation.count('candidates', len(seed_indices) * self.features.shape[0])
+        return batch_top_k(self.features, seed_indices, k, block_size=self.block_size)
+
+    @instrumented('get_recommendations_batch')
+    def get_recommendations_batch(self, titles, k=10, ranking='similarity', mmr_lambda=None, min_genres=None,
+                                  **filters):
+        """
+        Berikan rekomendasi untuk banyak judul webtoon dalam satu panggilan.
+        Semua judul di-resolve lewat index judul (titles.py) sekaligus dan top-k dihitung untuk seluruh batch.
+        Judul yang tidak ditemukan dilewati.
+
+        Parameters:
+        titles (list): Daftar judul webtoon yang menjadi acuan rekomendasi
+        k (int): Jumlah rekomendasi per judul
+        ranking (str): 'similarity' atau 'hybrid', sama dengan get_recommendations
+        mmr_lambda, min_genres: Re-ranking MMR opsional, sama dengan get_recommendations
+        **filters: Filter opsional, sama dengan get_recommendations
+
+        Returns:
+        pandas.DataFrame: Tabel format panjang dengan kolom Seed, Rank, Name, Genre, Writer,
+                          Rating dan Similarity Score (k baris per judul yang ditemukan);
+                          ranking 'hybrid' menambah kolom Hybrid Score
+        """
+        self._ensure_fitted()
+        titles = pd.Index(titles)
+        positions = self.titles.get_indexer(titles)
+        found = positions >= 0
+        self.instrumentation.count('titles_not_found', int((~found).sum()))
+        titles = titles[found]
+        seed_indices = positions[found]
+
+        rec_indices, rec_scores = self.neighbors(seed_indices, k=k, ranking=ranking, mmr_lambda=mmr_lambda,
+                                                 min_genres=min_genres, **filters)
+
+        n_recs = rec_indices.shape[1]
+        result = self.df[RECOMMENDATION_COLUMNS].iloc[rec_indices.ravel()].reset_index(drop=True)
+        result.insert(0, 'Seed', np.repeat(titles.to_numpy(), n_recs))
+        result.insert(1, 'Rank', np.tile(np.arange(1, n_recs + 1), len(titles)))
+        if ranking == 'hybrid':
+            result['Similarity Score'] = self._hybrid_similarity(
+                seed_indices, rec_indices, rec_scores, self.hybrid_weights).ravel()
+            result['Hybrid Score'] = rec_scores.ravel()
+        else:
+            result['Similarity Score'] = rec_scores.ravel()
+        if filters or mmr_lambda is not None or min_genres is not None:
+            # Posisi tanpa kandidat yang lolos filter (skor -inf) dibuang
+            result = result[np.isfinite(rec_scores.ravel())].reset_index(drop=True)
+        return result
+
+    @instrumented('recommend_for_profile')
+    def recommend_for_profile(self, read_titles, weights=None, k=10, **filters):
+        """
+        Rekomendasi untuk seorang pengguna dari riwayat bacaannya (cold-start pengguna baru).
+        Baris TF-IDF judul yang sudah dibaca digabung menjadi satu vektor profil sparse dan
+        katalog diskor dengan satu perkalian matriks-vektor; judul yang sudah dibaca tidak
+        ikut direkomendasikan.
+
+        Parameters:
+        read_titles (list): Judul (atau id katalog) yang sudah dibaca; judul yang tidak
+                            ditemukan dilewati
+        weights (list, optional): Bobot per judul, misalnya rating dari pengguna; default 1
+        k (int): Jumlah rekomendasi yang dikembalikan
+        **filters: Filter opsional, sama dengan get_recommendations
+
+        Returns:
+        pandas.DataFrame: DataFrame berisi k rekomendasi teratas (Similarity Score = cosine
+                          terhadap profil), atau None jika tidak ada judul yang ditemukan
+        """
+        self._ensure_fitted()
+        filters = normalize_filters(filters)
+        history = self._history_matrix([read_titles], None if weights is None else [weights])
+        if history.nnz == 0:
+            return None
+
+        top, top_scores = self._profile_top_k(history, k, filters)
+        keep = np.isfinite(top_scores[0])
+        result = self.df.iloc[top[0, keep]][RECOMMENDATION_COLUMNS].copy()
+        result['Similarity Score'] = top_scores[0, keep]
+        return result
+
+    @instrumented('recommend_for_profiles')
+    def recommend_for_profiles(self, histories, weights=None, k=10, **filters):
+        """
+        Versi batch recommend_for_profile untuk banyak pengguna sekaligus. Profil dihitung
+        per blok pengguna dengan satu perkalian matriks sparse.
+
+        Parameters:
+        histories (dict atau list): Riwayat bacaan per pengguna; dict {pengguna: [judul, ...]}
+                                    atau list of list (pengguna = posisi di list)
+        weights (dict atau list, optional): Bobot per judul dengan struktur yang sama
+        k (int): Jumlah rekomendasi per pengguna
+        **filters: Filter opsional, sama dengan get_recommendations
+
+        Returns:
+        pandas.DataFrame: Tabel format panjang dengan kolom User, Rank, Name, Genre, Writer,
+                          Rating dan Similarity Score; pengguna tanpa judul yang ditemukan dilewati
+        """
+        self._ensure_fitted()
+        filters = normalize_filters(filters)
+        users = list(histories) if isinstance(histories, dict) else list(range(len(histories)))
+        if isinstance(histories, dict):
+            histories = [histories[user] for user in users]
+            weights = None if weights is None else [weights[user] for user in users]
+        history = self._history_matrix(histories, weights)
+
+        found = np.diff(history.indptr) > 0
+        top, top_scores = self._profile_top_k(history[found], k, filters)
+
+        n_recs = top.shape[1]
+        result = self.df[RECOMMENDATION_COLUMNS].iloc[top.ravel()].reset_index(drop=True)
+        result.insert(0, 'User', np.repeat(np.array(users, dtype=object)[found], n_recs))
+        result.insert(1, 'Rank', np.tile(np.arange(1, n_recs + 1), int(found.sum())))
+        result['Similarity Score'] = top_scores.ravel()
+        # Posisi tanpa kandidat (semua judul sudah dibaca atau tidak lolos filter) dibuang
+        return result[np.isfinite(top_scores.ravel())].reset_index(drop=True)
+
+    def _history_matrix(self, histories, weights=None):
+        # Matriks bobot bacaan pengguna×item; judul ganda dalam satu riwayat dijumlahkan
+        n_items = self.tfidf_matrix.shape[0]
+        indptr, indices, values = [0], [], []
+        for user, titles in enumerate(histories):
+            positions = self.titles.get_indexer(titles)
+            if weights is None:
+                user_weights = np.ones(len(positions))
+            else:
+                user_weights = np.asarray(weights[user], dtype=np.float64)
+                if user_weights.shape != positions.shape:
+                    raise ValueError("Jumlah bobot harus sama dengan jumlah judul yang dibaca.")
+            found = positions >= 0
+            indices.append(positions[found])
+            values.append(user_weights[found])
+            indptr.append(indptr[-1] + int(found.sum()))
+        history = sp.csr_matrix(
+            (np.concatenate(values or [[]]), np.concatenate(indices or [[]]).astype(np.int64), indptr),
+            shape=(len(histories), n_items))
+        history.sum_duplicates()
+        return history
+
+    def _profile_top_k(self, history, k, filters):
+        self.instrumentation.count('users', history.shape[0])
+        self.instrumentation.count('candidates', history.shape[0] * history.shape[1])
+        mask = self._ensure_filter_index().matches(filters) if filters else None
+        return profile_top_k(self.features, history, k, block_size=self.block_size, mask=mask)
+
+    def drift(self):
+        """
+        Ukur drift model sejak fit terakhir.
+
+        Returns:
+        dict: 'idf' (rata-rata perubahan relatif bobot IDF jika dihitung ulang dari katalog
+              saat ini) dan 'vocabulary' (jumlah term baru di luar kosakata, relatif terhadap
+              ukuran kosakata)
+        """
+        self._ensure_fitted()
+        self._ensure_doc_freq()
+
+        # Rumus smooth IDF yang sama dengan TfidfVectorizer
+        n_docs = self.tfidf_matrix.shape[0]
+        current_idf = np.log((1 + n_docs) / (1 + self._doc_freq)) + 1
+        idf_drift = np.mean(np.abs(current_idf - self.tfidf.idf_) / self.tfidf.idf_)
+        vocabulary_drift = len(self._oov_terms) / len(self.tfidf.idf_)
+        return {'idf': float(idf_drift), 'vocabulary': float(vocabulary_drift)}
+
+    @instrumented('add_items')
+    def add_items(self, items):
+        """
+        Tambahkan webtoon baru tanpa fit ulang TF-IDF. Item baru divectorize dengan kosakata
+        dan IDF yang ada, tetangganya dihitung, dan daftar top-k item lama yang terpengaruh
+        ditambal. Fit ulang penuh hanya dijalankan jika drift melewati refit_threshold.
+
+        Parameters:
+        items (pandas.DataFrame atau list of dict): Baris baru dengan kolom dataset
+                                                    (Name, Writer, Genre, Summary, ...)
+
+        Returns:
+        numpy.ndarray: Posisi baris item baru di katalog
+        """
+        self._ensure_fitted()
+        self._ensure_doc_freq()
+        self.ann_index = None
+        new = pd.DataFrame(items).reset_index(drop=True)
+        for column, numeric_column in COUNT_COLUMNS.items():
+            if column in new and numeric_column not in new:
+                new[numeric_column], _ = parse_counts(new[column])
+        new = clean_missing_values(new.drop(columns=DERIVED_COLUMNS, errors='ignore'))
+
+        n_old = self.tfidf_matrix.shape[0]
+        new_ids = np.arange(n_old, n_old + len(new))
+        new_matrix = self._vectorize(new)
+        new_features = new_matrix if self.embeddings is None else self._embed(new, self.tfidf, new_matrix)
+
+        self.df = pd.concat([self.df, new], ignore_index=True)
+        self.tfidf_matrix = sp.vstack([self.tfidf_matrix, new_matrix], format='csr')
+        if self.embeddings is not None:
+            self.embeddings = np.vstack([self.embeddings, new_features])
+        self.titles.add(new['Name'].to_numpy(), new['id'].to_numpy() if 'id' in new else None)
+        self._doc_freq = self._doc_freq + self._term_counts(new_matrix)
+        if self._maybe_refit():
+            return new_ids
+
+        # Tetangga item baru dihitung dari satu blok similarity terhadap seluruh katalog
+        block = dot_similarity(new_features, self.features)
+        width = min(self.neighbor_k, self.features.shape[0] - 1)
+        new_neighbors, new_scores = top_k(block.copy(), width, exclude=new_ids)
+
+        # Tambal daftar item lama yang skor minimumnya dikalahkan oleh item baru
+        candidate_scores = block[:, :n_old].T
+        table_scores = dequantize_scores(self.neighbor_scores)
+        tolerance = score_tolerance(self.neighbor_scores.dtype)
+        widen = self.neighbor_indices.shape[1] < width
+        if widen:
+            # Katalog masih lebih kecil dari neighbor_k: semua daftar lama diperlebar
+            affected = np.arange(n_old)
+        else:
+            affected = np.flatnonzero((candidate_scores > table_scores[:, -1:] - tolerance).any(axis=1))
+        if tolerance:
+            # Skor float16/int8 tidak cukup presisi untuk digabung; baris terdampak dihitung ulang
+            patched_indices, patched_scores = batch_top_k(
+                self.features, affected, width, block_size=self.block_size)
+        else:
+            patched_indices, patched_scores = merge_top_k(
+                self.neighbor_indices[affected], table_scores[affected],
+                np.broadcast_to(new_ids, (len(affected), len(new_ids))), candidate_scores[affected], width)
+
+        if widen:
+            neighbor_indices, neighbor_scores = patched_indices, patched_scores
+        else:
+            # Salin dulu karena tabel dari artifact bisa berupa memmap read-only
+            neighbor_indices = np.array(self.neighbor_indices)
+            neighbor_scores = np.array(table_scores)
+            neighbor_indices[affected] = patched_indices
+            neighbor_scores[affected] = patched_scores
+
+        self._set_neighbor_table(np.vstack([neighbor_indices, new_neighbors]),
+                                 np.vstack([neighbor_scores, new_scores]))
+        if self._catalog_stats is not None and self._catalog_stats[0] == self.version:
+            # Item baru hanya di-append, jadi statistik katalog diperbarui tanpa dibangun ulang
+            self._catalog_stats[1].add(new)
+            self._catalog_stats = (self.version + 1, self._catalog_stats[1])
+        self._source_modified = True
+        self.version += 1
+        return new_ids
+
+    @instrumented('update_item')
+    def update_item(self, title, **changes):
+        """
+        Ubah kolom sebuah webtoon (misalnya Summary atau Genre) dan perbarui vektornya tanpa
+        fit ulang. Daftar tetangga yang memuat item ini dihitung ulang; daftar lain yang kini
+        dikalahkan oleh item ini ditambal.
+
+        Parameters:
+        title (str atau int): Judul webtoon atau id katalog yang diubah
+        **changes: Nilai kolom baru, misalnya Summary='...'
+        """
+        self._ensure_fitted()
+        self._ensure_doc_freq()
+        self.ann_index = None
+        idx = self.titles[title]
+
+        row = self.df.loc[[idx]].drop(columns=DERIVED_COLUMNS, errors='ignore')
+        for column, value in changes.items():
+            row[column] = value
+        row = clean_missing_values(row)
+        new_vector = self._vectorize(row)
+        new_features = new_vector if self.embeddings is None else self._embed(row, self.tfidf, new_vector)
+
+        self._doc_freq = self._doc_freq - self._term_counts(self.tfidf_matrix[idx]) + self._term_counts(new_vector)
+        self.tfidf_matrix = sp.vstack(
+            [self.tfidf_matrix[:idx], new_vector, self.tfidf_matrix[idx + 1:]], format='csr')
+        if self.embeddings is not None:
+            # Salin dulu karena embedding dari artifact bisa berupa memmap read-only
+            self.embeddings = np.array(self.embeddings)
+            self.embeddings[idx] = new_features[0]
+        for column in row.columns:
+            self.df.loc[idx, column] = row.at[idx, column]
+        if 'Name' in changes or 'id' in changes:
+            self.titles = build_title_index(self.df)
+        if self._maybe_refit():
+            return
+
+        scores = dot_similarity(new_features, self.features)[0]
+        neighbor_indices = np.array(self.neighbor_indices)
+        neighbor_scores = np.array(dequantize_scores(self.neighbor_scores))
+        tolerance = score_tolerance(self.neighbor_scores.dtype)
+        width = neighbor_indices.shape[1]
+
+        # Jika skor item ini turun, penggantinya ada di luar tabel, jadi daftar yang
+        # memuat item ini (dan daftar item ini sendiri) dihitung ulang penuh
+        stale = np.union1d(np.flatnonzero((neighbor_indices == idx).any(axis=1)), [idx])
+        affected = np.setdiff1d(np.flatnonzero(scores >= neighbor_scores[:, -1] - tolerance), stale)
+        if tolerance:
+            # Skor float16/int8 tidak cukup presisi untuk digabung; ikut dihitung ulang penuh
+            stale, affected = np.union1d(stale, affected), affected[:0]
+        neighbor_indices[affected], neighbor_scores[affected] = merge_top_k(
+            neighbor_indices[affected], neighbor_scores[affected],
+            np.full((len(affected), 1), idx), scores[affected, None], width)
+        neighbor_indices[stale], neighbor_scores[stale] = batch_top_k(
+            self.features, stale, width, block_size=self.block_size)
+
+        self._set_neighbor_table(neighbor_indices, neighbor_scores)
+        self._source_modified = True
+        self.version += 1
+
+    @instrumented('remove_item')
+    def remove_item(self, title):
+        """
+        Hapus sebuah webtoon dari katalog tanpa fit ulang. Daftar tetangga yang memuat item
+        ini dihitung ulang; index item lain di tabel tetangga digeser.
+
+        Parameters:
+        title (str atau int): Judul webtoon atau id katalog yang dihapus
+        """
+        self._ensure_fitted()
+        self._ensure_doc_freq()
+        self.ann_index = None
+        idx = self.titles[title]
+
+        keep = np.ones(self.tfidf_matrix.shape[0], dtype=bool)
+        keep[idx] = False
+        self._doc_freq = self._doc_freq - self._term_counts(self.tfidf_matrix[idx])
+        self.tfidf_matrix = self.tfidf_matrix[keep]
+        if self.embeddings is not None:
+            self.embeddings = self.embeddings[keep]
+        self.df = self.df.drop(index=idx).reset_index(drop=True)
+        self.titles = build_title_index(self.df)
+        if self._maybe_refit():
+            return
+
+        neighbor_indices = np.delete(self.neighbor_indices, idx, axis=0)
+        neighbor_scores = np.delete(dequantize_scores(self.neighbor_scores), idx, axis=0)
+        stale = np.flatnonzero((neighbor_indices == idx).any(axis=1))
+        neighbor_indices -= neighbor_indices > idx
+
+        width = min(neighbor_indices.shape[1], self.features.shape[0] - 1)
+        neighbor_indices, neighbor_scores = neighbor_indices[:, :width], neighbor_scores[:, :width]
+        neighbor_indices[stale], neighbor_scores[stale] = batch_top_k(
+            self.features, stale, width, block_size=self.block_size)
+
+        self._set_neighbor_table(neighbor_indices, neighbor_scores)
+        self._source_modified = True
+        self.version += 1
+
+    def memory_report(self):
+        """
+        Ukuran memori setiap struktur model.
+
+        Returns:
+        pandas.DataFrame: Kolom structure, dtype, shape dan MB
+        """
+        self._ensure_fitted()
+        structures = {
+            'catalog': self.df,
+            'tfidf_matrix': self.tfidf_matrix,
+            'idf': self.tfidf.idf_,
+            'title_index': self.titles.first_positions(),
+            'neighbor_indices': self.neighbor_indices,
+            'neighbor_scores': self.neighbor_scores,
+        }
+        if self.embeddings is not None:
+            structures['embeddings'] = self.embeddings
+        if self.ann_index is not None:
+            structures['ann_vectors'] = self.ann_index.vectors
+        if self._hybrid_table is not None:
+            structures['hybrid_indices'], structures['hybrid_scores'], _ = self._hybrid_table[2]
+        if self._catalog_stats is not None:
+            for column, index in self._catalog_stats[1].groups.items():
+                structures[f'stats_{column.lower()}_codes'] = index.codes
+                structures[f'stats_{column.lower()}_members'] = index._order
+        rows = [{
+            'structure': name,
+            'dtype': 'DataFrame' if isinstance(value, pd.DataFrame) else str(value.dtype),
+            'shape': value.shape,
+            'MB': nbytes(value) / 2**20,
+        } for name, value in structures.items()]
+        return pd.DataFrame(rows)
+
+    def _set_neighbor_table(self, neighbor_indices, neighbor_scores):
+        # Simpan tabel dengan dtype sesuai precision (index int32, skor float16/int8, ...)
+        self.neighbor_indices = np.asarray(neighbor_indices, dtype=index_dtype(self.precision))
+        self.neighbor_scores = quantize_scores(neighbor_scores, self.precision)
+
+    def _embed(self, df, tfidf, tfidf_matrix, fit=False):
+        # Vektor embedding baris df; baris TF-IDF dipakai ulang jika LSA berbagi vectorizer model
+        embedding = self.embedding
+        if embedding is None:
+            raise ValueError("Model memuat embedding tetapi tidak punya backend; muat dengan load(..., embedding=...).")
+        if embedding.text_column in df:
+            texts = df[embedding.text_column]
+        else:
+            # Kolom turunan (Content_Features untuk LSA) hanya dibangun untuk backend yang membutuhkannya
+            texts = build_content_features(df[['Genre', 'Writer', 'Summary']].copy())[embedding.text_column]
+        if fit and not embedding.is_fitted:
+            if isinstance(tfidf, FieldVectorizer):
+                # Blok berbobot per field bukan TF-IDF teks; LSA melatih vectorizer-nya sendiri
+                tfidf = tfidf_matrix = None
+            embedding.fit(texts, vectorizer=tfidf, matrix=tfidf_matrix)
+        features = tfidf_matrix if getattr(embedding, 'vectorizer', None) is tfidf else None
+        vectors, n_encoded = embed_texts(embedding, texts, cache=self.embedding_cache,
+                                         batch_size=self.embedding_batch_size, features=features)
+        self.instrumentation.count('encoded', n_encoded)
+        self.instrumentation.count('reused', len(vectors) - n_encoded)
+        return vectors
+
+    def _term_counts(self, matrix):
+        return np.bincount(matrix.indices, minlength=self.tfidf_matrix.shape[1])
+
+    def _ensure_doc_freq(self):
+        if self._doc_freq is None:
+            self._doc_freq = self._term_counts(self.tfidf_matrix)
+
+    def _vectorize(self, df):
+        # Baris TF-IDF dengan kosakata dan IDF model; term di luar kosakata dicatat untuk drift
+        if isinstance(self.tfidf, FieldVectorizer):
+            matrix, oov_terms = self.tfidf.transform(df, return_oov=True)
+        else:
+            matrix, oov_terms = transform_fields(self.tfidf, df)
+        self._oov_terms.update(oov_terms)
+        return matrix
+
+    def _can_refit(self):
+        # Katalog streaming tetap tanpa Summary untuk baris lama walaupun item baru membawa kolom itu
+        return not self._streaming and 'Summary' in self.df and self.df['Summary'].notna().all()
+
+    def _maybe_refit(self):
+        # Katalog yang tidak bisa di-fit ulang (lihat _can_refit) tetap ditambal secara incremental
+        if self._can_refit() and max(self.drift().values()) > self.refit_threshold:
+            self.refit()
+            return True
+        return False
+
@@ -0,0 +1,448 @@
+"""
+Service HTTP rekomendasi webtoon berbasis asyncio (hanya standard library).
+
+Model dimuat satu kali per proses worker (dari artifact dengan mmap, atau fit dari CSV)
+sebelum port dibuka. Event loop hanya mengurus I/O; scoring dan pembuatan DataFrame
+dijalankan di ThreadPoolExecutor agar loop tidak pernah terblokir.
+
+Endpoint:
+    GET  /health                               Status service dan jumlah item
+    GET  /recommendations?title=...&k=10       Rekomendasi untuk satu judul
+    POST /recommendations/batch                Body JSON {"titles": [...], "k": 10, "ranking": ..., "filters": {...}}
+    POST /recommendations/profile              Body JSON {"histories": {"user": [judul, ...]}, "weights": {...},
+                                               "k": 10, "filters": {...}}; rekomendasi dari riwayat bacaan
+    GET  /similarity?a=...&b=...               Skor kesamaan antara dua judul
+    GET  /titles?q=...&limit=10                Autocomplete prefix dan saran "did you mean"
+    GET  /metrics                              Metrik tahap dan query format teks Prometheus (--metrics)
+
+Filter opsional (lihat filters.py): genre dan status (dipisah koma untuk beberapa nilai),
+min_rating dan min_subscribers, misalnya /recommendations?title=...&status=Completed&min_rating=9.5
+
+Parameter ranking=hybrid mencampur similarity dengan prior popularity dan rating
+(lihat priors.py); skornya dikirim sebagai 'Hybrid Score'. Parameter mmr_lambda dan
+min_genres mengaktifkan re-ranking diversitas (lihat diversity.py).
+
+Instrumentasi (lihat instrumentation.py) dinyalakan per sink: --metrics untuk endpoint
+/metrics, --log-stages untuk satu baris log per tahap dan --trace untuk JSON lines. Setiap
+request HTTP dicatat sebagai tahap http_request, scoring di model sebagai tahap query-nya
+sendiri. Dengan --workers > 1 setiap proses menyimpan metriknya sendiri.
+
+Opsi --embedding mengganti similarity TF-IDF dengan embedding padat (lihat embeddings.py):
+'lsa', file .npz hasil LSAEmbedder.save() atau direktori model sentence-transformers lokal.
+
+Cara menjalankan:
+    python service.py --port 8000 --artifact model/ --workers 4
+    python service.py --port 8000 --artifact model/ --metrics --trace stages.jsonl
+    python service.py --port 8000 --embedding lsa.npz --embedding-cache cache/
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from diversity import normalize_diversity
+from embeddings import load_embedder
+from filters import FILTER_NAMES, normalize_filters
+from instrumentation import Instrumentation, JSONLinesSink, LogSink, PrometheusSink
+from priors import check_ranking
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender
+
+MAX_K = 1000
+MAX_SUGGESTIONS = 50
+MAX_BODY_BYTES = 1 << 20
+
+
+class HTTPError(Exception):
+    """
+    Error yang dikirim ke client sebagai response JSON {"error": ..., **details}.
+    """
+
+    def __init__(self, status, message, **details):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.details = details
+
+
+def _parse_k(value):
+    try:
+        k = int(value)
+    except (TypeError, ValueError):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"k harus bilangan bulat, bukan '{value}'.")
+    if not 1 <= k <= MAX_K:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"k harus di antara 1 dan {MAX_K}.")
+    return k
+
+
+def _parse_filters(source):
+    filters = {name: source[name] for name in FILTER_NAMES if name in source}
+    for name in ('genre', 'status'):
+        if isinstance(filters.get(name), str):
+            filters[name] = filters[name].split(',')
+    try:
+        normalize_filters(filters)
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+    return filters
+
+
+def _parse_body(body):
+    try:
+        request = json.loads(body or b'{}')
+    except json.JSONDecodeError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Body bukan JSON yang valid: {e}.")
+    if not isinstance(request, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body harus berupa objek JSON.")
+    return request
+
+
+def _parse_body_filters(request):
+    filters = request.get('filters') or {}
+    if not isinstance(filters, dict) or set(filters) - set(FILTER_NAMES):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"'filters' harus berupa objek dengan kunci {FILTER_NAMES}.")
+    return _parse_filters(filters)
+
+
+def _parse_diversity(source):
+    options = {name: source.get(name) for name in ('mmr_lambda', 'min_genres')}
+    try:
+        normalize_diversity(**options)
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+    return options
+
+
+def _parse_ranking(value):
+    try:
+        check_ranking(value)
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+    return value
+
+
+def _recommendation(record, score_name='Similarity Score'):
+    rating = None if math.isnan(record.rating) else record.rating
+    return {'Name': record.name, 'Genre': record.genre, 'Writer': record.writer, 'Rating': rating,
+            score_name: record.score}
+
+
+def _records(result):
+    # NaN (misalnya Rating kosong) bukan JSON yang valid, jadi dikirim sebagai null
+    return [{name: None if isinstance(value, float) and math.isnan(value) else value
+             for name, value in row.items()}
+            for row in result.to_dict(orient='records')]
+
+
+class RecommendationService:
+    """
+    Routing request HTTP ke WebtoonRecommender yang sudah dimuat.
+
+    Parameters:
+    model (WebtoonRecommender): Model yang sudah di-fit atau dimuat dari artifact
+    executor (concurrent.futures.Executor): Pool tempat scoring dijalankan
+    """
+
+    def __init__(self, model, executor):
+        self.model = model
+        self.executor = executor
+        self.routes = {
+            ('GET', '/health'): self.health,
+            ('GET', '/recommendations'): self.recommendations,
+            ('POST', '/recommendations/batch'): self.recommendations_batch,
+            ('POST', '/recommendations/profile'): self.recommendations_profile,
+            ('GET', '/similarity'): self.similarity,
+            ('GET', '/titles'): self.titles,
+        }
+        self.metrics = model.instrumentation.find_sink(PrometheusSink)
+        if self.metrics is not None:
+            self.routes[('GET', '/metrics')] = self.metrics_text
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def dispatch(self, method, target, body):
+        """
+        Jalankan handler untuk satu request.
+
+        Returns:
+        tuple: (HTTPStatus, payload JSON atau teks)
+        """
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        # Path di luar route tidak dijadikan label agar jumlah seri metrik tetap terbatas
+        path = url.path if any(route == url.path for _, route in self.routes) else 'other'
+        with self.model.instrumentation.stage('http_request', method=method, path=path) as stage:
+            try:
+                if handler is None:
+                    if path != 'other':
+                        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Method {method} tidak didukung.")
+                    raise HTTPError(HTTPStatus.NOT_FOUND, f"Endpoint '{url.path}' tidak ditemukan.")
+                query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+                payload = await handler(query, body)
+            except HTTPError as e:
+                stage.label('status', e.status.value)
+                raise
+            stage.label('status', HTTPStatus.OK.value)
+            return HTTPStatus.OK, payload
+
+    async def health(self, query, body):
+        return {'status': 'ok', 'items': int(self.model.tfidf_matrix.shape[0]), 'cache': self.model.cache.stats()}
+
+    async def metrics_text(self, query, body):
+        return self.metrics.render()
+
+    async def recommendations(self, query, body):
+        if 'title' not in query:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Parameter 'title' wajib diisi.")
+        title, k, filters = query['title'], _parse_k(query.get('k', 10)), _parse_filters(query)
+        ranking, diversity = _parse_ranking(query.get('ranking', 'similarity')), _parse_diversity(query)
+        records = await self._run(partial(self.model.get_recommendation_records, title, k, ranking,
+                                          **diversity, **filters))
+        if records is None:
+            suggestions = await self._run(partial(self.model.titles.suggest, title, limit=3))
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Webtoon '{title}' tidak ditemukan.",
+                            did_you_mean=[name for name, _ in suggestions])
+        score_name = 'Hybrid Score' if ranking == 'hybrid' else 'Similarity Score'
+        return {'title': title, 'recommendations': [_recommendation(record, score_name) for record in records]}
+
+    async def recommendations_batch(self, query, body):
+        request = _parse_body(body)
+        titles = request.get('titles')
+        if not isinstance(titles, list) or not all(isinstance(title, str) for title in titles):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body harus berisi 'titles' berupa list judul.")
+        k = _parse_k(request.get('k', 10))
+        filters = _parse_body_filters(request)
+        ranking, diversity = _parse_ranking(request.get('ranking', 'similarity')), _parse_diversity(request)
+        result = await self._run(partial(self.model.get_recommendations_batch, titles, k, ranking,
+                                         **diversity, **filters))
+        # Judul yang ada tetapi seluruh hasilnya tersaring filter bukan 'not_found'
+        return {
+            'recommendations': _records(result),
+            'not_found': [title for title in titles if title not in self.model.titles],
+        }
+
+    async def recommendations_profile(self, query, body):
+        request = _parse_body(body)
+        histories, weights = request.get('histories'), request.get('weights')
+        if not isinstance(histories, dict) or not all(
+                isinstance(titles, list) and all(isinstance(title, str) for title in titles)
+                for titles in histories.values()):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body harus berisi 'histories' berupa objek {pengguna: [judul]}.")
+        if weights is not None and (not isinstance(weights, dict) or set(weights) != set(histories)):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'weights' harus berupa objek dengan pengguna yang sama dengan 'histories'.")
+        k = _parse_k(request.get('k', 10))
+        filters = _parse_body_filters(request)
+        try:
+            result = await self._run(partial(self.model.recommend_for_profiles, histories, weights, k, **filters))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        # Hanya pengguna yang tidak satu pun judul riwayatnya dikenal; hasil kosong karena filter tetap 'found'
+        return {
+            'recommendations': _records(result),
+            'not_found': [user for user, titles in histories.items()
+                          if not any(title in self.model.titles for title in titles)],
+        }
+
+    async def similarity(self, query, body):
+        if 'a' not in query or 'b' not in query:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Parameter 'a' dan 'b' wajib diisi.")
+        score = await self._run(self.model.similarity, query['a'], query['b'])
+        if score is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Salah satu judul tidak ditemukan.")
+        return {'a': query['a'], 'b': query['b'], 'score': score}
+
+    async def titles(self, query, body):
+        if 'q' not in query:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Parameter 'q' wajib diisi.")
+        try:
+            limit = int(query.get('limit', 10))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"limit harus bilangan bulat, bukan '{query['limit']}'.")
+        if not 1 <= limit <= MAX_SUGGESTIONS:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"limit harus di antara 1 dan {MAX_SUGGESTIONS}.")
+        # Struktur prefix/trigram dibangun lazy pada panggilan pertama, jadi dijalankan di pool
+        completions = await self._run(self.model.titles.complete, query['q'], limit)
+        suggestions = await self._run(self.model.titles.suggest, query['q'], limit)
+        return {
+            'q': query['q'],
+            'completions': completions,
+            'suggestions': [{'title': name, 'similarity': round(score, 4)} for name, score in suggestions],
+        }
+
+
+async def read_request(reader):
+    """
+    Baca satu request HTTP/1.1 dari stream.
+
+    Returns:
+    tuple: (method, target, headers, body), atau None jika koneksi ditutup client
+    """
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'Request line tidak valid.')
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'Content-Length tidak valid.')
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Body request terlalu besar.')
+    body = await reader.readexactly(length) if length else b''
+    return method, target, headers, body
+
+
+def write_response(writer, status, payload, keep_alive):
+    # Payload string (metrik Prometheus) dikirim apa adanya sebagai teks
+    if isinstance(payload, str):
+        body, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+    else:
+        body, content_type = json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json; charset=utf-8'
+    head = (f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+
+
+async def handle_connection(service, reader, writer):
+    # Satu koneksi bisa membawa banyak request berurutan (keep-alive)
+    try:
+        while True:
+            # Request yang gagal diparse menutup koneksi; error aplikasi tidak
+            keep_alive = False
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                status, payload = await service.dispatch(method, target, body)
+            except HTTPError as e:
+                status, payload = e.status, {'error': e.message, **e.details}
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as e:
+                keep_alive = False
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f'{type(e).__name__}: {e}'}
+            write_response(writer, status, payload, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def load_model(artifact=None, data=DEFAULT_DATA_PATH, neighbor_k=50, instrumentation=None, embedding=None,
+               embedding_cache=None):
+    """
+    Muat model sekali per worker: dari artifact (mmap, tanpa fit) atau fit dari CSV.
+    """
+    if artifact is not None:
+        model = WebtoonRecommender.load(artifact, embedding=embedding, embedding_cache=embedding_cache)
+        if instrumentation is not None:
+            model.instrumentation = instrumentation
+        return model
+    return WebtoonRecommender(data, neighbor_k=neighbor_k, instrumentation=instrumentation, embedding=embedding,
+                              embedding_cache=embedding_cache).fit()
+
+
+def make_instrumentation(args):
+    """
+    Bangun Instrumentation dari opsi --metrics, --log-stages dan --trace.
+    """
+    sinks = []
+    if args.metrics:
+        sinks.append(PrometheusSink())
+    if args.log_stages:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+        sinks.append(LogSink())
+    if args.trace:
+        sinks.append(JSONLinesSink(args.trace))
+    return Instrumentation(sinks)
+
+
+async def serve(model, host='127.0.0.1', port=8000, threads=4, reuse_port=False):
+    """
+    Jalankan service sampai proses dihentikan.
+
+    Parameters:
+    model (WebtoonRecommender): Model yang sudah siap dipakai
+    host (str): Alamat bind
+    port (int): Port bind
+    threads (int): Jumlah thread scoring per worker
+    reuse_port (bool): Bind dengan SO_REUSEPORT agar beberapa worker berbagi satu port
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        service = RecommendationService(model, executor)
+        server = await asyncio.start_server(
+            lambda reader, writer: handle_connection(service, reader, writer),
+            host, port, reuse_port=reuse_port or None)
+        async with server:
+            await server.serve_forever()
+
+
+def run_worker(args):
+    embedding = load_embedder(args.embedding) if args.embedding else None
+    model = load_model(args.artifact, args.data, args.neighbor_k, make_instrumentation(args), embedding,
+                       args.embedding_cache)
+    print(f"Worker siap di http://{args.host}:{args.port} ({model.tfidf_matrix.shape[0]} webtoon)", flush=True)
+    try:
+        asyncio.run(serve(model, args.host, args.port, args.threads, reuse_port=args.workers > 1))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--artifact', help='Direktori artifact hasil WebtoonRecommender.save()')
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH), help='CSV dataset jika tanpa artifact')
+    parser.add_argument('--neighbor-k', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=1, help='Jumlah proses worker (SO_REUSEPORT)')
+    parser.add_argument('--threads', type=int, default=4, help='Jumlah thread scoring per worker')
+    parser.add_argument('--metrics', action='store_true', help='Aktifkan endpoint /metrics (Prometheus)')
+    parser.add_argument('--log-stages', action='store_true', help='Log satu baris per tahap dan query')
+    parser.add_argument('--trace', help='File JSON lines untuk event tahap dan query')
+    parser.add_argument('--embedding', help="Backend embedding: 'lsa', file .npz LSA atau direktori model lokal")
+    parser.add_argument('--embedding-cache', help='Direktori cache vektor embedding')
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        run_worker(args)
+        return
+
+    # Setiap proses memuat modelnya sendiri; artifact mmap berbagi page cache yang sama
+    workers = [multiprocessing.Process(target=run_worker, args=(args,)) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == '__main__':
+    main()
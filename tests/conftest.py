@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Modul proyek berada di root repository (tanpa package), sama seperti benchmarks/; modul bantu
+# benchmarks (synthetic, legacy) dipakai sebagai data uji dan pembanding
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
@@ -0,0 +1,108 @@
+"""
+Round-trip artifact save()/load() untuk setiap perubahan format versi 2.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from artifact import ARTIFACT_VERSION
+from embeddings import LSAEmbedder
+from features import FIELD_SEPARATOR
+from recommender import DEFAULT_DATA_PATH, WebtoonRecommender
+
+
+def assert_same_neighbors(model, loaded):
+    seeds = np.arange(model.features.shape[0])
+    for ranking in ('similarity', 'hybrid'):
+        expected = model.neighbors(seeds, k=10, ranking=ranking)
+        actual = loaded.neighbors(seeds, k=10, ranking=ranking)
+        np.testing.assert_array_equal(actual[0], expected[0])
+        np.testing.assert_array_equal(actual[1], expected[1])
+
+
+@pytest.mark.parametrize('precision', ['float64', 'float32', 'float16', 'int8'])
+def test_precision_round_trip(tmp_path, precision):
+    model = WebtoonRecommender(precision=precision).fit()
+    model.save(tmp_path)
+    loaded = WebtoonRecommender.load(tmp_path, source_path=DEFAULT_DATA_PATH)
+
+    header = json.loads((tmp_path / 'header.json').read_text())
+    assert header['version'] == ARTIFACT_VERSION
+    assert header['precision'] == loaded.precision == precision
+    assert loaded.tfidf_matrix.dtype == model.tfidf_matrix.dtype
+    assert loaded.neighbor_scores.dtype == model.neighbor_scores.dtype
+    assert_same_neighbors(model, loaded)
+
+
+def test_embeddings_round_trip(tmp_path):
+    embedding = LSAEmbedder(n_components=16)
+    model = WebtoonRecommender(embedding=embedding).fit()
+    model.save(tmp_path)
+
+    loaded = WebtoonRecommender.load(tmp_path, embedding=embedding)
+    np.testing.assert_array_equal(loaded.embeddings, model.embeddings)
+    assert_same_neighbors(model, loaded)
+
+    with pytest.raises(ValueError, match='dibangun dengan embedding'):
+        WebtoonRecommender.load(tmp_path, embedding=LSAEmbedder(n_components=16))
+
+
+def test_field_weights_round_trip(tmp_path):
+    model = WebtoonRecommender(field_weights='default').fit()
+    model.save(tmp_path)
+    loaded = WebtoonRecommender.load(tmp_path)
+
+    vocabulary = json.loads((tmp_path / 'vocabulary.json').read_text())
+    assert {term.split(FIELD_SEPARATOR, 1)[0] for term in vocabulary} == {'Genre', 'Writer', 'Summary'}
+    assert loaded.field_weights == model.field_weights
+    assert_same_neighbors(model, loaded)
+
+    # Kosakata per field yang dipulihkan menghasilkan vektor yang sama untuk baris baru
+    row = model.df.iloc[:3]
+    assert (loaded.tfidf.transform(row) != model.tfidf.transform(row)).nnz == 0
+
+
+def test_streaming_round_trip(tmp_path):
+    model = WebtoonRecommender(chunksize=100).fit()
+    model.save(tmp_path)
+    loaded = WebtoonRecommender.load(tmp_path)
+
+    assert json.loads((tmp_path / 'header.json').read_text())['streaming'] is True
+    assert loaded._streaming
+    with pytest.raises(ValueError):
+        loaded.refit()
+
+
+def test_rejects_previous_version(tmp_path):
+    WebtoonRecommender().fit().save(tmp_path)
+    header_path = tmp_path / 'header.json'
+    header = json.loads(header_path.read_text())
+    header['version'] = 1
+    header_path.write_text(json.dumps(header))
+
+    with pytest.raises(ValueError, match='versi format 1'):
+        WebtoonRecommender.load(tmp_path)
+
+
+def test_overwrite_drops_stale_optional_arrays(tmp_path):
+    WebtoonRecommender(embedding=LSAEmbedder(n_components=16)).fit().save(tmp_path)
+    assert (tmp_path / 'embeddings.npy').exists()
+
+    WebtoonRecommender().fit().save(tmp_path)
+    assert not (tmp_path / 'embeddings.npy').exists()
+    assert not (tmp_path / 'title_index.npy').exists()
+    assert WebtoonRecommender.load(tmp_path).embeddings is None
+
+
+def test_source_checksum_cleared_after_mutation(tmp_path):
+    model = WebtoonRecommender(refit_threshold=1.0).fit()
+    model.save(tmp_path / 'fitted')
+    WebtoonRecommender.load(tmp_path / 'fitted', source_path=DEFAULT_DATA_PATH)
+
+    model.remove_item('Tower of God')
+    model.save(tmp_path / 'mutated')
+    header = json.loads((tmp_path / 'mutated' / 'header.json').read_text())
+    assert header['source_sha256'] is None
+    with pytest.raises(ValueError, match='dataset yang berbeda'):
+        WebtoonRecommender.load(tmp_path / 'mutated', source_path=DEFAULT_DATA_PATH)
@@ -0,0 +1,92 @@
+"""
+ResultCache (LRU, TTL, invalidasi versi, counter) dan kunci cache get_recommendation_records.
+"""
+import pytest
+
+from cache import ResultCache
+from recommender import WebtoonRecommender
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = ResultCache(maxsize=2)
+    cache.put('a', 1, 'A')
+    cache.put('b', 1, 'B')
+    assert cache.get('a', 1) == (True, 'A')
+    cache.put('c', 1, 'C')
+
+    assert cache.get('b', 1) == (False, None)
+    assert cache.get('a', 1) == (True, 'A')
+    assert cache.get('c', 1) == (True, 'C')
+    assert len(cache) == 2
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=10, ttl=5.0, clock=clock)
+    cache.put('a', 1, 'A')
+
+    clock.now = 4.9
+    assert cache.get('a', 1) == (True, 'A')
+    clock.now = 5.0
+    assert cache.get('a', 1) == (False, None)
+    assert len(cache) == 0
+    assert cache.stats()['expirations'] == 1
+
+
+def test_version_change_invalidates_everything():
+    cache = ResultCache(maxsize=10)
+    cache.put('a', 1, 'A')
+    cache.put('b', 1, 'B')
+
+    assert cache.get('a', 2) == (False, None)
+    assert len(cache) == 0
+    cache.put('a', 2, 'A2')
+    assert cache.get('a', 2) == (True, 'A2')
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_counters_and_disabled_cache():
+    cache = ResultCache(maxsize=1)
+    computed = []
+    compute = lambda: computed.append(1) or len(computed)  # noqa: E731
+    assert cache.get_or_compute('a', 1, compute) == 1
+    assert cache.get_or_compute('a', 1, compute) == 1
+    assert cache.get_or_compute('b', 1, compute) == 2
+
+    assert cache.stats() == {'size': 1, 'maxsize': 1, 'hits': 1, 'misses': 2, 'hit_rate': pytest.approx(1 / 3),
+                             'evictions': 1, 'expirations': 0, 'invalidations': 0}
+
+    disabled = ResultCache(maxsize=0)
+    disabled.put('a', 1, 'A')
+    assert disabled.get('a', 1) == (False, None)
+    assert len(disabled) == 0
+
+
+def test_records_key_uses_resolved_title():
+    model = WebtoonRecommender().fit()
+    title = 'Tower of God'
+    item_id = int(model.df['id'].iloc[model.titles[title]])
+
+    results = [model.get_recommendation_records(key, k=5) for key in [title, title.upper(), f'  {title} ', item_id]]
+    assert all(records is results[0] for records in results)
+    stats = model.cache.stats()
+    assert (stats['size'], stats['hits'], stats['misses']) == (1, 3, 1)
+
+    # Judul yang tidak ditemukan tidak mengisi cache
+    assert model.get_recommendation_records('Tidak Ada Judul Ini') is None
+    assert model.cache.stats()['size'] == 1
+
+    model.remove_item(title)
+    assert model.get_recommendation_records(title) is None
+    assert model.cache.stats()['invalidations'] == 0
+    assert model.get_recommendation_records('True Beauty', k=5) is not None
+    assert model.cache.stats()['invalidations'] == 1
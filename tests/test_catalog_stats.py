@@ -0,0 +1,81 @@
+"""
+CatalogStats harus sama dengan groupby pandas atas katalog model, juga setelah item
+ditambahkan (jalur incremental) dan dihapus (dibangun ulang setelah versi naik).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog_stats import GROUP_COLUMNS, METRICS
+from filters import catalog_status
+from recommender import WebtoonRecommender
+from synthetic import synthetic_dataset
+
+
+@pytest.fixture
+def model():
+    return WebtoonRecommender(refit_threshold=1e9).fit()
+
+
+def expected_summary(df, column):
+    keys = catalog_status(df) if column == 'Status' else df[column]
+    grouped = df[list(METRICS)].groupby(keys.rename(column))
+    expected = grouped.mean().rename(columns=METRICS)
+    expected['Webtoon Count'] = grouped.size()
+    return expected.sort_index()
+
+
+def assert_matches_groupby(stats, df):
+    assert stats.n_items == len(df)
+    for column in GROUP_COLUMNS:
+        pd.testing.assert_frame_equal(stats.summary(column), expected_summary(df, column),
+                                      check_dtype=False, rtol=0, atol=1e-9)
+
+
+def assert_members_match(stats, df):
+    for column in ['Genre', 'Writer']:
+        for label in df[column].dropna().unique():
+            expected = np.flatnonzero((df[column] == label).to_numpy())
+            np.testing.assert_array_equal(stats.members(column, label), expected)
+            assert all(stats.group_of(column, position) == label for position in expected)
+    assert len(stats.members('Genre', 'Tidak Ada Genre Ini')) == 0
+
+
+def synthetic_items(n_rows, seed):
+    items = synthetic_dataset(n_rows, seed=seed, n_writers=200)
+    items['id'] = 10**6 + np.arange(n_rows)
+    return items
+
+
+def test_summary_matches_groupby(model):
+    stats = model.catalog_stats()
+    assert_matches_groupby(stats, model.df)
+    assert_members_match(stats, model.df)
+
+
+def test_writer_style_matches_catalog_order(model):
+    stats = model.catalog_stats()
+    for writer in model.df['Writer'].dropna().unique()[:50]:
+        genres = model.df.loc[model.df['Writer'] == writer, 'Genre'].dropna()
+        assert stats.writer_style(writer) == ' '.join(genres)
+    assert stats.writer_style('Penulis Yang Tidak Ada') == ''
+
+
+@pytest.mark.parametrize('n_rows', [3, 1500])
+def test_add_items_updates_incrementally(model, n_rows):
+    # 1500 baris melewati batas buffer anggota sehingga CSR ikut digabung ulang
+    stats = model.catalog_stats()
+    model.add_items(synthetic_items(n_rows, seed=n_rows))
+    assert model.catalog_stats() is stats
+    assert_matches_groupby(stats, model.df)
+    assert_members_match(stats, model.df)
+
+
+def test_remove_item_rebuilds(model):
+    model.catalog_stats()
+    model.add_items(synthetic_items(3, seed=1))
+    model.remove_item(model.df['Name'].iloc[0])
+    model.remove_item(int(model.df['id'].iloc[-1]))
+    stats = model.catalog_stats()
+    assert_matches_groupby(stats, model.df)
+    assert_members_match(stats, model.df)
@@ -0,0 +1,85 @@
+"""
+mmr_select harus sama dengan loop greedy MMR naif, termasuk batasan cakupan genre.
+"""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+from diversity import mmr_select, normalize_diversity
+from recommender import WebtoonRecommender
+
+
+def naive_mmr(relevance, vectors, k, mmr_lambda, genres=None, min_genres=None):
+    candidates = [i for i in range(len(relevance)) if np.isfinite(relevance[i])]
+    selected = []
+    for _ in range(min(k, len(candidates))):
+        pool = [i for i in candidates if i not in selected]
+        if genres is not None and min_genres:
+            covered = {genres[i] for i in selected}
+            uncovered = [i for i in pool if genres[i] not in covered]
+            if min_genres - len(covered) >= k - len(selected) and uncovered:
+                pool = uncovered
+
+        def score(i):
+            redundancy = max((float(vectors[i] @ vectors[j]) for j in selected), default=0.0)
+            return mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy
+
+        # Seri jatuh ke posisi pertama, sama dengan np.argmax
+        selected.append(max(pool, key=lambda i: (score(i), -i)))
+    return selected
+
+
+@pytest.fixture
+def pool():
+    rng = np.random.default_rng(0)
+    vectors = normalize(rng.random((60, 12)) ** 4)
+    relevance = np.sort(rng.random(60))[::-1]
+    relevance[-5:] = -np.inf
+    genres = rng.integers(0, 6, size=60)
+    return relevance, vectors, genres
+
+
+@pytest.mark.parametrize('mmr_lambda', [0.0, 0.3, 0.7, 1.0])
+def test_matches_naive_greedy(pool, mmr_lambda):
+    relevance, vectors, _ = pool
+    expected = naive_mmr(relevance, vectors, 10, mmr_lambda)
+    np.testing.assert_array_equal(mmr_select(relevance, vectors, 10, mmr_lambda), expected)
+    # Jalur sparse (baris TF-IDF) harus memilih item yang sama dengan jalur padat
+    np.testing.assert_array_equal(mmr_select(relevance, sp.csr_matrix(vectors), 10, mmr_lambda), expected)
+
+
+@pytest.mark.parametrize('min_genres', [3, 6])
+def test_genre_coverage_matches_naive_greedy(pool, min_genres):
+    relevance, vectors, genres = pool
+    selected = mmr_select(relevance, vectors, 8, 0.9, genres, min_genres)
+    np.testing.assert_array_equal(selected, naive_mmr(relevance, vectors, 8, 0.9, genres, min_genres))
+    assert len(set(genres[selected])) >= min_genres
+
+
+def test_lambda_one_keeps_relevance_order(pool):
+    relevance, vectors, _ = pool
+    np.testing.assert_array_equal(mmr_select(relevance, vectors, 10, 1.0), np.arange(10))
+    assert len(mmr_select(relevance, vectors, 100, 0.5)) == 55
+    assert len(mmr_select(np.full(3, -np.inf), vectors[:3], 2)) == 0
+
+
+def test_model_reranks_its_pool():
+    model = WebtoonRecommender(mmr_pool=40).fit()
+    idx = model.titles['Tower of God']
+    pool, pool_scores = model._rank(idx, 40)
+    expected = naive_mmr(pool_scores, model.features[pool].toarray(), 10, 0.5,
+                         model.df['Genre'].to_numpy()[pool], 4)
+
+    result = model.get_recommendations('Tower of God', k=10, mmr_lambda=0.5, min_genres=4)
+    np.testing.assert_array_equal(result.index, model.df.index[pool[expected]])
+    assert result['Genre'].nunique() >= 4
+
+
+def test_normalize_diversity():
+    assert normalize_diversity() is None
+    assert normalize_diversity(min_genres=2) == (1.0, 2)
+    assert normalize_diversity('0.5') == (0.5, None)
+    for options in ({'mmr_lambda': 1.5}, {'mmr_lambda': 'x'}, {'min_genres': 0}, {'min_genres': 'dua'}):
+        with pytest.raises(ValueError):
+            normalize_diversity(**options)
@@ -0,0 +1,48 @@
+"""
+Metrik evaluasi pada hasil berfilter: posisi padding (-inf) tidak ikut dihitung.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluation import compute_metrics, evaluate_model
+from recommender import WebtoonRecommender
+
+
+@pytest.fixture(scope='module')
+def model():
+    return WebtoonRecommender().fit()
+
+
+def test_compute_metrics_ignores_padding():
+    df = pd.DataFrame({'Genre': ['Action', 'Drama', 'Comedy', 'Action'], 'Rating': [9.0, 8.0, 7.0, 10.0]})
+    rec_indices = np.array([[1, 0, 2], [3, 0, 0], [0, 0, 0]])
+    rec_scores = np.array([[0.5, 0.3, -np.inf], [0.9, -np.inf, -np.inf], [-np.inf, -np.inf, -np.inf]])
+
+    metrics = compute_metrics(df, rec_indices, rec_scores)
+    assert metrics['avg_diversity'] == 1.5
+    assert metrics['genre_coverage'] == pytest.approx(200 / 3)
+    assert metrics['avg_similarity'] == pytest.approx(1.7 / 3)
+    assert metrics['avg_recommended_rating'] == pytest.approx(9.0)
+
+
+@pytest.mark.parametrize('ranking', ['similarity', 'hybrid'])
+def test_evaluate_model_with_filter_padding(model, ranking):
+    # Genre Informative hanya punya 5 judul, jadi setiap baris top-10 berisi padding
+    metrics, recommendations = evaluate_model(model, k=10, ranking=ranking, genre='Informative')
+    valid = np.isfinite(recommendations['scores'])
+
+    assert not valid.all()
+    assert np.isfinite([metrics['avg_similarity'], metrics['avg_diversity'],
+                        metrics['avg_recommended_rating']]).all()
+    assert 0 <= metrics['avg_similarity'] <= 1
+    assert metrics['genre_coverage'] == pytest.approx(100 / model.df['Genre'].nunique())
+
+
+def test_hybrid_reports_cosine_similarity(model):
+    similarity, _ = evaluate_model(model, k=10)
+    hybrid, recommendations = evaluate_model(model, k=10, ranking='hybrid')
+
+    # Skor hybrid mengandung bias prior; avg_similarity tetap cosine antara acuan dan rekomendasi
+    assert hybrid['avg_similarity'] < recommendations['scores'].mean()
+    assert hybrid['avg_similarity'] <= similarity['avg_similarity']
@@ -0,0 +1,98 @@
+"""
+Jalur TF-IDF per field harus sama dengan TfidfVectorizer atas teks: fit_tfidf_fields dan
+transform_fields identik bit per bit dengan Content_Features, dan FieldVectorizer dengan bobot
+seragam sama dengan blok TfidfVectorizer per field yang di-hstack lalu dinormalisasi.
+"""
+from functools import partial
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+from features import FIELD_COLUMNS, FIELD_SEPARATOR, FieldVectorizer, fit_tfidf_fields, transform_fields
+from ingest import build_content_features, clean_missing_values, clean_texts, load_catalog
+from recommender import DEFAULT_DATA_PATH, make_vectorizer
+from synthetic import synthetic_dataset
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    df, _ = load_catalog(DEFAULT_DATA_PATH)
+    return clean_missing_values(df)
+
+
+@pytest.fixture(scope='module')
+def new_rows():
+    # Kosakata sintetis acak, jadi hampir semua term di luar kosakata katalog
+    return clean_missing_values(synthetic_dataset(300, seed=7, n_words=2000))
+
+
+def assert_identical(actual, expected):
+    assert actual.dtype == expected.dtype and actual.shape == expected.shape
+    np.testing.assert_array_equal(actual.indptr, expected.indptr)
+    np.testing.assert_array_equal(actual.indices, expected.indices)
+    np.testing.assert_array_equal(actual.data, expected.data)
+
+
+def content_features(df):
+    return build_content_features(df.copy())['Content_Features']
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('source', ['catalog', 'synthetic'])
+def test_fit_tfidf_fields_matches_tfidf_vectorizer(catalog, source, dtype):
+    df = catalog if source == 'catalog' else clean_missing_values(synthetic_dataset(2000, seed=3))
+    factory = partial(make_vectorizer, dtype=dtype)
+    expected_tfidf = factory()
+    expected = expected_tfidf.fit_transform(content_features(df))
+
+    tfidf, matrix = fit_tfidf_fields(df, factory)
+    assert_identical(matrix, expected)
+    assert tfidf.vocabulary_ == expected_tfidf.vocabulary_
+    np.testing.assert_array_equal(tfidf.idf_, expected_tfidf.idf_)
+
+
+def test_transform_fields_matches_transform(catalog, new_rows):
+    tfidf, _ = fit_tfidf_fields(catalog, make_vectorizer)
+    texts = content_features(new_rows)
+    matrix, oov = transform_fields(tfidf, new_rows)
+
+    assert_identical(matrix, tfidf.transform(texts))
+    analyzer = tfidf.build_analyzer()
+    assert oov == {term for text in texts for term in analyzer(text) if term not in tfidf.vocabulary_}
+
+
+def per_field_tfidf(df, new):
+    # Pembanding: TfidfVectorizer biasa per field, blok dinormalisasi, di-hstack lalu dinormalisasi lagi
+    fitted, transformed, names = [], [], []
+    for field in FIELD_COLUMNS:
+        vectorizer = make_vectorizer()
+        fitted.append(vectorizer.fit_transform(clean_texts(df[field])))
+        transformed.append(vectorizer.transform(clean_texts(new[field])))
+        names.extend(field + FIELD_SEPARATOR + term for term in vectorizer.get_feature_names_out())
+    return normalize(sp.hstack(fitted, format='csr')), normalize(sp.hstack(transformed, format='csr')), names
+
+
+@pytest.mark.parametrize('weight', [1.0, 3.0])
+def test_field_vectorizer_uniform_weights(catalog, new_rows, weight):
+    expected, expected_new, names = per_field_tfidf(catalog, new_rows)
+    vectorizer = FieldVectorizer({field: weight for field in FIELD_COLUMNS})
+    matrix = vectorizer.fit_transform(catalog)
+
+    assert list(vectorizer.get_feature_names_out()) == names
+    np.testing.assert_array_equal(matrix.getnnz(axis=1), expected.getnnz(axis=1))
+    np.testing.assert_allclose(matrix.toarray(), expected.toarray(), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(vectorizer.transform(new_rows).toarray(), expected_new.toarray(), rtol=0, atol=1e-12)
+
+
+def test_field_vectorizer_single_field_matches_tfidf_vectorizer(catalog, new_rows):
+    vectorizer = FieldVectorizer({'Summary': 1.0})
+    expected_tfidf = make_vectorizer()
+    expected = expected_tfidf.fit_transform(clean_texts(catalog['Summary']))
+
+    np.testing.assert_allclose(vectorizer.fit_transform(catalog).toarray(), expected.toarray(), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(vectorizer.idf_, expected_tfidf.idf_, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(vectorizer.transform(new_rows).toarray(),
+                               expected_tfidf.transform(clean_texts(new_rows['Summary'])).toarray(),
+                               rtol=0, atol=1e-12)
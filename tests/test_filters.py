@@ -0,0 +1,90 @@
+"""
+Filter diterapkan sebelum seleksi top-k: hasil neighbors() harus sama dengan ranking
+brute-force atas item yang lolos filter.
+"""
+import numpy as np
+import pytest
+
+from filters import normalize_filters
+from recommender import WebtoonRecommender
+
+FILTER_CASES = [
+    {'genre': 'Romance'},
+    {'genre': ['Fantasy', 'ACTION'], 'status': 'Completed'},
+    {'min_rating': 9.7},
+    {'min_subscribers': 1000000, 'status': 'ongoing'},
+]
+
+
+@pytest.fixture(scope='module')
+def model():
+    return WebtoonRecommender(neighbor_k=20).fit()
+
+
+@pytest.fixture(scope='module')
+def similarity(model):
+    scores = (model.features @ model.features.T).toarray()
+    np.fill_diagonal(scores, -np.inf)
+    return scores
+
+
+def brute_force_mask(df, filters):
+    mask = np.ones(len(df), dtype=bool)
+    if 'genre' in filters:
+        genres = {filters['genre']} if isinstance(filters['genre'], str) else set(filters['genre'])
+        mask &= df['Genre'].str.casefold().isin({genre.casefold() for genre in genres}).to_numpy()
+    if 'status' in filters:
+        completed = (df['Update'] == 'COMPLETED').to_numpy()
+        mask &= completed if filters['status'].casefold() == 'completed' else ~completed
+    if 'min_rating' in filters:
+        mask &= (df['Rating'] >= filters['min_rating']).to_numpy()
+    if 'min_subscribers' in filters:
+        mask &= (df['Subscribers_Numeric'] >= filters['min_subscribers']).to_numpy()
+    return mask
+
+
+@pytest.mark.parametrize('filters', FILTER_CASES)
+@pytest.mark.parametrize('k', [5, 50])
+def test_filtered_neighbors_match_brute_force(model, similarity, filters, k):
+    # k=5 dilayani tabel tetangga (neighbor_k=20) jika cukup kandidat lolos; k=50 lewat baris penuh
+    seeds = np.arange(len(model.df))
+    rec_indices, rec_scores = model.neighbors(seeds, k=k, **filters)
+
+    mask = brute_force_mask(model.df, filters)
+    np.testing.assert_array_equal(model._ensure_filter_index().matches(normalize_filters(filters)), mask)
+    expected = np.sort(np.where(mask, similarity, -np.inf), axis=1)[:, ::-1][:, :k]
+    np.testing.assert_allclose(rec_scores, expected, rtol=0, atol=1e-12)
+
+    valid = np.isfinite(rec_scores)
+    assert mask[rec_indices[valid]].all()
+    assert (rec_indices != seeds[:, None])[valid].all()
+    np.testing.assert_allclose(similarity[np.broadcast_to(seeds[:, None], rec_indices.shape)[valid],
+                                          rec_indices[valid]], rec_scores[valid], rtol=0, atol=1e-12)
+
+
+def test_filter_with_fewer_candidates_than_k(model):
+    # Genre Heartwarming hanya punya 2 judul
+    members = np.flatnonzero(model.df['Genre'] == 'Heartwarming')
+    assert len(members) == 2
+    outsider = int(np.flatnonzero(model.df['Genre'] != 'Heartwarming')[0])
+
+    rec_indices, rec_scores = model.neighbors([outsider, members[0]], k=10, genre='Heartwarming')
+    assert np.isfinite(rec_scores[0]).sum() == 2
+    assert set(rec_indices[0, :2]) == set(members)
+    assert np.isfinite(rec_scores[1]).sum() == 1 and rec_indices[1, 0] == members[1]
+    assert np.isneginf(rec_scores[:, 2:]).all()
+
+    title = model.df['Name'].iloc[outsider]
+    assert len(model.get_recommendations(title, k=10, genre='Heartwarming')) == 2
+    assert len(model.get_recommendation_records(title, k=10, genre='Heartwarming')) == 2
+    batch = model.get_recommendations_batch([title, model.df['Name'].iloc[members[0]]], k=10, genre='Heartwarming')
+    assert batch['Seed'].value_counts().to_dict() == {title: 2, model.df['Name'].iloc[members[0]]: 1}
+
+    assert len(model.get_recommendations(title, k=10, genre='Tidak Ada')) == 0
+
+
+def test_unknown_filter_rejected(model):
+    with pytest.raises(ValueError, match='Filter tidak dikenal'):
+        model.neighbors([0], k=5, rating=9)
+    with pytest.raises(ValueError, match='angka'):
+        model.neighbors([0], k=5, min_rating='tinggi')
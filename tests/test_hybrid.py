@@ -0,0 +1,77 @@
+"""
+Ranking hybrid: tabel hybrid (_hybrid_from_table), _constrained_top_k dan baris penuh harus
+sama dengan brute force skor similarity × bobot + bias prior.
+"""
+import numpy as np
+import pytest
+
+from recommender import WebtoonRecommender
+
+
+@pytest.fixture(scope='module')
+def model():
+    return WebtoonRecommender().fit()
+
+
+@pytest.fixture(scope='module')
+def hybrid_scores(model):
+    weights = model.hybrid_weights
+    similarity = (model.features @ model.features.T).toarray()
+    np.fill_diagonal(similarity, -np.inf)
+    bias, _ = model._ensure_priors().bias(weights, model.features.dtype)
+    return dict(weights)['similarity'] * similarity + bias
+
+
+def assert_matches_brute_force(hybrid_scores, seeds, indices, scores, k):
+    expected = np.sort(hybrid_scores[seeds], axis=1)[:, ::-1][:, :k]
+    np.testing.assert_allclose(scores, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(np.take_along_axis(hybrid_scores[seeds], indices, axis=1), scores, rtol=0, atol=1e-12)
+
+
+def test_table_matches_constrained_and_brute_force(model, hybrid_scores):
+    seeds = np.arange(len(model.df))
+    weights = model.hybrid_weights
+    model._ensure_hybrid_table(weights)
+    depth = model._hybrid_table[3]
+    assert depth >= 10
+
+    for k in (1, 10, depth):
+        served = model._hybrid_from_table(seeds, k, weights)
+        assert served is not None
+        top, top_scores = model._constrained_top_k(seeds, k, (), weights)
+        np.testing.assert_array_equal(served[0], top)
+        np.testing.assert_array_equal(served[1], top_scores)
+        assert_matches_brute_force(hybrid_scores, seeds, *served, k)
+
+
+def test_rows_beyond_exact_depth_use_full_rows(model, hybrid_scores):
+    seeds = np.arange(len(model.df))
+    weights = model.hybrid_weights
+    _, _, exact = model._ensure_hybrid_table(weights)
+    k = int(exact.max()) + 1
+    assert model._hybrid_from_table(seeds, k, weights) is None
+
+    # Baris sebagian dari tabel, sebagian dari baris similarity penuh; k > neighbor_k seluruhnya penuh
+    for k in (k, model.neighbor_k + 10):
+        indices, scores = model.neighbors(seeds, k=k, ranking='hybrid')
+        assert_matches_brute_force(hybrid_scores, seeds, indices, scores, k)
+
+
+def test_single_query_matches_batch(model):
+    title = 'Tower of God'
+    idx = model.titles[title]
+    indices, scores = model.neighbors([idx], k=10, ranking='hybrid')
+    result = model.get_recommendations(title, k=10, ranking='hybrid')
+
+    np.testing.assert_array_equal(result.index, model.df.index[indices[0]])
+    np.testing.assert_array_equal(result['Hybrid Score'], scores[0])
+    cosine = (model.features[idx] @ model.features[indices[0]].T).toarray()[0]
+    np.testing.assert_allclose(result['Similarity Score'], cosine, rtol=0, atol=1e-12)
+
+
+def test_quantized_scores_skip_table():
+    model = WebtoonRecommender(precision='int8').fit()
+    seeds = np.arange(len(model.df))
+    assert model._hybrid_from_table(seeds, 1, model.hybrid_weights) is None
+    indices, scores = model.neighbors(seeds, k=10, ranking='hybrid')
+    assert indices.shape == (len(seeds), 10) and np.isfinite(scores).all()
@@ -0,0 +1,60 @@
+"""
+add_items/update_item/remove_item harus menghasilkan tabel tetangga yang sama dengan
+build_neighbor_table atas matriks fitur setelah perubahan.
+"""
+import numpy as np
+import pytest
+
+from ranking import build_neighbor_table
+from recommender import WebtoonRecommender
+
+NEW_ITEMS = [
+    {'id': 100001, 'Name': 'Tower of Stars', 'Writer': 'SIU', 'Likes': '1.2M', 'Genre': 'Fantasy', 'Rating': 9.5,
+     'Subscribers': '250K', 'Summary': 'A boy climbs a tower of gods to find the girl who left him.',
+     'Update': 'UP EVERY SUNDAY', 'Reading Link': ''},
+    {'id': 100002, 'Name': 'Quiet Garden', 'Writer': 'Unknown Writer', 'Likes': None, 'Genre': 'Slice of life',
+     'Rating': 9.1, 'Subscribers': '1,234', 'Summary': 'Two neighbours tend a garden through the seasons.',
+     'Update': 'COMPLETED', 'Reading Link': ''},
+]
+
+
+@pytest.fixture
+def model():
+    # Ambang drift besar: perubahan selalu ditambal incremental, tidak pernah fit ulang
+    return WebtoonRecommender(refit_threshold=1e9).fit()
+
+
+def assert_matches_rebuild(model):
+    expected_indices, expected_scores = build_neighbor_table(model.features, k=model.neighbor_k,
+                                                             block_size=model.block_size)
+    np.testing.assert_allclose(model.neighbor_scores, expected_scores, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(model.neighbor_indices, expected_indices)
+
+
+def test_add_items(model):
+    n_items = len(model.df)
+    positions = model.add_items(NEW_ITEMS)
+
+    np.testing.assert_array_equal(positions, [n_items, n_items + 1])
+    assert np.isnan(model.df['Likes_Numeric'].iloc[-1])
+    assert model.titles['Quiet Garden'] == n_items + 1
+    assert_matches_rebuild(model)
+
+
+def test_update_item(model):
+    model.update_item('Tower of God', Summary='Two neighbours tend a garden through the seasons.',
+                      Genre='Slice of life')
+    assert_matches_rebuild(model)
+
+
+def test_remove_item(model):
+    model.remove_item('Tower of God')
+    assert 'Tower of God' not in model.titles
+    assert_matches_rebuild(model)
+
+
+def test_sequence_of_changes(model):
+    model.add_items(NEW_ITEMS)
+    model.update_item('Quiet Garden', Summary='A boy climbs a tower to find the girl who left him.')
+    model.remove_item('Tower of God')
+    assert_matches_rebuild(model)
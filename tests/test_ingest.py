@@ -0,0 +1,62 @@
+"""
+parse_counts: format M/K/ribuan, nilai null dan kebijakan nilai yang tidak valid.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingest import load_catalog, parse_counts
+from legacy import convert_to_numeric
+from recommender import DEFAULT_DATA_PATH
+
+
+def test_suffixes_and_separators():
+    values = pd.Series(['30.6M', '250K', '1,234', '42', ' 7.5K '], index=[10, 11, 12, 13, 14])
+    parsed, rejected = parse_counts(values)
+
+    np.testing.assert_allclose(parsed, [30600000.0, 250000.0, 1234.0, 42.0, 7500.0])
+    assert parsed.index.equals(values.index)
+    assert not rejected.any()
+
+
+def test_nulls_are_nan_and_not_rejected():
+    parsed, rejected = parse_counts(pd.Series(['1K', None, np.nan, '1K']))
+
+    np.testing.assert_array_equal(parsed.isna(), [False, True, True, False])
+    assert not rejected.any()
+
+
+@pytest.mark.parametrize('values', [pd.Series([None, None], dtype=object), pd.Series([np.nan]),
+                                    pd.Series([], dtype=object)])
+def test_all_null_or_empty(values):
+    parsed, rejected = parse_counts(values)
+
+    assert len(parsed) == len(values)
+    assert parsed.isna().all()
+    assert not rejected.any()
+
+
+def test_error_policies():
+    values = pd.Series(['12K', 'banyak', None])
+
+    parsed, rejected = parse_counts(values)
+    assert np.isnan(parsed[1])
+    np.testing.assert_array_equal(rejected, [False, True, False])
+
+    parsed, _ = parse_counts(values, on_error='zero')
+    assert parsed[1] == 0.0 and np.isnan(parsed[2])
+
+    with pytest.raises(ValueError, match='banyak'):
+        parse_counts(values, on_error='raise')
+    with pytest.raises(ValueError):
+        parse_counts(values, on_error='ignore')
+
+
+def test_matches_legacy_parser():
+    # Kolom asli dataset ditambah format tepi: hasilnya harus sama dengan parser per sel notebook
+    df, _ = load_catalog(DEFAULT_DATA_PATH)
+    values = pd.concat([df['Likes'], df['Subscribers'], pd.Series(['1,234', '0.5K', ' 2M ', 'abc', None])],
+                       ignore_index=True)
+    expected = values.map(convert_to_numeric).astype(np.float64)
+    parsed, _ = parse_counts(values)
+    np.testing.assert_array_equal(parsed, expected)
@@ -0,0 +1,110 @@
+"""
+Sink instrumentasi untuk satu fit bertahap: bentuk record JSON lines, histogram Prometheus
+yang konsisten dengan event yang sama, dan baris LogSink.
+"""
+import json
+import logging
+import re
+
+import pytest
+
+from instrumentation import DEFAULT_BUCKETS, Instrumentation, JSONLinesSink, LogSink, PrometheusSink
+from recommender import WebtoonRecommender
+
+EVENT_KEYS = {'timestamp', 'stage', 'parent', 'seconds', 'labels', 'counters'}
+
+FIT_STAGES = {'fit', 'read_csv', 'parse_counts', 'clean_text', 'tfidf_fit', 'neighbor_table', 'title_index'}
+
+SAMPLE = re.compile(r'^(\w+)\{(.*)\} (\S+)$')
+
+
+def parse_samples(text):
+    # Sampel Prometheus sebagai daftar (nama metrik, dict label, nilai)
+    samples = []
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        name, labels, value = SAMPLE.match(line).groups()
+        samples.append((name, dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', labels)), float(value)))
+    return samples
+
+
+@pytest.fixture(scope='module')
+def staged_fit(tmp_path_factory):
+    path = tmp_path_factory.mktemp('instrumentation') / 'events.jsonl'
+    prometheus, jsonl = PrometheusSink(), JSONLinesSink(path)
+    model = WebtoonRecommender(instrumentation=Instrumentation([prometheus, jsonl])).fit()
+    jsonl.close()
+    with open(path, encoding='utf-8') as f:
+        events = [json.loads(line) for line in f]
+    return model, events, prometheus.render()
+
+
+def test_jsonl_record_shape(staged_fit):
+    model, events, _ = staged_fit
+    for event in events:
+        assert set(event) == EVENT_KEYS
+        assert isinstance(event['seconds'], float) and event['seconds'] >= 0
+        assert isinstance(event['labels'], dict) and isinstance(event['counters'], dict)
+    assert {event['stage'] for event in events} >= FIT_STAGES
+
+    # Tahap anak selesai (dan dikirim) sebelum induknya; fit adalah tahap terluar
+    by_stage = {event['stage']: event for event in events}
+    assert events[-1]['stage'] == 'fit' and events[-1]['parent'] is None
+    assert all(by_stage[stage]['parent'] == 'fit' for stage in FIT_STAGES - {'fit'})
+    assert sum(by_stage[stage]['seconds'] for stage in FIT_STAGES - {'fit'}) <= by_stage['fit']['seconds']
+    assert by_stage['fit']['labels'] == {'workers': 1, 'precision': model.precision}
+    assert by_stage['read_csv']['counters'] == {'rows': len(model.df)}
+
+
+def test_prometheus_histogram_matches_events(staged_fit):
+    model, events, text = staged_fit
+    assert '# TYPE webtoon_stage_seconds histogram' in text
+    samples = parse_samples(text)
+
+    for stage in FIT_STAGES:
+        seconds = [event['seconds'] for event in events if event['stage'] == stage]
+        buckets = [(labels['le'], value) for name, labels, value in samples
+                   if name == 'webtoon_stage_seconds_bucket' and labels['stage'] == stage]
+        assert [le for le, _ in buckets] == [repr(upper) for upper in DEFAULT_BUCKETS] + ['+Inf']
+        assert [count for _, count in buckets] == [sum(s <= upper for s in seconds)
+                                                   for upper in DEFAULT_BUCKETS + (float('inf'),)]
+        totals = {name: value for name, labels, value in samples if labels.get('stage') == stage
+                  and name in ('webtoon_stage_seconds_sum', 'webtoon_stage_seconds_count')}
+        assert totals['webtoon_stage_seconds_count'] == len(seconds)
+        assert totals['webtoon_stage_seconds_sum'] == pytest.approx(sum(seconds), rel=1e-12)
+
+    rows = [(labels, value) for name, labels, value in samples if name == 'webtoon_stage_rows_total']
+    assert ({'stage': 'read_csv'}, float(len(model.df))) in rows
+
+
+def test_prometheus_buckets_labels_and_errors():
+    sink = PrometheusSink(namespace='test', buckets=(0.1, 1.0))
+    instrumentation = Instrumentation([sink])
+    for seconds in [0.05, 0.1, 0.5, 2.0]:
+        sink.emit({'stage': 'query', 'seconds': seconds, 'labels': {'ranking': 'a"b'}, 'counters': {'k': 10}})
+    with pytest.raises(ValueError):
+        with instrumentation.stage('query', ranking='a"b'):
+            raise ValueError
+
+    samples = parse_samples(sink.render())
+    labels = {'stage': 'query', 'ranking': 'a\\"b'}
+    buckets = [value for name, _, value in samples if name == 'test_stage_seconds_bucket']
+    # Event error (durasi ~0) ikut bucket pertama; batas le inklusif
+    assert buckets == [3, 4, 5]
+    assert ('test_stage_seconds_count', labels, 5.0) in samples
+    assert ('test_stage_k_total', labels, 40.0) in samples
+    assert ('test_stage_errors_total', labels, 1.0) in samples
+
+
+def test_log_sink_and_disabled_stage(caplog):
+    instrumentation = Instrumentation([LogSink()])
+    with caplog.at_level(logging.INFO, logger='webtoon.instrumentation'):
+        with instrumentation.stage('query', ranking='similarity') as stage:
+            stage.count('candidates', 3)
+            instrumentation.count('candidates', 2)
+    assert len(caplog.records) == 1
+    assert re.fullmatch(r'stage=query seconds=\d+\.\d{6} ranking=similarity candidates=5', caplog.messages[0])
+
+    disabled = Instrumentation()
+    assert disabled.stage('query') is disabled.stage('fit')
@@ -0,0 +1,97 @@
+"""
+materialize() yang terputus setelah satu shard harus bisa dilanjutkan dengan hasil yang sama
+persis dengan job tanpa gangguan, dan verify() harus lolos atas hasil tersebut.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import materialize as mlt
+from recommender import WebtoonRecommender
+
+SHARD_SIZE = 200
+
+
+@pytest.fixture(scope='module')
+def model():
+    return WebtoonRecommender().fit()
+
+
+def quiet(message):
+    pass
+
+
+def shard_digests(manifest):
+    return [shard['files'] for shard in manifest['shards']]
+
+
+def interrupt_after_first_shard(monkeypatch):
+    materialize_shard = mlt._materialize_shard
+    calls = []
+
+    def failing(shard, start, stop):
+        if calls:
+            raise KeyboardInterrupt
+        calls.append(shard)
+        return materialize_shard(shard, start, stop)
+
+    monkeypatch.setattr(mlt, '_materialize_shard', failing)
+
+
+@pytest.mark.parametrize('k', [10, 80])
+def test_resume_matches_uninterrupted(model, tmp_path, monkeypatch, k):
+    # k=10 dibaca dari tabel tetangga model, k=80 dihitung ulang per blok
+    expected = mlt.materialize(model, tmp_path / 'full', k=k, shard_size=SHARD_SIZE, log=quiet)
+    assert len(expected['shards']) == 3
+
+    with monkeypatch.context() as patch:
+        interrupt_after_first_shard(patch)
+        with pytest.raises(KeyboardInterrupt):
+            mlt.materialize(model, tmp_path / 'resumed', k=k, shard_size=SHARD_SIZE, log=quiet)
+    with open(tmp_path / 'resumed' / 'manifest.json', encoding='utf-8') as f:
+        assert json.load(f)['complete'] is False
+    with pytest.raises(ValueError, match='belum selesai'):
+        mlt.verify(model, tmp_path / 'resumed', log=quiet)
+    first_marker = (tmp_path / 'resumed' / 'shard-00000.json').read_text(encoding='utf-8')
+
+    messages = []
+    resumed = mlt.materialize(model, tmp_path / 'resumed', k=k, shard_size=SHARD_SIZE, log=messages.append)
+    assert messages[0] == '3 shard, 1 sudah selesai, 2 dihitung'
+    assert (tmp_path / 'resumed' / 'shard-00000.json').read_text(encoding='utf-8') == first_marker
+    assert shard_digests(resumed) == shard_digests(expected)
+    for shard in range(len(expected['shards'])):
+        full, partial = mlt.load_shard(tmp_path / 'full', shard), mlt.load_shard(tmp_path / 'resumed', shard)
+        for expected_array, resumed_array in zip(full, partial):
+            np.testing.assert_array_equal(resumed_array, expected_array)
+
+    result = mlt.verify(model, tmp_path / 'resumed', sample=len(model.df), log=quiet)
+    assert result['corrupt_shards'] == [] and result['mismatched'] == []
+    assert result['compared'] > 0
+
+
+def test_verify_detects_corrupt_shard(model, tmp_path):
+    mlt.materialize(model, tmp_path, k=10, shard_size=SHARD_SIZE, log=quiet)
+    neighbors = np.load(tmp_path / 'shard-00001.neighbors.npy')
+    neighbors[0, [0, 1]] = neighbors[0, [1, 0]]
+    np.save(tmp_path / 'shard-00001.neighbors.npy', neighbors)
+    result = mlt.verify(model, tmp_path, sample=len(model.df), log=quiet)
+    assert result['corrupt_shards'] == [1]
+
+
+def test_changed_parameters_require_overwrite(model, tmp_path):
+    mlt.materialize(model, tmp_path, k=10, shard_size=SHARD_SIZE, log=quiet)
+    with pytest.raises(ValueError, match='--overwrite'):
+        mlt.materialize(model, tmp_path, k=20, shard_size=SHARD_SIZE, log=quiet)
+    manifest = mlt.materialize(model, tmp_path, k=20, shard_size=SHARD_SIZE, overwrite=True, log=quiet)
+    assert manifest['k'] == 20 and mlt.load_shard(tmp_path, 0)[0].shape == (SHARD_SIZE, 20)
+
+
+def test_parquet_rank_is_int32(model, tmp_path):
+    pytest.importorskip('pyarrow')
+    mlt.materialize(model, tmp_path, k=10, shard_size=SHARD_SIZE, output_format='parquet', log=quiet)
+    table = pd.read_parquet(tmp_path / 'shard-00000.parquet')
+    assert table['rank'].dtype == np.int32
+    neighbors, _ = mlt.load_shard(tmp_path, 0, 'parquet')
+    np.testing.assert_array_equal(neighbors, model.neighbor_indices[:SHARD_SIZE, :10])
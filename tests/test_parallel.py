@@ -0,0 +1,53 @@
+"""
+Jalur paralel harus identik dengan jalur serial: tabel tetangga workers=2 sama dengan
+ranking.build_neighbor_table dan tokenisasi paralel sama dengan fit_tfidf_fields.
+"""
+from functools import partial
+
+import numpy as np
+import pytest
+
+from features import fit_tfidf_fields
+from ingest import clean_missing_values
+from parallel import build_neighbor_table_parallel, fit_tfidf_parallel
+from ranking import build_neighbor_table
+from recommender import WebtoonRecommender, make_vectorizer
+from synthetic import synthetic_dataset
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    # Kosakata kecil agar banyak skor seri dan urutan tie-break ikut diuji
+    return clean_missing_values(synthetic_dataset(1500, seed=5, n_words=800, words_per_summary=12))
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('k, block_size', [(20, 128), (50, 1000), (5000, 256)])
+def test_neighbor_table_matches_serial(catalog, dtype, k, block_size):
+    _, features = fit_tfidf_fields(catalog, partial(make_vectorizer, dtype=dtype))
+    expected_indices, expected_scores = build_neighbor_table(features, k=k, block_size=block_size)
+    indices, scores = build_neighbor_table_parallel(features, k=k, block_size=block_size, workers=2)
+
+    assert indices.shape == expected_indices.shape and scores.dtype == expected_scores.dtype
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(scores, expected_scores)
+
+
+def test_fit_tfidf_parallel_matches_serial(catalog):
+    expected_tfidf, expected = fit_tfidf_fields(catalog, make_vectorizer)
+    _, tfidf, matrix = fit_tfidf_parallel(catalog.copy(), make_vectorizer, workers=2, n_shards=7)
+
+    np.testing.assert_array_equal(matrix.indptr, expected.indptr)
+    np.testing.assert_array_equal(matrix.indices, expected.indices)
+    np.testing.assert_array_equal(matrix.data, expected.data)
+    assert tfidf.vocabulary_ == expected_tfidf.vocabulary_
+    np.testing.assert_array_equal(tfidf.idf_, expected_tfidf.idf_)
+
+
+def test_model_fit_with_workers_matches_serial():
+    serial = WebtoonRecommender().fit()
+    model = WebtoonRecommender(workers=2, block_size=100).fit()
+
+    np.testing.assert_array_equal(model.neighbor_indices, serial.neighbor_indices)
+    np.testing.assert_array_equal(model.neighbor_scores, serial.neighbor_scores)
+    assert model.get_recommendations('Tower of God').equals(serial.get_recommendations('Tower of God'))
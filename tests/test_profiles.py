@@ -0,0 +1,76 @@
+"""
+Rekomendasi dari riwayat bacaan: skor harus sama dengan cosine terhadap rata-rata berbobot
+vektor judul yang dibaca (dihitung brute force dengan matriks padat).
+"""
+import numpy as np
+import pytest
+
+from recommender import WebtoonRecommender
+
+HISTORIES = {
+    'a': ['Tower of God', 'True Beauty', 'Lore Olympus'],
+    'b': ['unOrdinary', 'tidak ada judul ini'],
+    'c': ['Tidak Ada Sama Sekali'],
+}
+
+
+@pytest.fixture(scope='module')
+def model():
+    return WebtoonRecommender().fit()
+
+
+def brute_force(model, titles, weights=None, k=10, mask=None):
+    positions = np.array([model.titles.get(title, -1) for title in titles])
+    weights = np.ones(len(titles)) if weights is None else np.asarray(weights, dtype=np.float64)
+    found = positions >= 0
+    dense = model.features.toarray()
+    centroid = (weights[found, None] * dense[positions[found]]).sum(axis=0) / found.sum()
+    scores = dense @ (centroid / np.linalg.norm(centroid))
+    scores[positions[found]] = -np.inf
+    if mask is not None:
+        scores[~mask] = -np.inf
+    order = np.argsort(-scores, kind='stable')[:k]
+    return order[np.isfinite(scores[order])], scores[order][np.isfinite(scores[order])]
+
+
+@pytest.mark.parametrize('weights', [None, [5.0, 1.0, 0.5]])
+def test_profile_matches_brute_force_centroid(model, weights):
+    titles = HISTORIES['a']
+    result = model.recommend_for_profile(titles, weights=weights, k=10)
+    _, expected = brute_force(model, titles, weights)
+
+    np.testing.assert_allclose(result['Similarity Score'], expected, rtol=0, atol=1e-12)
+    assert not set(result['Name']) & set(titles)
+
+
+def test_unknown_titles_are_skipped(model):
+    result = model.recommend_for_profile(HISTORIES['b'], k=5)
+    expected = model.recommend_for_profile(['unOrdinary'], k=5)
+    np.testing.assert_array_equal(result['Similarity Score'], expected['Similarity Score'])
+    assert model.recommend_for_profile(HISTORIES['c']) is None
+
+    # Satu judul saja: profil = vektor judul itu, sama dengan rekomendasi berbasis judul
+    by_title = model.get_recommendations('unOrdinary', k=5)
+    np.testing.assert_allclose(expected['Similarity Score'], by_title['Similarity Score'], rtol=0, atol=1e-12)
+
+
+def test_batch_profiles_match_single(model):
+    result = model.recommend_for_profiles(HISTORIES, k=4, genre='Fantasy')
+    assert set(result['User']) == {'a', 'b'}
+    mask = (model.df['Genre'] == 'Fantasy').to_numpy()
+    for user in ('a', 'b'):
+        rows = result[result['User'] == user]
+        single = model.recommend_for_profile(HISTORIES[user], k=4, genre='Fantasy')
+        np.testing.assert_array_equal(rows['Name'], single['Name'])
+        np.testing.assert_array_equal(rows['Rank'], np.arange(1, len(rows) + 1))
+        _, expected = brute_force(model, HISTORIES[user], k=4, mask=mask)
+        np.testing.assert_allclose(rows['Similarity Score'], expected, rtol=0, atol=1e-12)
+
+
+def test_duplicate_titles_add_weight(model):
+    repeated = model.recommend_for_profile(['Tower of God', 'Tower of God', 'True Beauty'], k=5)
+    weighted = model.recommend_for_profile(['Tower of God', 'True Beauty'], weights=[2, 1], k=5)
+    np.testing.assert_allclose(repeated['Similarity Score'], weighted['Similarity Score'], rtol=0, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        model.recommend_for_profile(['Tower of God', 'True Beauty'], weights=[1])
@@ -0,0 +1,145 @@
+"""
+Service HTTP lewat client in-process: dispatch route, response sukses, dan jalur 4xx.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import pytest
+
+from recommender import WebtoonRecommender
+from service import MAX_BODY_BYTES, RecommendationService, handle_connection
+
+
+@pytest.fixture(scope='module')
+def service():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield RecommendationService(WebtoonRecommender().fit(), executor)
+
+
+def call(service, method, target, body=None, headers=None):
+    # Satu request HTTP/1.1 lewat socket lokal ke handle_connection
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body).encode('utf-8')
+    body = body or b''
+    headers = {'Content-Length': str(len(body)), 'Connection': 'close', **(headers or {})}
+    request = f'{method} {target} HTTP/1.1\r\n' + ''.join(f'{name}: {value}\r\n' for name, value in headers.items())
+
+    async def roundtrip():
+        server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer),
+                                            '127.0.0.1', 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(request.encode('latin-1') + b'\r\n' + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    head, _, payload = asyncio.run(roundtrip()).partition(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    if b'application/json' in head:
+        return status, json.loads(payload)
+    return status, payload.decode('utf-8')
+
+
+def test_health(service):
+    status, payload = call(service, 'GET', '/health')
+    assert status == 200
+    assert payload['status'] == 'ok' and payload['items'] == len(service.model.df)
+
+
+def test_recommendations(service):
+    status, payload = call(service, 'GET', '/recommendations?title=tower%20of%20god&k=3')
+    assert status == 200
+    assert len(payload['recommendations']) == 3
+    assert 'Similarity Score' in payload['recommendations'][0]
+
+    status, payload = call(service, 'GET', '/recommendations?title=Tower%20of%20God&k=3&ranking=hybrid'
+                                           '&genre=Fantasy,Action&min_rating=9')
+    assert status == 200
+    assert all(rec['Genre'] in ('Fantasy', 'Action') and rec['Rating'] >= 9 for rec in payload['recommendations'])
+    assert 'Hybrid Score' in payload['recommendations'][0]
+
+
+@pytest.mark.parametrize('query', ['k=0', 'k=abc', 'k=1001', 'ranking=acak', 'min_rating=tinggi',
+                                   'mmr_lambda=2'])
+def test_recommendations_bad_parameters(service, query):
+    status, payload = call(service, 'GET', f'/recommendations?title=Tower%20of%20God&{query}')
+    assert status == 400
+    assert payload['error']
+
+
+def test_recommendations_unknown_title(service):
+    status, payload = call(service, 'GET', '/recommendations')
+    assert status == 400
+
+    status, payload = call(service, 'GET', '/recommendations?title=' + quote('Towr of Gdo'))
+    assert status == 404
+    assert 'Tower of God' in payload['did_you_mean']
+
+
+def test_batch_reports_only_unknown_titles(service):
+    titles = ['Tower of God', 'Tidak Ada Judul Ini', 'True Beauty']
+    status, payload = call(service, 'POST', '/recommendations/batch', {'titles': titles, 'k': 2})
+    assert status == 200
+    assert payload['not_found'] == ['Tidak Ada Judul Ini']
+    assert len(payload['recommendations']) == 4
+
+    # Judul yang ada tetapi seluruh hasilnya tersaring filter tidak dilaporkan 'not_found'
+    status, payload = call(service, 'POST', '/recommendations/batch',
+                           {'titles': titles, 'filters': {'genre': 'Tidak Ada'}})
+    assert status == 200
+    assert payload == {'recommendations': [], 'not_found': ['Tidak Ada Judul Ini']}
+
+
+def test_profile_reports_only_unknown_users(service):
+    histories = {'a': ['Tower of God', 'True Beauty'], 'b': ['Tidak Ada Judul Ini']}
+    status, payload = call(service, 'POST', '/recommendations/profile', {'histories': histories, 'k': 3})
+    assert status == 200
+    assert payload['not_found'] == ['b']
+    assert {rec['User'] for rec in payload['recommendations']} == {'a'}
+
+    status, payload = call(service, 'POST', '/recommendations/profile',
+                           {'histories': histories, 'filters': {'genre': 'Tidak Ada'}})
+    assert status == 200
+    assert payload == {'recommendations': [], 'not_found': ['b']}
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/recommendations/batch', b'bukan json'),
+    ('/recommendations/batch', [1, 2]),
+    ('/recommendations/batch', {'titles': 'Tower of God'}),
+    ('/recommendations/batch', {'titles': ['Tower of God'], 'k': -1}),
+    ('/recommendations/batch', {'titles': ['Tower of God'], 'filters': {'rating': 9}}),
+    ('/recommendations/profile', {'histories': ['Tower of God']}),
+    ('/recommendations/profile', {'histories': {'a': ['Tower of God']}, 'weights': {'b': [1]}}),
+    ('/recommendations/profile', {'histories': {'a': ['Tower of God']}, 'weights': {'a': [1, 2]}}),
+])
+def test_bad_bodies(service, path, body):
+    status, payload = call(service, 'POST', path, body)
+    assert status == 400
+    assert payload['error']
+
+
+def test_dispatch_errors(service):
+    assert call(service, 'GET', '/tidak-ada')[0] == 404
+    assert call(service, 'DELETE', '/health')[0] == 405
+    assert call(service, 'GET', '/recommendations/batch')[0] == 405
+    assert call(service, 'GET', '/metrics')[0] == 404
+    assert call(service, 'GET', '/health', headers={'Content-Length': str(MAX_BODY_BYTES + 1)})[0] == 413
+
+
+def test_similarity_and_titles(service):
+    status, payload = call(service, 'GET', '/similarity?a=Tower%20of%20God&b=tower%20of%20god')
+    assert status == 200 and payload['score'] == pytest.approx(1.0)
+    assert call(service, 'GET', '/similarity?a=Tower%20of%20God')[0] == 400
+    assert call(service, 'GET', '/similarity?a=Tower%20of%20God&b=Tidak%20Ada')[0] == 404
+
+    status, payload = call(service, 'GET', '/titles?q=tower%20of&limit=3')
+    assert status == 200
+    assert 'Tower of God' in payload['completions']
+    assert call(service, 'GET', '/titles?q=tow&limit=0')[0] == 400
+    assert call(service, 'GET', '/titles?q=tow&limit=x')[0] == 400
+    assert call(service, 'GET', '/titles')[0] == 400
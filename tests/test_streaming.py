@@ -0,0 +1,43 @@
+"""
+Fit streaming (chunksize) harus identik dengan fit di memori, dan katalog streaming
+tidak boleh di-fit ulang dari kolom Summary yang tidak disimpan.
+"""
+import numpy as np
+import pytest
+
+from recommender import WebtoonRecommender
+
+NEW_ITEM = {'id': 100001, 'Name': 'Tower of Stars', 'Writer': 'SIU', 'Likes': '1.2M', 'Genre': 'Fantasy',
+            'Rating': 9.5, 'Subscribers': '250K', 'Summary': 'A boy climbs a tower of gods to find the girl.',
+            'Update': 'UP EVERY SUNDAY', 'Reading Link': ''}
+
+
+@pytest.fixture(scope='module')
+def in_memory():
+    return WebtoonRecommender().fit()
+
+
+# 569 baris: chunk terakhir tidak penuh (7, 100) dan satu chunk untuk seluruh katalog (10000)
+@pytest.mark.parametrize('chunksize', [7, 100, 10000])
+def test_streaming_matches_in_memory(in_memory, chunksize):
+    streaming = WebtoonRecommender(chunksize=chunksize).fit()
+
+    np.testing.assert_array_equal(streaming.tfidf.get_feature_names_out(), in_memory.tfidf.get_feature_names_out())
+    np.testing.assert_allclose(streaming.tfidf.idf_, in_memory.tfidf.idf_)
+    assert abs(streaming.tfidf_matrix - in_memory.tfidf_matrix).max() < 1e-12
+    np.testing.assert_array_equal(streaming.neighbor_indices, in_memory.neighbor_indices)
+    assert 'Summary' not in streaming.df
+    assert streaming.df['Likes_Numeric'].equals(in_memory.df['Likes_Numeric'])
+
+
+def test_streaming_never_refits():
+    model = WebtoonRecommender(chunksize=100, refit_threshold=0).fit()
+    n_features = model.tfidf_matrix.shape[1]
+    row = model.tfidf_matrix[model.titles['Tower of God']].copy()
+
+    # Ambang 0 akan memicu fit ulang pada model biasa; model streaming tetap ditambal incremental
+    model.add_items([NEW_ITEM])
+    assert model.tfidf_matrix.shape[1] == n_features
+    assert (model.tfidf_matrix[model.titles['Tower of God']] != row).nnz == 0
+    with pytest.raises(ValueError, match='Summary'):
+        model.refit()
@@ -0,0 +1,92 @@
+"""
+TitleIndex: normalisasi judul, duplikat, lookup id, autocomplete prefix dan saran trigram.
+"""
+import numpy as np
+import pytest
+
+from titles import TitleIndex, normalize_title
+
+TITLES = ['Tower of God', 'True Beauty', 'Lore Olympus', 'Tower of God', 'Towel Boy', 'unOrdinary']
+IDS = [10, 11, 12, 13, 14, 15]
+
+
+@pytest.fixture
+def index():
+    return TitleIndex(TITLES, IDS)
+
+
+def test_normalize_title():
+    assert normalize_title('  Tower   of\tGOD ') == 'tower of god'
+    # NFKC: huruf lebar penuh dan ligatur dilipat ke bentuk biasa
+    assert normalize_title('Ｔｏｗｅｒ') == normalize_title('tower')
+    assert normalize_title('ﬁre') == 'fire'
+
+
+def test_exact_lookup_folds_case_and_whitespace(index):
+    for key in ['Tower of God', 'tower of god', '  TOWER  of god ', 'Tower\nof God']:
+        assert index.get(key) == 0
+        assert key in index
+    assert index['lore olympus'] == 2
+
+
+def test_duplicates_resolve_to_first_position(index):
+    assert index.get('Tower of God') == 0
+    assert index.positions('tower of god') == [0, 3]
+    assert index.positions('True Beauty') == [1]
+    assert index.duplicates() == {'tower of god': [0, 3]}
+    np.testing.assert_array_equal(index.first_positions(), [0, 1, 2, 4, 5])
+
+
+def test_id_lookup_selects_duplicate_explicitly(index):
+    assert index.get(13) == 3
+    assert index.get(np.int64(10)) == 0
+    assert index.get(99) is None
+    np.testing.assert_array_equal(index.get_indexer(['TRUE beauty', 13, 'missing']), [1, 3, -1])
+
+
+def test_add_continues_positions(index):
+    index.add(['Solo Leveling', 'true beauty'], [20, 21])
+    assert index['solo leveling'] == 6
+    assert index.positions('True Beauty') == [1, 7]
+    assert index.complete('so') == ['Solo Leveling']
+
+
+def test_complete_is_alphabetical_and_limited(index):
+    assert index.complete('to') == ['Towel Boy', 'Tower of God']
+    assert index.complete('  TOW') == ['Towel Boy', 'Tower of God']
+    assert index.complete('t', limit=2) == ['Towel Boy', 'Tower of God']
+    assert index.complete('tr') == ['True Beauty']
+    assert index.complete('x') == []
+
+
+def test_suggest_ranks_typos(index):
+    suggestions = index.suggest('Towr of Gd')
+    assert suggestions[0][0] == 'Tower of God'
+    assert [title for title, _ in suggestions].count('Tower of God') == 1
+    scores = [score for _, score in suggestions]
+    assert scores == sorted(scores, reverse=True)
+    assert all(0.3 <= score <= 1 for score in scores)
+
+    best = index.suggest('lore olimpus', limit=1)
+    assert len(best) == 1 and best[0][0] == 'Lore Olympus'
+    assert index.suggest('Tower of God')[0] == ('Tower of God', 1.0)
+
+
+def test_empty_and_unknown_queries(index):
+    assert index.get('') is None
+    assert index.get('Solo Leveling') is None
+    assert index.positions('Solo Leveling') == []
+    with pytest.raises(KeyError):
+        index['Solo Leveling']
+    assert index.suggest('') == []
+    assert index.suggest('zzzzqqqq') == []
+    assert index.suggest('Towr of Gd', min_similarity=0.99) == []
+    assert len(index.complete('')) == len(index.first_positions())
+
+
+def test_empty_index():
+    index = TitleIndex([])
+    assert len(index) == 0
+    assert index.get('Tower of God') is None
+    assert index.complete('t') == []
+    assert index.suggest('Tower of God') == []
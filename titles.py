@@ -0,0 +1,218 @@
+"""
+Index judul webtoon: lookup eksak O(1), lookup berdasarkan id, autocomplete prefix dan
+saran "did you mean" berbasis trigram.
+
+Judul dinormalisasi (Unicode NFKC, huruf kecil, spasi dirapikan) sebelum dicocokkan,
+sehingga 'tower of god' dan 'Tower  of God' menunjuk ke item yang sama. Judul duplikat
+tidak pernah menghasilkan banyak posisi diam-diam: lookup judul selalu mengembalikan
+satu posisi (kemunculan pertama di katalog), seluruh posisinya bisa diambil lewat
+positions(), dan setiap item tetap bisa dipilih secara eksplisit lewat id katalog.
+
+Struktur prefix (array judul terurut + bisect) dan trigram (posting list CSR) baru
+dibangun saat pertama kali dipakai, sehingga model yang hanya melayani lookup eksak
+tidak membayar biaya pembangunannya.
+"""
+import bisect
+import unicodedata
+
+import numpy as np
+
+# Batas jumlah posting trigram yang dibaca per query fuzzy; trigram paling jarang dipakai lebih dulu
+MAX_FUZZY_POSTINGS = 50000
+
+# Jumlah kandidat fuzzy teratas (berdasarkan trigram yang dibaca) yang skornya dihitung eksak
+FUZZY_RESCORE = 64
+
+
+def normalize_title(title):
+    """
+    Normalisasi judul untuk pencocokan: Unicode NFKC, casefold dan spasi tunggal.
+    """
+    return ' '.join(unicodedata.normalize('NFKC', str(title)).casefold().split())
+
+
+def trigrams(text):
+    """
+    Himpunan trigram karakter dari teks yang sudah dinormalisasi, dengan padding spasi
+    seperti pg_trgm agar judul pendek tetap punya trigram.
+    """
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """
+    Index judul dan id katalog ke posisi baris.
+
+    Parameters:
+    titles (array-like): Judul per posisi baris katalog
+    ids (array-like, optional): Id katalog per posisi baris (kolom 'id' dataset)
+    """
+
+    def __init__(self, titles, ids=None):
+        self.titles = []
+        self.normalized = []
+        self._exact = {}
+        self._duplicates = {}
+        self._by_id = {}
+        self.add(titles, ids)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __contains__(self, title):
+        return normalize_title(title) in self._exact
+
+    def add(self, titles, ids=None):
+        """
+        Tambahkan judul baru di akhir katalog (posisi melanjutkan posisi terakhir).
+        """
+        start = len(self.titles)
+        titles = [str(title) for title in titles]
+        normalized = [normalize_title(title) for title in titles]
+        for position, key in enumerate(normalized, start):
+            first = self._exact.setdefault(key, position)
+            if first != position:
+                self._duplicates.setdefault(key, [first]).append(position)
+        if ids is not None:
+            for position, item_id in enumerate(ids, start):
+                if item_id is not None and item_id == item_id:
+                    self._by_id.setdefault(int(item_id), position)
+        self.titles.extend(titles)
+        self.normalized.extend(normalized)
+
+        # Struktur prefix dan trigram dibangun ulang saat dipakai berikutnya
+        self._sorted = None
+        self._postings = None
+
+    def get(self, key, default=None):
+        """
+        Posisi baris untuk sebuah judul (str) atau id katalog (int).
+
+        Returns:
+        int: Posisi baris; untuk judul duplikat, kemunculan pertama di katalog
+        """
+        if isinstance(key, (int, np.integer)) and not isinstance(key, bool):
+            return self._by_id.get(int(key), default)
+        return self._exact.get(normalize_title(key), default)
+
+    def __getitem__(self, key):
+        position = self.get(key)
+        if position is None:
+            raise KeyError(key)
+        return position
+
+    def positions(self, title):
+        """
+        Semua posisi baris untuk sebuah judul, termasuk duplikat.
+
+        Returns:
+        list: Posisi baris terurut; kosong jika judul tidak ditemukan
+        """
+        key = normalize_title(title)
+        if key in self._duplicates:
+            return list(self._duplicates[key])
+        return [self._exact[key]] if key in self._exact else []
+
+    def duplicates(self):
+        """
+        Returns:
+        dict: Judul ternormalisasi -> daftar posisi, hanya untuk judul yang muncul lebih dari sekali
+        """
+        return {key: list(positions) for key, positions in self._duplicates.items()}
+
+    def get_indexer(self, keys):
+        """
+        Resolusi banyak judul/id sekaligus.
+
+        Returns:
+        numpy.ndarray: Posisi baris per kunci, -1 untuk kunci yang tidak ditemukan
+        """
+        return np.array([self.get(key, -1) for key in keys], dtype=np.int64)
+
+    def first_positions(self):
+        """
+        Posisi kemunculan pertama setiap judul unik, terurut berdasarkan posisi.
+        """
+        return np.array(sorted(self._exact.values()), dtype=np.int64)
+
+    def complete(self, prefix, limit=10):
+        """
+        Autocomplete: judul yang diawali prefix (setelah normalisasi), urut alfabet.
+
+        Parameters:
+        prefix (str): Awal judul yang diketik pengguna
+        limit (int): Jumlah judul maksimum
+
+        Returns:
+        list: Judul asli
+        """
+        keys, positions = self._ensure_sorted()
+        prefix = normalize_title(prefix)
+        start = bisect.bisect_left(keys, prefix)
+        results = []
+        for key, position in zip(keys[start:start + limit], positions[start:start + limit]):
+            if not key.startswith(prefix):
+                break
+            results.append(self.titles[position])
+        return results
+
+    def suggest(self, query, limit=5, min_similarity=0.3):
+        """
+        Saran "did you mean": judul dengan kemiripan trigram (koefisien Dice) tertinggi.
+
+        Parameters:
+        query (str): Judul yang dicari, boleh salah ketik
+        limit (int): Jumlah saran maksimum
+        min_similarity (float): Kemiripan minimum (0-1)
+
+        Returns:
+        list: Pasangan (judul asli, kemiripan), terurut dari yang paling mirip
+        """
+        gram_ids, offsets, postings, gram_counts = self._ensure_postings()
+        query_grams = trigrams(normalize_title(query))
+        known = np.array([gram_ids[gram] for gram in query_grams if gram in gram_ids], dtype=np.int64)
+        if len(known) == 0:
+            return []
+
+        # Posting list terpendek dibaca lebih dulu sampai batas MAX_FUZZY_POSTINGS
+        lengths = offsets[known + 1] - offsets[known]
+        order = np.argsort(lengths, kind='stable')
+        budget = np.cumsum(lengths[order]) <= MAX_FUZZY_POSTINGS
+        budget[0] = True
+        chosen = known[order[budget]]
+        candidates, shared = np.unique(
+            np.concatenate([postings[offsets[gram]:offsets[gram + 1]] for gram in chosen]), return_counts=True)
+
+        # Trigram umum yang dilewati membuat hitungan di atas hanya batas bawah, sehingga
+        # kandidat teratas dihitung ulang dengan koefisien Dice eksak
+        top = candidates[np.lexsort((candidates, -shared))[:max(FUZZY_RESCORE, limit)]]
+        scored = []
+        for position in top.tolist():
+            common = len(query_grams & trigrams(self.normalized[position]))
+            similarity = 2.0 * common / (len(query_grams) + gram_counts[position])
+            if similarity >= min_similarity:
+                scored.append((-similarity, position))
+        return [(self.titles[position], float(-score)) for score, position in sorted(scored)[:limit]]
+
+    def _ensure_sorted(self):
+        if self._sorted is None:
+            positions = sorted(self._exact.values(), key=lambda position: self.normalized[position])
+            self._sorted = ([self.normalized[position] for position in positions], positions)
+        return self._sorted
+
+    def _ensure_postings(self):
+        if self._postings is None:
+            # Posting list per trigram dalam format CSR: posisi judul unik yang memuat trigram
+            gram_ids = {}
+            grams, positions, gram_counts = [], [], np.zeros(len(self.titles), dtype=np.int64)
+            for position in sorted(self._exact.values()):
+                title_grams = trigrams(self.normalized[position])
+                gram_counts[position] = len(title_grams)
+                grams.extend(gram_ids.setdefault(gram, len(gram_ids)) for gram in title_grams)
+                positions.extend([position] * len(title_grams))
+            grams = np.array(grams, dtype=np.int64)
+            order = np.argsort(grams, kind='stable')
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(grams, minlength=len(gram_ids)))])
+            self._postings = (gram_ids, offsets, np.array(positions, dtype=np.int64)[order], gram_counts)
+        return self._postings